@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Benchmark Article construction time and memory
+
+Decodes a synthetic stream/contents payload and builds Article objects
+with the previous eager dataclass and with the current slotted model, then
+reports construction time and the memory the articles keep alive once the
+decoded page has been dropped.
+
+Usage: python benchmarks/bench_articles.py [articles]
+"""
+
+import gc
+import json
+import random
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import List, Optional, Dict, Any
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from inoreader_intelligence.api.models import Article
+
+FEEDS = [(f"feed/https://news{n}.example.com/rss", f"Example News {n}") for n in range(40)]
+
+
+@dataclass
+class EagerArticle:
+    """The Article model before it became slotted and lazy"""
+
+    id: str
+    title: str
+    summary: str
+    content: str
+    url: str
+    author: Optional[str]
+    published: datetime
+    updated: datetime
+    feed_id: str
+    feed_title: str
+    categories: List[str]
+    tags: List[str]
+    read: bool = False
+    starred: bool = False
+    timestamp_usec: int = 0
+    crawl_time_msec: int = 0
+
+    @classmethod
+    def from_api_response(cls, data: Dict[str, Any]) -> "EagerArticle":
+        return cls(
+            id=data["id"],
+            title=data.get("title", ""),
+            summary=data.get("summary", {}).get("content", ""),
+            content=data.get("content", {}).get("content", ""),
+            url=data.get("alternate", [{}])[0].get("href", ""),
+            author=data.get("author", ""),
+            published=datetime.fromtimestamp(data.get("published", 0)),
+            updated=datetime.fromtimestamp(data.get("updated", 0)),
+            feed_id=data.get("origin", {}).get("streamId", ""),
+            feed_title=data.get("origin", {}).get("title", ""),
+            categories=data.get("categories", []),
+            tags=[tag.get("label", "") for tag in data.get("tags", [])],
+            read="read" in data.get("categories", []),
+            starred="starred" in data.get("categories", []),
+            timestamp_usec=int(data.get("timestampUsec") or data.get("published", 0) * 1000000),
+            crawl_time_msec=int(data.get("crawlTimeMsec") or 0)
+        )
+
+
+def build_payload(count, seed=11):
+    rng = random.Random(seed)
+    items = []
+    for n in range(count):
+        feed_id, feed_title = rng.choice(FEEDS)
+        published = 1700000000 + n * 30
+        items.append({
+            "crawlTimeMsec": str(published * 1000),
+            "timestampUsec": str(published * 1000000),
+            "id": f"tag:google.com,2005:reader/item/{n:016x}",
+            "categories": ["user/-/state/com.google/reading-list", "user/-/label/Focus"],
+            "title": f"Regional security update {n}",
+            "published": published,
+            "updated": published + 60,
+            "canonical": [{"href": f"https://news.example.com/{n}"}],
+            "alternate": [{"href": f"https://news.example.com/{n}", "type": "text/html"}],
+            "summary": {"direction": "ltr", "content": "<p>" + "analysis " * 60 + "</p>"},
+            "author": f"Correspondent {n % 25}",
+            "tags": [{"id": "user/-/label/Focus", "label": "Focus"}],
+            "origin": {"streamId": feed_id, "title": feed_title, "htmlUrl": feed_id[5:]},
+        })
+    return json.dumps({"items": items}).encode()
+
+
+def measure(name, factory, payload):
+    # Time without tracemalloc, which slows allocation down several times
+    items = json.loads(payload)["items"]
+    gc.collect()
+    started = time.perf_counter()
+    articles = [factory(item) for item in items]
+    elapsed = time.perf_counter() - started
+    del items, articles
+
+    gc.collect()
+    tracemalloc.start()
+    items = json.loads(payload)["items"]
+    articles = [factory(item) for item in items]
+    del items
+    gc.collect()
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    count = len(articles)
+    print(f"{name:<24} {elapsed * 1000:>9.1f} ms {elapsed / count * 1e6:>8.2f} µs "
+          f"{retained / 1024 / 1024:>9.1f} MB {retained / count:>8.0f} B")
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    payload = build_payload(count)
+
+    print(f"🏁 Article model benchmark: {count} articles, {len(payload) / 1024 / 1024:.1f} MB payload")
+    print(f"{'Model':<24} {'Build':>12} {'Per item':>11} {'Retained':>12} {'Per item':>10}")
+
+    # Warm up imports and caches so neither run pays for them
+    measure("warm-up", Article.from_api_response, build_payload(100))
+    print("-" * 72)
+    measure("eager dataclass", EagerArticle.from_api_response, payload)
+    measure("slotted, lazy", Article.from_api_response, payload)
+
+
+if __name__ == "__main__":
+    main()
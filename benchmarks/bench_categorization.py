@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Benchmark article categorization against a local fake OpenAI endpoint
+
+Serves chat completions from a local server that sleeps for a fixed latency
+per request, then categorizes the same articles sequentially, with
+increasing OPENAI_MAX_CONCURRENCY and with batched JSON prompts. The fake
+server bills roughly one prompt token per four characters.
+
+Usage: python benchmarks/bench_categorization.py [articles] [latency_ms]
+"""
+
+import json
+import sys
+import threading
+import time
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from inoreader_intelligence.api import Article
+from inoreader_intelligence.config import Config
+from inoreader_intelligence.metrics import run_metrics
+from inoreader_intelligence.summarizer import SummarizationEngine
+
+THEMES = ["Geopolitical Tensions", "Cybersecurity Warfare", "Emerging Tech", "IRRELEVANT"]
+
+
+class FakeOpenAIHandler(BaseHTTPRequestHandler):
+    """Answer every chat completion after a fixed delay"""
+
+    protocol_version = "HTTP/1.1"
+    latency = 0.2
+
+    def do_POST(self):
+        length = int(self.headers["Content-Length"])
+        system, prompt = [m["content"] for m in json.loads(self.rfile.read(length))["messages"]]
+        time.sleep(self.latency)
+        if "JSON array" in system:
+            lines = prompt.splitlines()
+            content = json.dumps([{"id": n, "theme": THEMES[len(line[line.index("]") + 2:]) % 4]}
+                                  for n, line in enumerate(lines, 1)])
+        else:
+            content = THEMES[len(prompt) % 4]
+        prompt_tokens = (len(system) + len(prompt)) // 4
+        completion_tokens = len(content) // 4
+        body = json.dumps({
+            "id": "chatcmpl-bench", "object": "chat.completion", "created": 0, "model": "gpt-4",
+            "choices": [{"index": 0, "message": {"role": "assistant", "content": content},
+                         "finish_reason": "stop"}],
+            "usage": {"prompt_tokens": prompt_tokens, "completion_tokens": completion_tokens,
+                      "total_tokens": prompt_tokens + completion_tokens}
+        }).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def run(base_url, articles, concurrency, batch_size=1):
+    config = Config(inoreader_app_id="id", inoreader_app_key="key", email_recipients=[],
+                    openai_api_key="sk-bench", openai_base_url=base_url,
+                    openai_max_concurrency=concurrency, categorize_batch_size=batch_size,
+                    enrichment_store=False)
+    engine = SummarizationEngine(config)
+    run_metrics.reset()
+    started = time.perf_counter()
+    categories = engine.categorize_articles(articles)
+    elapsed = time.perf_counter() - started
+    categorized = sum(len(group) for group in categories.values())
+    requests = run_metrics.get("openai.requests")
+    prompt_tokens = run_metrics.get("openai.prompt_tokens") / len(articles)
+    print(f"{concurrency:>11} {batch_size:>6} {elapsed:>9.2f} s {len(articles) / elapsed:>10.1f} art/s "
+          f"{requests:>9} {prompt_tokens:>14.0f} {categorized:>12}")
+    return elapsed
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    FakeOpenAIHandler.latency = (int(sys.argv[2]) if len(sys.argv) > 2 else 200) / 1000
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FakeOpenAIHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_port}/v1"
+
+    summary = "Analysis of regional developments, alliances and force posture. " * 4
+    articles = [Article.from_api_response({"id": f"item-{n}", "title": f"Article {n} " + "x" * (n % 7),
+                                           "summary": {"content": summary}})
+                for n in range(count)]
+
+    print(f"🏁 Categorization benchmark: {count} articles, "
+          f"{FakeOpenAIHandler.latency * 1000:.0f} ms per completion")
+    print(f"{'Concurrency':>11} {'Batch':>6} {'Elapsed':>11} {'Throughput':>16} {'Requests':>9} "
+          f"{'Prompt tok/art':>14} {'Categorized':>12}")
+    print("-" * 85)
+
+    try:
+        baseline = run(base_url, articles, 1)
+        for concurrency in (4, 8, 16):
+            elapsed = run(base_url, articles, concurrency)
+        print(f"📈 Speedup at concurrency 16: {baseline / elapsed:.1f}x")
+        for batch_size in (10, 20):
+            run(base_url, articles, 1, batch_size)
+            run(base_url, articles, 8, batch_size)
+    finally:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
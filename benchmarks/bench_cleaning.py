@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Benchmark article HTML cleaning
+
+Builds a synthetic corpus of feed articles (paragraph text wrapped in the
+navigation, share widgets, cookie notices, related-story lists and scripts
+real pages carry, plus the odd multi-megabyte page) and compares:
+  - BeautifulSoup html.parser run serially over content and summary
+    (how InoreaderClient.clean_article_content used to work)
+  - ContentCleaner in the main process, with and without boilerplate removal
+  - ContentCleaner across a process pool
+
+Throughput is in articles per second. Text size per article, and the
+rough token count it implies, show how much page chrome reaches the LLM.
+
+Usage: python benchmarks/bench_cleaning.py [articles] [workers]
+"""
+
+import os
+import random
+import sys
+import time
+from pathlib import Path
+
+from bs4 import BeautifulSoup
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from inoreader_intelligence.api.models import Article
+from inoreader_intelligence.cleaner import ContentCleaner
+from inoreader_intelligence.cleaner.cleaner import CHARS_PER_TOKEN
+from inoreader_intelligence.config import Config
+
+WORDS = ("strategic regional security maritime alliance sanctions cyber deterrence drone "
+         "semiconductor treaty escalation ministry exercise naval frontier satellite the of and "
+         "a to in officials said on Tuesday according report analysts").split()
+
+CHROME = """
+<nav class="site-nav"><ul>{links}</ul></nav>
+<div class="share-tools"><a href="#">Share on X</a> <a href="#">Facebook</a> <a href="#">Email</a></div>
+<div id="cookie-consent">We use cookies to improve your experience. By continuing you agree to our cookie policy.</div>
+<script>window.dataLayer = window.dataLayer || []; dataLayer.push({{"event": "pageview"}});</script>
+<style>.share-tools {{ display: flex; }}</style>
+"""
+
+TRAILER = """
+<div class="newsletter-signup">Get the daily security briefing in your inbox. Sign up now, it's free.</div>
+<section><h3>More from Example News</h3><ul>{related}</ul></section>
+<footer>© Example News. All rights reserved. Terms of use. Privacy policy. Contact us.</footer>
+"""
+
+
+def _paragraph(rng):
+    words = " ".join(rng.choice(WORDS) for _ in range(rng.randint(40, 120)))
+    return f"<p>{words} <a href='https://example.com/{rng.randint(0, 9999)}'>source</a>.</p>"
+
+
+def build_corpus(count, seed=7):
+    rng = random.Random(seed)
+    links = "".join(f"<li><a href='/section/{i}'>Section {i}</a></li>" for i in range(12))
+    related = "".join(f"<li><a href='/story/{i}'>{' '.join(rng.choice(WORDS) for _ in range(8))}</a></li>"
+                      for i in range(8))
+    articles = []
+
+    for i in range(count):
+        paragraphs = rng.randint(6, 20)
+        # Roughly one page in 500 is a huge live blog or archive page
+        if rng.random() < 0.002:
+            paragraphs = 8000
+        body = "".join(_paragraph(rng) for _ in range(paragraphs))
+        content = (f"<article>{CHROME.format(links=links)}<h1>Article {i}</h1>{body}"
+                   f"{TRAILER.format(related=related)}</article>")
+        summary = f"<p>{' '.join(rng.choice(WORDS) for _ in range(40))}&hellip;</p>"
+        articles.append((content, summary))
+
+    return articles
+
+
+def _articles(corpus):
+    return [Article.from_api_response({"id": str(i), "content": {"content": content},
+                                       "summary": {"content": summary}})
+            for i, (content, summary) in enumerate(corpus)]
+
+
+def bs4_clean(articles):
+    for article in articles:
+        if article.content:
+            article.content = BeautifulSoup(article.content, "html.parser").get_text().strip()
+        if article.summary:
+            article.summary = BeautifulSoup(article.summary, "html.parser").get_text().strip()
+
+
+def run_scenario(name, clean, corpus):
+    articles = _articles(corpus)
+    started = time.perf_counter()
+    clean(articles)
+    elapsed = time.perf_counter() - started
+    text_chars = sum(len(a.content) + len(a.summary) for a in articles) / len(articles)
+    print(f"{name:<34} {elapsed:>8.2f} s {len(articles) / elapsed:>10.0f} art/s {text_chars:>10.0f} "
+          f"{text_chars / CHARS_PER_TOKEN:>10.0f}")
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    workers = int(sys.argv[2]) if len(sys.argv) > 2 else (os.cpu_count() or 1)
+
+    corpus = build_corpus(count)
+    html_mb = sum(len(content) + len(summary) for content, summary in corpus) / 1024 / 1024
+
+    print(f"🏁 Cleaning benchmark: {count} articles, {html_mb:.1f} MB of HTML, {workers} worker(s)")
+    print(f"{'Scenario':<34} {'Time':>10} {'Throughput':>16} {'Chars/art':>10} {'~Tokens':>10}")
+
+    base = Config(inoreader_app_id="", inoreader_app_key="", email_recipients=[])
+    no_strip = ContentCleaner(Config(**{**base.__dict__, "cleaning_workers": 1, "strip_boilerplate": False}))
+    serial = ContentCleaner(Config(**{**base.__dict__, "cleaning_workers": 1}))
+    parallel = ContentCleaner(Config(**{**base.__dict__, "cleaning_workers": workers}))
+
+    run_scenario("BeautifulSoup html.parser", bs4_clean, corpus)
+    run_scenario("ContentCleaner (no boilerplate)", no_strip.clean_articles, corpus)
+    run_scenario("ContentCleaner (1 process)", serial.clean_articles, corpus)
+    run_scenario(f"ContentCleaner ({workers} processes)", parallel.clean_articles, corpus)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Benchmark offline keyword categorization throughput
+
+Categorizes synthetic title + summary texts with the previous first-match
+substring loop and with the token-level Aho-Corasick matcher, and reports
+articles per second and how many articles without any planted keyword were
+categorized anyway (substring hits such as "un" in "under"). Both are then
+rerun with ten times as many keywords to show how each scales.
+
+Usage: python benchmarks/bench_keywords.py [articles]
+"""
+
+import random
+import sys
+import time
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from inoreader_intelligence.summarizer.keywords import THEME_MATCHER, THEME_KEYWORDS, KeywordMatcher
+
+# The keyword table used before the matcher
+LEGACY_KEYWORDS = {
+    "Geopolitical Tensions": ["china", "russia", "taiwan", "ukraine", "iran", "diplomacy", "sanctions", "trade war", "nuclear", "middle east", "africa", "asean", "indo-pacific"],
+    "Cybersecurity Warfare": ["cyber", "hack", "breach", "malware", "ransomware", "apt", "espionage", "disinformation", "deepfake", "infrastructure attack", "zero-day"],
+    "Emerging Tech": ["ai", "artificial intelligence", "quantum", "autonomous", "drone", "space", "satellite", "semiconductor", "chip", "biotech", "crispr", "5g"],
+    "National Security": ["terrorism", "extremism", "pandemic", "biosecurity", "food security", "energy security", "homeland", "radicalization", "social cohesion"],
+    "Military Modernization": ["military", "defense", "weapons", "hypersonic", "fighter", "naval", "alliance", "nato", "exercise", "doctrine", "hybrid warfare"],
+    "Rules-Based Order": ["un", "united nations", "sanctions", "peacekeeping", "unclos", "maritime law", "sovereignty", "international law", "humanitarian"],
+    "Strategic Foresight": ["climate", "demographic", "aging", "urbanization", "migration", "arctic", "resource", "megacities", "non-state", "wagner", "pmc"]
+}
+
+FILLER = ("officials said the country would continue under pressure again after talks this week "
+          "with ministers who remain uncertain about plans and funding rules amid rising costs").split()
+KEYWORDS = ["ransomware", "hypersonic", "sanctions", "drones", "united nations", "climate", "nato",
+            "terrorism", "quantum", "taiwan", "zero-day", "migration", "satellite", "ai"]
+
+
+def legacy_categorizer(keyword_map):
+    def categorize(text):
+        content = text.lower()
+        for category, keywords in keyword_map.items():
+            if any(keyword in content for keyword in keywords):
+                return category
+        return None
+    return categorize
+
+
+def build_texts(count, seed=5):
+    """Synthetic articles and how many keywords were planted in each"""
+    rng = random.Random(seed)
+    texts, planted = [], []
+    for _ in range(count):
+        words = rng.sample(FILLER, 20)
+        keywords = rng.sample(KEYWORDS, rng.randint(0, 2))
+        for keyword in keywords:
+            words.insert(rng.randrange(len(words)), keyword)
+        title = " ".join(words[:8]).capitalize()
+        texts.append(title + " " + " ".join(words[8:]) + ".")
+        planted.append(len(keywords))
+    return texts, planted
+
+
+def widen(keyword_map, factor):
+    """Pad every theme with made-up keywords that never occur in the texts"""
+    return {theme: list(keywords) + [f"{keyword}x{n}" for keyword in keywords for n in range(factor - 1)]
+            for theme, keywords in keyword_map.items()}
+
+
+def measure(name, categorize, texts, planted):
+    started = time.perf_counter()
+    results = [categorize(text) for text in texts]
+    elapsed = time.perf_counter() - started
+    categorized = sum(result is not None for result in results)
+    spurious = sum(1 for result, count in zip(results, planted) if result and not count)
+    print(f"{name:<32} {elapsed * 1000:>9.1f} ms {len(texts) / elapsed:>12,.0f} art/s "
+          f"{categorized:>12,} {spurious:>10,}")
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    texts, planted = build_texts(count)
+
+    print(f"🏁 Keyword categorization benchmark: {count:,} articles, "
+          f"{sum(len(text) for text in texts) / count:.0f} chars each, "
+          f"{sum(1 for n in planted if not n):,} without keywords")
+    print(f"{'Matcher':<32} {'Elapsed':>12} {'Throughput':>18} {'Categorized':>12} {'Spurious':>10}")
+    print("-" * 89)
+
+    measure("substring first-match", legacy_categorizer(LEGACY_KEYWORDS), texts, planted)
+    measure("aho-corasick best-score", THEME_MATCHER.best_label, texts, planted)
+
+    wide = {theme: {keyword: 1.0 for keyword in keywords}
+            for theme, keywords in widen(THEME_KEYWORDS, 10).items()}
+    measure("substring first-match, 10x kw", legacy_categorizer(widen(LEGACY_KEYWORDS, 10)), texts, planted)
+    measure("aho-corasick, 10x kw", KeywordMatcher.from_themes(wide).best_label, texts, planted)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Benchmark JSON decoding and encoding of stream payloads
+
+Compares the previous path (requests' response.json(), which decodes the
+body to str before parsing) with the serialization module's bytes-in,
+bytes-out loads/dumps, which use orjson when it is installed.
+
+Usage: python benchmarks/bench_serialization.py [articles] [rounds]
+"""
+
+import json
+import sys
+import time
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from inoreader_intelligence import serialization
+
+sys.path.insert(0, str(Path(__file__).parent))
+from bench_articles import build_payload
+
+
+def timed(name, func, rounds, size):
+    func()
+    started = time.perf_counter()
+    for _ in range(rounds):
+        func()
+    elapsed = (time.perf_counter() - started) / rounds
+    print(f"{name:<32} {elapsed * 1000:>9.2f} ms {size / elapsed / 1024 / 1024:>9.1f} MB/s")
+    return elapsed
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    rounds = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    payload = build_payload(count)
+    data = json.loads(payload)
+
+    backend = "orjson" if serialization.ORJSON_AVAILABLE else "stdlib json"
+    print(f"🏁 Serialization benchmark: {count} items, {len(payload) / 1024:.0f} KB payload, {backend}")
+    print(f"{'Operation':<32} {'Per round':>12} {'Throughput':>12}")
+    print("-" * 58)
+
+    baseline = timed("json.loads(body.decode())", lambda: json.loads(payload.decode("utf-8")),
+                     rounds, len(payload))
+    current = timed("serialization.loads(body)", lambda: serialization.loads(payload),
+                    rounds, len(payload))
+    print(f"📈 Decode speedup: {baseline / current:.1f}x")
+
+    baseline = timed("json.dumps(obj).encode()", lambda: json.dumps(data).encode("utf-8"),
+                     rounds, len(payload))
+    current = timed("serialization.dumps(obj)", lambda: serialization.dumps(data),
+                    rounds, len(payload))
+    print(f"📈 Encode speedup: {baseline / current:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
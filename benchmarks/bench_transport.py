@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Benchmark the shared HTTP transport against the previous request setup
+
+Serves a stream/contents-sized JSON payload from a local keep-alive server
+and compares:
+  - bare requests.get per call (how InoreaderOAuth used to talk to Inoreader)
+  - a plain requests.Session() (how InoreaderClient used to talk to Inoreader)
+  - the shared pooled transport from inoreader_intelligence.transport
+
+Reports bytes on the wire, connections opened and p50/p99 latency.
+
+Usage: python benchmarks/bench_transport.py [requests_per_scenario]
+"""
+
+import gzip
+import json
+import random
+import socket
+import statistics
+import sys
+import threading
+import time
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from pathlib import Path
+
+import requests
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from inoreader_intelligence.config import Config
+from inoreader_intelligence.transport import create_session, BROTLI_AVAILABLE
+
+if BROTLI_AVAILABLE:
+    import brotli
+
+WORDS = ("strategic regional security maritime alliance sanctions cyber deterrence drone "
+         "semiconductor treaty escalation ministry exercise naval frontier satellite").split()
+rng = random.Random(42)
+
+PAYLOAD = json.dumps({
+    "items": [
+        {"id": f"tag:google.com,2005:reader/item/{i:016x}", "title": f"Article {i}",
+         "content": {"content": "<p>" + " ".join(rng.choice(WORDS) for _ in range(400)) + "</p>"}}
+        for i in range(100)
+    ]
+}).encode()
+
+stats = {"bytes": 0, "connections": 0}
+stats_lock = threading.Lock()
+
+
+class PayloadHandler(BaseHTTPRequestHandler):
+    """Keep-alive server that compresses according to Accept-Encoding"""
+
+    protocol_version = "HTTP/1.1"
+
+    def setup(self):
+        super().setup()
+        # http.server writes headers and body separately; avoid Nagle/delayed-ACK stalls
+        self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        with stats_lock:
+            stats["connections"] += 1
+
+    def do_GET(self):
+        accepted = self.headers.get("Accept-Encoding", "")
+        if BROTLI_AVAILABLE and "br" in accepted:
+            body, encoding = brotli.compress(PAYLOAD, quality=4), "br"
+        elif "gzip" in accepted:
+            body, encoding = gzip.compress(PAYLOAD, compresslevel=6), "gzip"
+        else:
+            body, encoding = PAYLOAD, None
+
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        if encoding:
+            self.send_header("Content-Encoding", encoding)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+        with stats_lock:
+            stats["bytes"] += len(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def run_scenario(name, fetch, url, count):
+    stats["bytes"] = 0
+    stats["connections"] = 0
+    latencies = []
+
+    for _ in range(count):
+        started = time.perf_counter()
+        response = fetch(url)
+        response.json()
+        latencies.append((time.perf_counter() - started) * 1000)
+
+    quantiles = statistics.quantiles(latencies, n=100)
+    print(f"{name:<28} {stats['bytes'] / count / 1024:>9.1f} KB {stats['connections']:>6} "
+          f"{quantiles[49]:>9.2f} ms {quantiles[98]:>9.2f} ms")
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), PayloadHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_port}/reader/api/0/stream/contents/feed"
+
+    config = Config(inoreader_app_id="", inoreader_app_key="", email_recipients=[])
+    plain_session = requests.Session()
+    shared_session = create_session(config)
+
+    print(f"🏁 Transport benchmark: {count} requests per scenario, "
+          f"{len(PAYLOAD) / 1024:.0f} KB uncompressed payload")
+    print(f"{'Scenario':<28} {'Bytes/req':>12} {'Conns':>6} {'p50':>12} {'p99':>12}")
+
+    run_scenario("requests.get per call", requests.get, url, count)
+    run_scenario("requests.Session()", plain_session.get, url, count)
+    run_scenario("shared transport", shared_session.get, url, count)
+
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
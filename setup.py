@@ -51,6 +51,12 @@ setup(
             "flake8>=6.0.0",
             "mypy>=1.0.0",
         ],
+        "classifier": [
+            "numpy>=1.21.0",
+        ],
+        "tokens": [
+            "tiktoken>=0.5.0",
+        ],
     },
     entry_points={
         "console_scripts": [
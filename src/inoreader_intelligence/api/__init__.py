@@ -1,6 +1,7 @@
 """API client for Inoreader"""
 
 from .client import InoreaderClient
+from .async_client import AsyncInoreaderClient
 from .models import Article, Feed, Tag
 
-__all__ = ["InoreaderClient", "Article", "Feed", "Tag"]
\ No newline at end of file
+__all__ = ["InoreaderClient", "AsyncInoreaderClient", "Article", "Feed", "Tag"]
\ No newline at end of file
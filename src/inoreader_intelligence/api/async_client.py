@@ -0,0 +1,212 @@
+"""Asynchronous Inoreader API client"""
+
+import asyncio
+from typing import List, Optional, Dict, Any, Tuple
+from datetime import datetime
+
+import aiohttp
+
+from ..auth import InoreaderOAuth
+from ..config import Config
+from ..metrics import run_metrics
+from ..serialization import loads
+from ..transport import USER_AGENT, accept_encoding
+from .models import Article, Tag, assign_inoreader_urls, READ_STATE
+from .quota import QuotaGovernor, RequestPriority
+from .retry import RetryPolicy, CircuitBreaker, RETRYABLE_STATUS_CODES, parse_retry_after
+
+
+class AsyncInoreaderClient:
+    """asyncio/aiohttp client for fetching many Inoreader streams at once"""
+
+    BASE_URL = "https://www.inoreader.com/reader/api/0"
+
+    def __init__(self, config: Config, oauth: Optional[InoreaderOAuth] = None,
+                 max_concurrency: Optional[int] = None,
+                 quota: Optional[QuotaGovernor] = None,
+                 retry_policy: Optional[RetryPolicy] = None,
+                 circuit_breaker: Optional[CircuitBreaker] = None):
+        self.config = config
+        self.oauth = oauth or InoreaderOAuth(config)
+        self.quota = quota
+        self.retry_policy = retry_policy or RetryPolicy(
+            max_retries=config.api_max_retries,
+            backoff_base=config.api_backoff_base,
+            backoff_max=config.api_backoff_max
+        )
+        self.circuit_breaker = circuit_breaker or CircuitBreaker(
+            failure_threshold=config.circuit_breaker_threshold,
+            reset_timeout=config.circuit_breaker_reset
+        )
+        self.max_concurrency = max_concurrency or config.max_concurrent_requests
+        self.session: Optional[aiohttp.ClientSession] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._refresh_lock: Optional[asyncio.Lock] = None
+
+    async def __aenter__(self) -> "AsyncInoreaderClient":
+        self.session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=self.config.http_pool_maxsize, ttl_dns_cache=300),
+            headers={"User-Agent": USER_AGENT, "Accept-Encoding": accept_encoding()}
+        )
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        self._refresh_lock = asyncio.Lock()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Close the underlying HTTP session"""
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+
+    async def _refresh_token(self, stale_token: Optional[str]) -> None:
+        """Refresh the access token once, even if several requests hit a 401 together"""
+        async with self._refresh_lock:
+            if self.oauth.access_token != stale_token:
+                # Another request already refreshed the token
+                return
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, self.oauth.refresh_access_token)
+
+    async def _make_request(self, endpoint: str, params: Optional[Dict[str, Any]] = None,
+                            priority: str = RequestPriority.CONTENT) -> Dict[str, Any]:
+        """Make authenticated request to Inoreader API"""
+        if not self.oauth.is_authenticated():
+            raise ValueError("Not authenticated")
+        if self.session is None:
+            raise RuntimeError("AsyncInoreaderClient must be used as an async context manager")
+
+        url = f"{self.BASE_URL}/{endpoint}"
+
+        async with self._semaphore:
+            token = self.oauth.access_token
+            status, data = await self._get_with_retries(url, params, priority)
+            if status == 401:
+                # Try to refresh token
+                await self._refresh_token(token)
+                status, data = await self._get_with_retries(url, params, priority)
+                if status == 401:
+                    raise ValueError(f"Unauthorized request to {endpoint} after token refresh")
+            return data
+
+    async def _get_with_retries(self, url: str, params: Optional[Dict[str, Any]],
+                                priority: str) -> Tuple[int, Optional[Dict[str, Any]]]:
+        """GET with backoff on connection errors, 429 and 5xx, within the request deadline"""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.config.api_request_deadline
+        attempt = 0
+
+        while True:
+            self.circuit_breaker.before_request()
+            if self.quota:
+                self.quota.acquire(1, priority)
+
+            retry_after = None
+            try:
+                timeout = aiohttp.ClientTimeout(
+                    total=max(deadline - loop.time(), 1.0),
+                    sock_connect=self.config.http_connect_timeout,
+                    sock_read=self.config.http_read_timeout
+                )
+                async with self.session.get(url, headers=self.oauth.get_auth_headers(), params=params,
+                                            timeout=timeout) as response:
+                    if self.quota:
+                        self.quota.record(1, response.headers)
+                    if response.status not in RETRYABLE_STATUS_CODES:
+                        self.circuit_breaker.record_success()
+                        if response.status == 401:
+                            return response.status, None
+                        response.raise_for_status()
+                        return response.status, loads(await response.read())
+                    retry_after = parse_retry_after(response.headers.get("Retry-After"))
+                    error: Exception = aiohttp.ClientResponseError(
+                        response.request_info, response.history,
+                        status=response.status, message=response.reason or ""
+                    )
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                error = e
+
+            self.circuit_breaker.record_failure()
+            attempt += 1
+            delay = self.retry_policy.delay(attempt, retry_after)
+
+            if attempt > self.retry_policy.max_retries or loop.time() + delay > deadline:
+                run_metrics.increment("api.requests_failed")
+                raise error
+
+            run_metrics.increment("api.retries")
+            run_metrics.increment("api.retry_wait_seconds", delay)
+            await asyncio.sleep(delay)
+
+    async def get_tag_list(self) -> List[Tag]:
+        """Get list of tags/folders"""
+        response = await self._make_request("tag/list", priority=RequestPriority.METADATA)
+        return [Tag.from_api_response(tag) for tag in response.get("tags", [])]
+
+    async def find_focus_folder_id(self) -> Optional[str]:
+        """Find the Focus folder/label ID"""
+        for tag in await self.get_tag_list():
+            if tag.label and "focus" in tag.label.lower():
+                return tag.id
+        return None
+
+    async def get_stream_contents(self, stream_id: str, count: int = 20,
+                                  start_time: Optional[datetime] = None,
+                                  continuation: Optional[str] = None) -> Tuple[List[Article], Optional[str]]:
+        """Get articles from a stream (feed, tag, or folder)"""
+        params = {
+            "n": count,
+            "output": "json"
+        }
+
+        if start_time:
+            params["ot"] = int(start_time.timestamp())
+
+        if continuation:
+            params["c"] = continuation
+
+        if self.config.exclude_read:
+            params["xt"] = READ_STATE
+
+        response = await self._make_request(f"stream/contents/{stream_id}", params)
+        articles = [Article.from_api_response(item) for item in response.get("items", [])]
+        assign_inoreader_urls(articles)
+        return articles, response.get("continuation")
+
+    async def get_articles_by_tag(self, tag_id: str, count: int = 50,
+                                  start_time: Optional[datetime] = None) -> List[Article]:
+        """Get articles from a specific tag/folder"""
+        articles, _ = await self.get_stream_contents(tag_id, count, start_time)
+        return articles
+
+    async def get_articles_by_tags(self, tag_ids: List[str], count: int = 50,
+                                   start_time: Optional[datetime] = None) -> List[Article]:
+        """Get articles from several tags/folders concurrently, in tag order"""
+        results = await self.get_articles_per_tag(tag_ids, count, {tag_id: start_time for tag_id in tag_ids})
+
+        articles = []
+        for tag_articles in results:
+            articles.extend(tag_articles)
+        return articles
+
+    async def get_articles_per_tag(self, tag_ids: List[str], count: int,
+                                   start_times: Dict[str, Optional[datetime]]) -> List[List[Article]]:
+        """Get one article list per tag/folder, each with its own start time"""
+        return list(await asyncio.gather(*[
+            self.get_articles_by_tag(tag_id, count, start_times.get(tag_id)) for tag_id in tag_ids
+        ]))
+
+    async def get_focus_folder_articles(self, count: int = 100,
+                                        start_time: Optional[datetime] = None,
+                                        focus_tag_id: Optional[str] = None) -> List[Article]:
+        """Get articles from Focus folder only"""
+        focus_tag_id = focus_tag_id or await self.find_focus_folder_id()
+        if not focus_tag_id:
+            return []
+
+        if start_time is None:
+            start_time = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+
+        return await self.get_articles_by_tag(focus_tag_id, count, start_time)
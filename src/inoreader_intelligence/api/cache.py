@@ -0,0 +1,91 @@
+"""On-disk cache for slow-changing Inoreader metadata"""
+
+import time
+from pathlib import Path
+from typing import Optional, Dict, Any
+
+from ..serialization import read_json, write_json, JSONDecodeError
+
+
+class MetadataCache:
+    """Persistent cache for tag/list, subscription/list and resolved IDs
+
+    Each entry keeps the decoded response together with its ETag and
+    Last-Modified validators, so stale entries can be revalidated with a
+    conditional GET instead of being downloaded again.
+    """
+
+    def __init__(self, path: str, ttl_seconds: int = 86400):
+        self.path = Path(path)
+        self.ttl_seconds = ttl_seconds
+        self._entries: Optional[Dict[str, Dict[str, Any]]] = None
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        """Load cache entries from disk once per process"""
+        if self._entries is None:
+            self._entries = {}
+            if self.path.exists():
+                try:
+                    self._entries = read_json(self.path)
+                except (JSONDecodeError, OSError):
+                    self._entries = {}
+        return self._entries
+
+    def _save(self) -> None:
+        """Atomically write cache entries to disk"""
+        write_json(self.path, self._load())
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Get a cache entry, fresh or stale"""
+        return self._load().get(key)
+
+    def is_fresh(self, entry: Dict[str, Any]) -> bool:
+        """Check whether an entry is still within its TTL"""
+        return time.time() - entry.get("fetched_at", 0) < self.ttl_seconds
+
+    def get_fresh(self, key: str) -> Optional[Any]:
+        """Get the cached data for a key if it has not expired"""
+        entry = self.get(key)
+        if entry and self.is_fresh(entry):
+            return entry["data"]
+        return None
+
+    def store(self, key: str, data: Any, etag: Optional[str] = None,
+              last_modified: Optional[str] = None) -> None:
+        """Store data with its HTTP validators"""
+        self._load()[key] = {
+            "data": data,
+            "etag": etag,
+            "last_modified": last_modified,
+            "fetched_at": time.time()
+        }
+        self._save()
+
+    def touch(self, key: str) -> None:
+        """Mark an entry as revalidated (HTTP 304)"""
+        entry = self.get(key)
+        if entry:
+            entry["fetched_at"] = time.time()
+            self._save()
+
+    def invalidate(self, key: str) -> None:
+        """Drop a single entry, e.g. a resolved ID that no longer exists"""
+        if self._load().pop(key, None) is not None:
+            self._save()
+
+    def conditional_headers(self, key: str) -> Dict[str, str]:
+        """Build If-None-Match/If-Modified-Since headers for a cached entry"""
+        entry = self.get(key)
+        headers = {}
+        if entry:
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def clear(self) -> None:
+        """Remove all cached metadata"""
+        self._entries = {}
+        if self.path.exists():
+            self.path.unlink()
@@ -1,25 +1,65 @@
 """Inoreader API client"""
 
+import asyncio
 import requests
-from typing import List, Optional, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Dict, Any, Iterator
 from datetime import datetime, timedelta
-from bs4 import BeautifulSoup
 import time
+from pathlib import Path
 
 from ..auth import InoreaderOAuth
+from ..cleaner.extract import html_to_text
 from ..config import Config
-from .models import Article, Feed, Tag
+from ..metrics import run_metrics
+from ..serialization import loads
+from ..transport import create_session, request_timeout
+from .async_client import AsyncInoreaderClient
+from .cache import MetadataCache
+from .quota import QuotaGovernor, QuotaExceededError, RequestPriority
+from .retry import RetryPolicy, CircuitBreaker, RETRYABLE_STATUS_CODES, parse_retry_after
+from .state import SyncState, SeenItemStore
+from .streaming import StreamingItemsDecoder
+from .models import Article, Feed, Tag, long_item_id, assign_inoreader_urls, READ_STATE
 
 
 class InoreaderClient:
     """Client for interacting with Inoreader API"""
     
     BASE_URL = "https://www.inoreader.com/reader/api/0"
+    READING_LIST_STREAM = "user/-/state/com.google/reading-list"
+    ITEM_IDS_PAGE_SIZE = 1000
+    STREAM_CHUNK_SIZE = 64 * 1024
     
     def __init__(self, config: Config):
         self.config = config
-        self.oauth = InoreaderOAuth(config)
-        self.session = requests.Session()
+        self.session = create_session(config)
+        self.oauth = InoreaderOAuth(config, session=self.session)
+        self.metadata_cache = MetadataCache(
+            str(Path(config.cache_dir) / "metadata.json"),
+            ttl_seconds=config.metadata_cache_ttl
+        )
+        self.quota = QuotaGovernor(
+            str(Path(config.cache_dir) / "quota.json"),
+            metadata_reserve=config.quota_metadata_reserve
+        )
+        self.retry_policy = RetryPolicy(
+            max_retries=config.api_max_retries,
+            backoff_base=config.api_backoff_base,
+            backoff_max=config.api_backoff_max
+        )
+        self.circuit_breaker = CircuitBreaker(
+            failure_threshold=config.circuit_breaker_threshold,
+            reset_timeout=config.circuit_breaker_reset
+        )
+        self.sync_state = SyncState(str(Path(config.cache_dir) / "sync_state.json"))
+        self.seen_items = SeenItemStore(
+            str(Path(config.cache_dir) / "seen_items.json"),
+            max_age_days=config.seen_items_max_age_days
+        )
+        # Set by get_focus_folder_articles when incremental sync or ID-first
+        # fetching found nothing new, so callers don't fall back to unread articles
+        self.focus_caught_up = False
         
     def authenticate(self, interactive: bool = True) -> None:
         """Authenticate with Inoreader"""
@@ -30,35 +70,124 @@ class InoreaderClient:
             if not success:
                 raise ValueError("Automatic authentication failed. Please re-authenticate manually.")
         
-    def _make_request(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
-        """Make authenticated request to Inoreader API"""
+    def _send_request(self, endpoint: str, params: Optional[Dict[str, Any]] = None,
+                     headers: Optional[Dict[str, str]] = None, method: str = "GET",
+                     data: Any = None, stream: bool = False,
+                     priority: str = RequestPriority.CONTENT) -> requests.Response:
+        """Send authenticated request to Inoreader API and return the raw response"""
         if not self.oauth.is_authenticated():
             raise ValueError("Not authenticated")
         
         url = f"{self.BASE_URL}/{endpoint}"
-        headers = self.oauth.get_auth_headers()
+        zone = self.quota.zone_for(endpoint, method)
         
         try:
-            response = self.session.get(url, headers=headers, params=params)
+            response = self._send_metered(zone, priority, method, url, headers, params, data, stream)
             response.raise_for_status()
-            return response.json()
+            return response
         except requests.HTTPError as e:
             if e.response.status_code == 401:
                 # Try to refresh token
                 self.oauth.refresh_access_token()
-                headers = self.oauth.get_auth_headers()
-                response = self.session.get(url, headers=headers, params=params)
+                response = self._send_metered(zone, priority, method, url, headers, params, data, stream)
                 response.raise_for_status()
-                return response.json()
+                return response
             raise
     
+    def _send_metered(self, zone: int, priority: str, method: str, url: str,
+                     headers: Optional[Dict[str, str]], params: Optional[Dict[str, Any]],
+                     data: Any, stream: bool) -> requests.Response:
+        """Send one request through the quota governor, retrying transient failures
+        
+        Connection errors, 429 and 5xx responses are retried with exponential
+        backoff and jitter (or after Retry-After) until the retry limit or the
+        per-request deadline is reached. Repeated failures open the circuit
+        breaker so later requests fail fast.
+        """
+        deadline = time.monotonic() + self.config.api_request_deadline
+        attempt = 0
+        
+        while True:
+            self.circuit_breaker.before_request()
+            self.quota.acquire(zone, priority)
+            request_headers = {**self.oauth.get_auth_headers(), **(headers or {})}
+            timeout = request_timeout(self.config, deadline - time.monotonic())
+            
+            response = None
+            try:
+                response = self.session.request(method, url, headers=request_headers, params=params,
+                                                data=data, stream=stream, timeout=timeout)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                error = e
+                retry_after = None
+            else:
+                self.quota.record(zone, response.headers)
+                if response.status_code not in RETRYABLE_STATUS_CODES:
+                    self.circuit_breaker.record_success()
+                    return response
+                error = requests.HTTPError(f"{response.status_code} Error for url: {url}", response=response)
+                retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            
+            self.circuit_breaker.record_failure()
+            attempt += 1
+            delay = self.retry_policy.delay(attempt, retry_after)
+            
+            if attempt > self.retry_policy.max_retries or time.monotonic() + delay > deadline:
+                run_metrics.increment("api.requests_failed")
+                if response is not None:
+                    return response
+                raise error
+            
+            run_metrics.increment("api.retries")
+            run_metrics.increment("api.retry_wait_seconds", delay)
+            print(f"🔁 {error} - retrying in {delay:.1f}s ({attempt}/{self.retry_policy.max_retries})")
+            time.sleep(delay)
+    
+    def _make_request(self, endpoint: str, params: Optional[Dict[str, Any]] = None,
+                     method: str = "GET", data: Any = None) -> Dict[str, Any]:
+        """Make authenticated request to Inoreader API"""
+        return loads(self._send_request(endpoint, params, method=method, data=data).content)
+    
+    def _make_cached_request(self, endpoint: str, use_cache: bool = True) -> Dict[str, Any]:
+        """Make a metadata request through the on-disk cache
+        
+        Fresh entries are served without a round trip. Stale entries (or any
+        entry when use_cache is False) are revalidated with a conditional GET.
+        """
+        if use_cache:
+            cached = self.metadata_cache.get_fresh(endpoint)
+            if cached is not None:
+                return cached
+        
+        try:
+            response = self._send_request(endpoint, headers=self.metadata_cache.conditional_headers(endpoint),
+                                          priority=RequestPriority.METADATA)
+        except QuotaExceededError as e:
+            entry = self.metadata_cache.get(endpoint)
+            if entry is None:
+                raise
+            print(f"⚠️  {e}; using cached {endpoint}")
+            return entry["data"]
+        
+        if response.status_code == 304:
+            self.metadata_cache.touch(endpoint)
+            return self.metadata_cache.get(endpoint)["data"]
+        
+        data = loads(response.content)
+        self.metadata_cache.store(
+            endpoint, data,
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified")
+        )
+        return data
+    
     def get_user_info(self) -> Dict[str, Any]:
         """Get user information"""
-        return self._make_request("user-info")
+        return loads(self._send_request("user-info", priority=RequestPriority.METADATA).content)
     
-    def get_subscription_list(self) -> List[Feed]:
+    def get_subscription_list(self, use_cache: bool = True) -> List[Feed]:
         """Get list of subscribed feeds"""
-        response = self._make_request("subscription/list")
+        response = self._make_cached_request("subscription/list", use_cache)
         feeds = []
         
         for sub in response.get("subscriptions", []):
@@ -66,9 +195,9 @@ class InoreaderClient:
         
         return feeds
     
-    def get_tag_list(self) -> List[Tag]:
+    def get_tag_list(self, use_cache: bool = True) -> List[Tag]:
         """Get list of tags/folders"""
-        response = self._make_request("tag/list")
+        response = self._make_cached_request("tag/list", use_cache)
         tags = []
         
         for tag in response.get("tags", []):
@@ -80,6 +209,43 @@ class InoreaderClient:
                           start_time: Optional[datetime] = None, 
                           continuation: Optional[str] = None) -> tuple[List[Article], Optional[str]]:
         """Get articles from a stream (feed, tag, or folder)"""
+        if self.config.streaming_decode:
+            page = self.iter_stream_contents(stream_id, count, start_time, continuation)
+            articles = list(page)
+            return articles, page.continuation
+        
+        response = self._fetch_stream_page(stream_id, count, start_time, continuation)
+        articles = self._parse_stream_items(response.get("items", []))
+        
+        next_continuation = response.get("continuation")
+        return articles, next_continuation
+    
+    def iter_stream_contents(self, stream_id: str, count: int = 20,
+                            start_time: Optional[datetime] = None,
+                            continuation: Optional[str] = None) -> StreamingItemsDecoder:
+        """Stream a stream/contents page, decoding one Article at a time
+        
+        Iterate the returned decoder for articles; its continuation is
+        available once iteration has finished.
+        """
+        params = self._stream_params(count, start_time, continuation)
+        response = self._send_request(f"stream/contents/{stream_id}", params, stream=True)
+        return StreamingItemsDecoder(
+            response.iter_content(chunk_size=self.STREAM_CHUNK_SIZE),
+            item_factory=self._parse_stream_item,
+            on_close=response.close
+        )
+    
+    def _fetch_stream_page(self, stream_id: str, count: int = 20,
+                          start_time: Optional[datetime] = None,
+                          continuation: Optional[str] = None) -> Dict[str, Any]:
+        """Fetch one raw stream/contents page without building Article objects"""
+        params = self._stream_params(count, start_time, continuation)
+        return self._make_request(f"stream/contents/{stream_id}", params)
+    
+    def _stream_params(self, count: int, start_time: Optional[datetime],
+                       continuation: Optional[str]) -> Dict[str, Any]:
+        """Build query parameters for a stream/contents request"""
         params = {
             "n": count,
             "output": "json"
@@ -91,19 +257,90 @@ class InoreaderClient:
         if continuation:
             params["c"] = continuation
         
-        response = self._make_request(f"stream/contents/{stream_id}", params)
+        if self.config.exclude_read:
+            params["xt"] = READ_STATE
+        
+        return params
+    
+    @staticmethod
+    def _parse_stream_items(items: List[Dict[str, Any]]) -> List[Article]:
+        """Build Article objects from raw stream items"""
+        articles = [Article.from_api_response(item) for item in items]
+        assign_inoreader_urls(articles)
+        return articles
+    
+    @staticmethod
+    def _parse_stream_item(item: Dict[str, Any]) -> Article:
+        """Build one Article from a raw stream item"""
+        article = Article.from_api_response(item)
+        assign_inoreader_urls((article,))
+        return article
+    
+    def get_stream_item_ids(self, stream_id: str, count: int = 100,
+                           start_time: Optional[datetime] = None) -> List[str]:
+        """Get the IDs of a stream's items without their content"""
+        item_ids = []
+        continuation = None
+        
+        while len(item_ids) < count:
+            params = {
+                "s": stream_id,
+                "n": min(self.ITEM_IDS_PAGE_SIZE, count - len(item_ids)),
+                "output": "json"
+            }
+            if start_time:
+                params["ot"] = int(start_time.timestamp())
+            if continuation:
+                params["c"] = continuation
+            if self.config.exclude_read:
+                params["xt"] = READ_STATE
+            
+            response = self._make_request("stream/items/ids", params)
+            refs = response.get("itemRefs", [])
+            item_ids.extend(long_item_id(ref["id"]) for ref in refs)
+            
+            continuation = response.get("continuation")
+            if not refs or not continuation:
+                break
+        
+        return item_ids[:count]
+    
+    def get_items_contents(self, item_ids: List[str], batch_size: Optional[int] = None) -> List[Article]:
+        """Get full content for specific items, many IDs per request"""
+        batch_size = batch_size or self.config.item_contents_batch_size
         articles = []
         
-        for item in response.get("items", []):
-            articles.append(Article.from_api_response(item))
+        for start in range(0, len(item_ids), batch_size):
+            batch = item_ids[start:start + batch_size]
+            response = self._make_request(
+                "stream/items/contents",
+                params={"output": "json"},
+                method="POST",
+                data=[("i", item_id) for item_id in batch]
+            )
+            articles.extend(self._parse_stream_items(response.get("items", [])))
         
-        next_continuation = response.get("continuation")
-        return articles, next_continuation
+        return articles
+    
+    def get_unseen_stream_articles(self, stream_id: str, count: int = 100,
+                                  start_time: Optional[datetime] = None) -> List[Article]:
+        """Get articles no earlier run has processed, fetching IDs first
+        
+        Only the lightweight item-ID list is downloaded for the whole stream;
+        full content is then requested in batches for unseen IDs only.
+        """
+        item_ids = self.get_stream_item_ids(stream_id, count, start_time)
+        unseen_ids = self.seen_items.filter_unseen(item_ids)
+        print(f"🆔 {len(item_ids)} item IDs in stream, {len(unseen_ids)} not processed before")
+        
+        articles = self.get_items_contents(unseen_ids) if unseen_ids else []
+        self.seen_items.record(article.id for article in articles)
+        return articles
     
     def get_unread_articles(self, count: int = 50, 
                            start_time: Optional[datetime] = None) -> List[Article]:
         """Get unread articles"""
-        articles, _ = self.get_stream_contents("user/-/state/com.google/reading-list", count, start_time)
+        articles, _ = self.get_stream_contents(self.READING_LIST_STREAM, count, start_time)
         return articles
     
     def get_articles_by_tag(self, tag_id: str, count: int = 50,
@@ -112,19 +349,80 @@ class InoreaderClient:
         articles, _ = self.get_stream_contents(tag_id, count, start_time)
         return articles
     
-    def get_todays_articles(self, tag_ids: Optional[List[str]] = None) -> List[Article]:
+    def get_todays_articles(self, tag_ids: Optional[List[str]] = None,
+                           incremental: Optional[bool] = None) -> List[Article]:
         """Get articles from today"""
         start_time = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
-        articles = []
+        if incremental is None:
+            incremental = self.config.incremental_sync
         
         if tag_ids:
-            for tag_id in tag_ids:
-                tag_articles = self.get_articles_by_tag(tag_id, count=100, start_time=start_time)
-                articles.extend(tag_articles)
+            articles = self.get_articles_by_tags(tag_ids, count=100, start_time=start_time,
+                                                 incremental=incremental)
+        elif incremental:
+            stream_id = self.READING_LIST_STREAM
+            articles = self.get_unread_articles(count=100,
+                                                start_time=self._incremental_start_time(stream_id, start_time))
+            articles = self._apply_incremental(stream_id, articles)
         else:
             articles = self.get_unread_articles(count=100, start_time=start_time)
         
-        # Remove duplicates
+        return self._dedupe_articles(articles)
+    
+    def get_articles_by_tags(self, tag_ids: List[str], count: int = 50,
+                            start_time: Optional[datetime] = None,
+                            incremental: bool = False) -> List[Article]:
+        """Get articles from several tags/folders concurrently"""
+        start_times = {
+            tag_id: self._incremental_start_time(tag_id, start_time) if incremental else start_time
+            for tag_id in tag_ids
+        }
+        
+        if len(tag_ids) == 1:
+            per_tag = [self.get_articles_by_tag(tag_ids[0], count, start_times[tag_ids[0]])]
+        else:
+            async def fetch() -> List[List[Article]]:
+                async with AsyncInoreaderClient(self.config, self.oauth, quota=self.quota,
+                                            retry_policy=self.retry_policy,
+                                            circuit_breaker=self.circuit_breaker) as client:
+                    return await client.get_articles_per_tag(tag_ids, count, start_times)
+            
+            per_tag = asyncio.run(fetch())
+        
+        articles = []
+        for tag_id, tag_articles in zip(tag_ids, per_tag):
+            if incremental:
+                tag_articles = self._apply_incremental(tag_id, tag_articles)
+            articles.extend(tag_articles)
+        
+        return articles
+    
+    def _incremental_start_time(self, stream_id: str,
+                               start_time: Optional[datetime]) -> Optional[datetime]:
+        """Move a fetch's start time up to the stream's high-water mark"""
+        high_water_mark = self.sync_state.get_high_water_mark(stream_id)
+        if high_water_mark is None:
+            return start_time
+        
+        mark_time = datetime.fromtimestamp(high_water_mark // 1000000)
+        if start_time is None or mark_time > start_time:
+            return mark_time
+        return start_time
+    
+    def _apply_incremental(self, stream_id: str, articles: List[Article]) -> List[Article]:
+        """Keep only articles newer than the high-water mark and record the new mark"""
+        new_articles = self.sync_state.filter_new(stream_id, articles)
+        self.sync_state.record(stream_id, new_articles)
+        return new_articles
+    
+    def commit_sync_state(self) -> None:
+        """Persist high-water marks and seen IDs once a run's articles have been processed"""
+        self.sync_state.commit()
+        self.seen_items.commit()
+    
+    @staticmethod
+    def _dedupe_articles(articles: List[Article]) -> List[Article]:
+        """Remove duplicate articles, keeping the first occurrence"""
         seen_ids = set()
         unique_articles = []
         for article in articles:
@@ -137,8 +435,16 @@ class InoreaderClient:
     def get_focus_folder_articles(self, count: int = 100, 
                                  start_time: Optional[datetime] = None,
                                  use_pagination: bool = False,
-                                 max_total_articles: int = 500) -> List[Article]:
-        """Get articles from Focus folder only"""
+                                 max_total_articles: int = 500,
+                                 incremental: Optional[bool] = None) -> List[Article]:
+        """Get articles from Focus folder only
+        
+        When incremental sync or ID-first fetching finds nothing new,
+        focus_caught_up is set and the empty result should not be treated
+        as a missing or empty folder.
+        """
+        self.focus_caught_up = False
+        
         # Find Focus folder
         focus_tag_id = self.find_focus_folder_id()
         if not focus_tag_id:
@@ -148,66 +454,182 @@ class InoreaderClient:
         if start_time is None:
             start_time = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
         
-        if use_pagination:
+        if incremental is None:
+            incremental = self.config.incremental_sync
+        
+        try:
+            articles = self._fetch_focus_folder(focus_tag_id, count, start_time, use_pagination,
+                                                max_total_articles, incremental)
+        except requests.HTTPError as e:
+            if e.response is None or e.response.status_code != 404:
+                raise
+            # The cached ID goes stale when the folder is renamed or deleted
+            print("⚠️  Focus folder ID is stale, looking the folder up again...")
+            self.metadata_cache.invalidate("focus_folder_id")
+            focus_tag_id = self.find_focus_folder_id(use_cache=False)
+            if not focus_tag_id:
+                print("❌ Focus folder not found. Please create a 'Focus' folder in Inoreader.")
+                return []
+            articles = self._fetch_focus_folder(focus_tag_id, count, start_time, use_pagination,
+                                                max_total_articles, incremental)
+        
+        self.focus_caught_up = not articles and (incremental or self.config.id_first_fetch)
+        return articles
+    
+    def _fetch_focus_folder(self, focus_tag_id: str, count: int, start_time: datetime,
+                            use_pagination: bool, max_total_articles: int,
+                            incremental: bool) -> List[Article]:
+        """Fetch the Focus folder's articles, keeping only new ones when incremental"""
+        if incremental:
+            start_time = self._incremental_start_time(focus_tag_id, start_time)
+            print(f"🔁 Incremental sync: fetching items newer than {start_time:%Y-%m-%d %H:%M:%S}")
+        
+        if self.config.id_first_fetch:
+            print("📁 Fetching new article IDs from Focus folder...")
+            articles = self.get_unseen_stream_articles(
+                focus_tag_id, max_total_articles if use_pagination else count, start_time
+            )
+            print(f"📰 Found {len(articles)} articles in Focus folder")
+        elif use_pagination:
             print(f"📁 Fetching articles from Focus folder with pagination (max: {max_total_articles})...")
-            return self.get_all_focus_articles_paginated(focus_tag_id, start_time, max_total_articles)
+            articles = self.get_all_focus_articles_paginated(focus_tag_id, start_time, max_total_articles)
         else:
-            print(f"📁 Fetching articles from Focus folder...")
+            print("📁 Fetching articles from Focus folder...")
             articles = self.get_articles_by_tag(focus_tag_id, count, start_time)
             print(f"📰 Found {len(articles)} articles in Focus folder")
-            return articles
+        
+        if incremental:
+            articles = self._apply_incremental(focus_tag_id, articles)
+            print(f"🆕 {len(articles)} new articles since the last run")
+        
+        return articles
     
     def get_all_focus_articles_paginated(self, focus_tag_id: str, 
                                        start_time: Optional[datetime] = None,
                                        max_total_articles: int = 500) -> List[Article]:
         """Get all articles from Focus folder using pagination"""
-        all_articles = []
-        continuation = None
-        page_count = 0
+        return list(self.iter_focus_articles_paginated(focus_tag_id, start_time, max_total_articles))
+    
+    def iter_focus_articles_paginated(self, focus_tag_id: str,
+                                     start_time: Optional[datetime] = None,
+                                     max_total_articles: int = 500) -> Iterator[Article]:
+        """Yield Focus folder articles page by page, prefetching the next page's request
+        
+        The HTTP request for page N+1 goes out as soon as page N's
+        continuation token arrives, so it downloads while page N is parsed.
+        With streaming decode enabled, pages are fetched one after another
+        and each is decoded item by item as it downloads.
+        """
+        if self.config.streaming_decode:
+            yield from self._iter_focus_articles_streaming(focus_tag_id, start_time, max_total_articles)
+            return
+        
         articles_per_page = 100
+        page_count = 0
+        total_articles = 0
+        fetch_count = min(articles_per_page, max_total_articles)
         
-        while len(all_articles) < max_total_articles:
-            page_count += 1
-            remaining_articles = max_total_articles - len(all_articles)
-            fetch_count = min(articles_per_page, remaining_articles)
-            
-            print(f"📄 Fetching page {page_count} ({fetch_count} articles)...")
-            
-            try:
-                articles, continuation = self.get_stream_contents(
-                    focus_tag_id, 
-                    count=fetch_count, 
-                    start_time=start_time,
-                    continuation=continuation
-                )
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="inoreader-page")
+        print(f"📄 Fetching page 1 ({fetch_count} articles)...")
+        pending = executor.submit(self._fetch_stream_page, focus_tag_id, fetch_count, start_time, None)
+        
+        try:
+            while pending is not None:
+                page_count += 1
                 
-                if not articles:
+                try:
+                    response = pending.result()
+                except Exception as e:
+                    # Retries are exhausted; don't let the report run on partial data
+                    print(f"❌ Error fetching page {page_count}: {e}")
+                    raise
+                
+                pending = None
+                items = response.get("items", [])
+                continuation = response.get("continuation")
+                
+                if not items:
                     print("📭 No more articles available")
                     break
                 
-                all_articles.extend(articles)
-                print(f"📰 Page {page_count}: Found {len(articles)} articles (total: {len(all_articles)})")
-                
-                # If no continuation token or we got fewer articles than requested, we're done
-                if not continuation or len(articles) < fetch_count:
+                # Ask for the next page before parsing this one
+                remaining_articles = max_total_articles - total_articles - len(items)
+                if continuation and len(items) >= fetch_count and remaining_articles > 0:
+                    fetch_count = min(articles_per_page, remaining_articles)
+                    print(f"📄 Fetching page {page_count + 1} ({fetch_count} articles)...")
+                    pending = executor.submit(self._fetch_stream_page, focus_tag_id,
+                                              fetch_count, start_time, continuation)
+                elif remaining_articles > 0:
+                    # If no continuation token or we got fewer articles than requested, we're done
                     print("📋 Reached end of available articles")
-                    break
-                    
+                
+                articles = self._parse_stream_items(items)
+                total_articles += len(articles)
+                print(f"📰 Page {page_count}: Found {len(articles)} articles (total: {total_articles})")
+                
+                yield from articles
+        finally:
+            if pending is not None:
+                pending.cancel()
+            executor.shutdown(wait=False)
+        
+        print(f"✅ Pagination complete: {total_articles} total articles from {page_count} pages")
+    
+    def _iter_focus_articles_streaming(self, focus_tag_id: str,
+                                      start_time: Optional[datetime] = None,
+                                      max_total_articles: int = 500) -> Iterator[Article]:
+        """Yield Focus folder articles page by page, decoding each response incrementally"""
+        articles_per_page = 100
+        page_count = 0
+        total_articles = 0
+        continuation = None
+        
+        while total_articles < max_total_articles:
+            page_count += 1
+            fetch_count = min(articles_per_page, max_total_articles - total_articles)
+            print(f"📄 Fetching page {page_count} ({fetch_count} articles)...")
+            
+            page_articles = 0
+            try:
+                page = self.iter_stream_contents(focus_tag_id, fetch_count, start_time, continuation)
+                for article in page:
+                    page_articles += 1
+                    yield article
             except Exception as e:
+                # Retries are exhausted; don't let the report run on partial data
                 print(f"❌ Error fetching page {page_count}: {e}")
+                raise
+            
+            total_articles += page_articles
+            continuation = page.continuation
+            
+            if not page_articles:
+                print("📭 No more articles available")
+                break
+            
+            print(f"📰 Page {page_count}: Found {page_articles} articles (total: {total_articles})")
+            
+            # If no continuation token or we got fewer articles than requested, we're done
+            if not continuation or page_articles < fetch_count:
+                print("📋 Reached end of available articles")
                 break
         
-        print(f"✅ Pagination complete: {len(all_articles)} total articles from {page_count} pages")
-        return all_articles
+        print(f"✅ Pagination complete: {total_articles} total articles from {page_count} pages")
     
-    def find_focus_folder_id(self) -> Optional[str]:
+    def find_focus_folder_id(self, use_cache: bool = True) -> Optional[str]:
         """Find the Focus folder/label ID"""
+        if use_cache:
+            focus_tag_id = self.metadata_cache.get_fresh("focus_folder_id")
+            if focus_tag_id:
+                return focus_tag_id
+        
         try:
-            tags = self.get_tag_list()
+            tags = self.get_tag_list(use_cache)
             for tag in tags:
                 # Check if label contains "focus" (case insensitive)
                 if tag.label and "focus" in tag.label.lower():
                     print(f"✅ Found Focus folder: {tag.label} (ID: {tag.id})")
+                    self.metadata_cache.store("focus_folder_id", tag.id)
                     return tag.id
             
             print("❌ Focus folder/label not found in tags:")
@@ -220,19 +642,54 @@ class InoreaderClient:
             return None
     
     def clean_article_content(self, article: Article) -> Article:
-        """Clean article content from HTML"""
+        """Clean article content from HTML
+        
+        Use ContentCleaner.clean_articles to clean a whole run in parallel.
+        """
         if article.content:
-            soup = BeautifulSoup(article.content, "html.parser")
-            article.content = soup.get_text().strip()
+            article.content = html_to_text(article.content, self.config.cleaning_max_input_chars,
+                                           self.config.strip_boilerplate)
         
         if article.summary:
-            soup = BeautifulSoup(article.summary, "html.parser")  
-            article.summary = soup.get_text().strip()
+            article.summary = html_to_text(article.summary, self.config.cleaning_max_input_chars)
         
         return article
     
-    def mark_as_read(self, article_ids: List[str]) -> None:
-        """Mark articles as read"""
-        # This would require a POST request to mark articles as read
-        # Implementation depends on specific API endpoints
-        pass
\ No newline at end of file
+    def edit_tag(self, item_ids: List[str], add_tags: Optional[List[str]] = None,
+                 remove_tags: Optional[List[str]] = None,
+                 batch_size: Optional[int] = None) -> int:
+        """Add and/or remove tags on many items, batching IDs per edit-tag request
+        
+        Returns the number of items edited.
+        """
+        batch_size = batch_size or self.config.edit_tag_batch_size
+        tag_fields = [("a", tag) for tag in add_tags or []] + [("r", tag) for tag in remove_tags or []]
+        if not tag_fields:
+            raise ValueError("edit_tag needs at least one tag to add or remove")
+        
+        item_ids = list(dict.fromkeys(item_ids))
+        for start in range(0, len(item_ids), batch_size):
+            batch = item_ids[start:start + batch_size]
+            self._send_request("edit-tag", method="POST",
+                               data=tag_fields + [("i", item_id) for item_id in batch])
+            run_metrics.increment("api.items_tagged", len(batch))
+        
+        return len(item_ids)
+    
+    def mark_as_read(self, article_ids: List[str]) -> int:
+        """Mark articles as read, returning how many were marked"""
+        return self.edit_tag(article_ids, add_tags=[READ_STATE])
+    
+    def mark_reported_as_read(self, articles: List[Article]) -> None:
+        """Mark a finished report's articles as read if MARK_READ_AFTER_REPORT is set
+        
+        Failures are reported but not raised, since the report itself is done.
+        """
+        if not self.config.mark_read_after_report or not articles:
+            return
+        
+        try:
+            marked = self.mark_as_read([article.id for article in articles])
+            print(f"✅ Marked {marked} articles as read")
+        except Exception as e:
+            print(f"⚠️  Could not mark articles as read: {e}")
\ No newline at end of file
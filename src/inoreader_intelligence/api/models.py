@@ -1,82 +1,198 @@
 """Data models for Inoreader API"""
 
+import sys
 from dataclasses import dataclass
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Iterable
 from datetime import datetime
+from urllib.parse import quote
+
+from ..metrics import run_metrics
+
+
+ITEM_ID_PREFIX = "tag:google.com,2005:reader/item/"
+READ_STATE = "user/-/state/com.google/read"
+INOREADER_ARTICLE_URL = "https://www.inoreader.com/article/"
+INOREADER_SEARCH_URL = "https://www.inoreader.com/search/global/"
+
+
+def long_item_id(short_id: str) -> str:
+    """Convert a decimal item ID from stream/items/ids to the long hex form used in items"""
+    if short_id.startswith(ITEM_ID_PREFIX):
+        return short_id
+    return f"{ITEM_ID_PREFIX}{int(short_id):016x}"
+
+
+def _intern(value: Any) -> Any:
+    """Intern strings that repeat across many articles (feed IDs and titles, authors)"""
+    return sys.intern(value) if isinstance(value, str) else value
 
 
-@dataclass
 class Article:
-    """Represents an article from Inoreader"""
+    """Represents an article from Inoreader
     
-    id: str
-    title: str
-    summary: str
-    content: str
-    url: str
-    author: Optional[str]
-    published: datetime
-    updated: datetime
-    feed_id: str
-    feed_title: str
-    categories: List[str]
-    tags: List[str]
-    read: bool = False
-    starred: bool = False
+    A slotted class rather than a dataclass, so a run's articles stay
+    compact. Articles built from API items keep the raw timestamps and tag
+    entries and only decode them into datetimes and labels when first read;
+    the plain text of the content is likewise extracted on first access.
+    Repeated feed strings are interned.
+    """
+    
+    __slots__ = (
+        "id", "title", "url", "author", "feed_id", "feed_title", "categories",
+        "read", "starred", "timestamp_usec", "crawl_time_msec",
+        "_summary", "_content", "_published", "_updated", "_raw_tags", "_tags", "_text",
+        "_inoreader_url", "duplicates", "key_actors"
+    )
+    
+    FIELDS = (
+        "id", "title", "summary", "content", "url", "author", "published", "updated",
+        "feed_id", "feed_title", "categories", "tags", "read", "starred",
+        "timestamp_usec", "crawl_time_msec"
+    )
+    
+    def __init__(self, id: str, title: str, summary: str, content: str, url: str,
+                 author: Optional[str], published: datetime, updated: datetime,
+                 feed_id: str, feed_title: str, categories: List[str], tags: List[str],
+                 read: bool = False, starred: bool = False,
+                 timestamp_usec: int = 0, crawl_time_msec: int = 0):
+        self.id = id
+        self.title = title
+        self._summary = summary
+        self._content = content
+        self.url = url
+        self.author = _intern(author)
+        self._published = published
+        self._updated = updated
+        self.feed_id = _intern(feed_id)
+        self.feed_title = _intern(feed_title)
+        self.categories = categories
+        self._raw_tags = None
+        self._tags = tags
+        self.read = read
+        self.starred = starred
+        self.timestamp_usec = timestamp_usec
+        self.crawl_time_msec = crawl_time_msec
+        self._text = None
+        self._inoreader_url = None
+        self.duplicates = ()
+        self.key_actors = ()
     
     @classmethod
     def from_api_response(cls, data: Dict[str, Any]) -> "Article":
         """Create Article from API response"""
-        return cls(
-            id=data["id"],
-            title=data.get("title", ""),
-            summary=data.get("summary", {}).get("content", ""),
-            content=data.get("content", {}).get("content", ""),
-            url=data.get("alternate", [{}])[0].get("href", ""),
-            author=data.get("author", ""),
-            published=datetime.fromtimestamp(data.get("published", 0)),
-            updated=datetime.fromtimestamp(data.get("updated", 0)),
-            feed_id=data.get("origin", {}).get("streamId", ""),
-            feed_title=data.get("origin", {}).get("title", ""),
-            categories=data.get("categories", []),
-            tags=[tag.get("label", "") for tag in data.get("tags", [])],
-            read="read" in data.get("categories", []),
-            starred="starred" in data.get("categories", [])
-        )
+        article = cls.__new__(cls)
+        origin = data.get("origin", {})
+        # Stream and label IDs repeat across nearly every article
+        categories = [sys.intern(category) for category in data.get("categories", ())]
+        
+        article.id = data["id"]
+        article.title = data.get("title", "")
+        article._summary = data.get("summary", {}).get("content", "")
+        article._content = data.get("content", {}).get("content", "")
+        article.url = data.get("alternate", [{}])[0].get("href", "")
+        article.author = _intern(data.get("author", ""))
+        # Seconds since the epoch until first read
+        article._published = data.get("published", 0)
+        article._updated = data.get("updated", 0)
+        article.feed_id = _intern(origin.get("streamId", ""))
+        article.feed_title = _intern(origin.get("title", ""))
+        article.categories = categories
+        article._raw_tags = data.get("tags") or None
+        article._tags = None
+        article.read = "read" in categories
+        article.starred = "starred" in categories
+        article.timestamp_usec = int(data.get("timestampUsec") or data.get("published", 0) * 1000000)
+        article.crawl_time_msec = int(data.get("crawlTimeMsec") or 0)
+        article._text = None
+        article._inoreader_url = None
+        # Other copies of the same story, set when near-duplicates are collapsed
+        article.duplicates = ()
+        # States, organisations and people behind the story, set by combined enrichment
+        article.key_actors = ()
+        return article
+    
+    @property
+    def summary(self) -> str:
+        return self._summary
+    
+    @summary.setter
+    def summary(self, value: str) -> None:
+        self._summary = value
+        self._text = None
+    
+    @property
+    def content(self) -> str:
+        return self._content
+    
+    @content.setter
+    def content(self, value: str) -> None:
+        self._content = value
+        self._text = None
+    
+    @property
+    def published(self) -> datetime:
+        if not isinstance(self._published, datetime):
+            self._published = datetime.fromtimestamp(self._published)
+        return self._published
+    
+    @published.setter
+    def published(self, value: datetime) -> None:
+        self._published = value
+    
+    @property
+    def updated(self) -> datetime:
+        if not isinstance(self._updated, datetime):
+            self._updated = datetime.fromtimestamp(self._updated)
+        return self._updated
+    
+    @updated.setter
+    def updated(self, value: datetime) -> None:
+        self._updated = value
+    
+    @property
+    def tags(self) -> List[str]:
+        if self._tags is None:
+            self._tags = [tag.get("label", "") for tag in self._raw_tags or []]
+            self._raw_tags = None
+        return self._tags
+    
+    @tags.setter
+    def tags(self, value: List[str]) -> None:
+        self._tags = value
+        self._raw_tags = None
+    
+    @property
+    def text(self) -> str:
+        """Plain text of the content (or summary if there is no content), extracted once"""
+        if self._text is None:
+            from ..cleaner.extract import html_to_text
+            self._text = html_to_text(self._content or self._summary)
+        return self._text
+    
+    def __repr__(self) -> str:
+        return f"Article(id={self.id!r}, title={self.title!r}, feed_title={self.feed_title!r})"
+    
+    def __eq__(self, other: Any) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.FIELDS)
+    
+    __hash__ = None
+    
+    @property
+    def inoreader_url(self) -> str:
+        """Link to the article in Inoreader, computed once"""
+        if self._inoreader_url is None:
+            assign_inoreader_urls([self])
+        return self._inoreader_url
+    
+    @inoreader_url.setter
+    def inoreader_url(self, value: str) -> None:
+        self._inoreader_url = value
     
     def get_inoreader_url(self) -> str:
         """Get Inoreader URL to view this article in Inoreader"""
-        import urllib.parse
-        
-        # Try the original hex ID method first
-        try:
-            # Extract numeric part from ID like "tag:google.com,2005:reader/item/0000000012345"
-            if "item/" in self.id:
-                numeric_id = self.id.split("item/")[-1]
-                # Check if it's all digits
-                if numeric_id.isdigit():
-                    # Convert to hex and format for Inoreader URL
-                    hex_id = hex(int(numeric_id))[2:]  # Remove '0x' prefix
-                    return f"https://www.inoreader.com/article/{hex_id}"
-                else:
-                    print(f"Warning: Article ID numeric part contains non-digits: {numeric_id}")
-            else:
-                print(f"Warning: Article ID does not contain 'item/': {self.id}")
-        except ValueError as e:
-            print(f"Error converting article ID {self.id} to int: {e}")
-        except Exception as e:
-            print(f"Unexpected error with article ID {self.id}: {e}")
-        
-        # Fallback: Use global search with first few words of title
-        if hasattr(self, 'title') and self.title:
-            # Extract first few meaningful words from title for better search
-            words = self.title.split()[:4]  # Take first 4 words
-            search_query = ' '.join(words)
-            # URL encode the search query
-            encoded_query = urllib.parse.quote(search_query)
-            return f"https://www.inoreader.com/search/global/{encoded_query}"
-        
-        return self.url  # Final fallback to original URL
+        return self.inoreader_url
     
     def get_full_content(self) -> str:
         """Get the full content with fallback to summary"""
@@ -85,6 +201,44 @@ class Article:
         return self.summary
 
 
+def _deep_link(article: Article) -> Optional[str]:
+    """Deep link from the article ID, or None if the ID has no decimal item number"""
+    prefix, marker, numeric_id = article.id.rpartition("item/")
+    if not marker or not numeric_id.isdigit():
+        return None
+    try:
+        return f"{INOREADER_ARTICLE_URL}{int(numeric_id):x}"
+    except ValueError:
+        return None
+
+
+def assign_inoreader_urls(articles: Iterable[Article]) -> int:
+    """Compute and store Inoreader links for a batch of articles
+    
+    Articles whose ID can't be turned into a deep link get a global search
+    for the first words of their title instead (or their own URL). Those
+    fallbacks are counted in the run metrics rather than printed. Returns
+    the number of fallbacks.
+    """
+    fallbacks = 0
+    for article in articles:
+        if article._inoreader_url is not None:
+            continue
+        url = _deep_link(article)
+        if url is None:
+            fallbacks += 1
+            if article.title:
+                # Search for the first few words of the title
+                url = INOREADER_SEARCH_URL + quote(" ".join(article.title.split()[:4]))
+            else:
+                url = article.url
+        article._inoreader_url = url
+    
+    if fallbacks:
+        run_metrics.increment("articles.inoreader_url_fallbacks", fallbacks)
+    return fallbacks
+
+
 @dataclass
 class Feed:
     """Represents a feed subscription"""
@@ -0,0 +1,143 @@
+"""Inoreader API quota tracking"""
+
+import time
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Optional, Dict, Any, Iterator, Mapping
+
+from ..serialization import read_json, write_json, JSONDecodeError
+
+try:
+    import fcntl
+    FCNTL_AVAILABLE = True
+except ImportError:
+    FCNTL_AVAILABLE = False
+
+
+class QuotaExceededError(Exception):
+    """Raised when a request would spend quota the governor is holding back"""
+
+
+class RequestPriority:
+    """Request classes, from first to last to be shed"""
+
+    METADATA = "metadata"
+    CONTENT = "content"
+
+
+class QuotaGovernor:
+    """Keep a persisted daily request budget for Inoreader's Zone 1/Zone 2 limits
+
+    Usage and limits are read from the X-Reader-ZoneN-Usage/-Limit response
+    headers and stored on disk, so separate runs and processes (CLI, the
+    scheduler) share one view of the budget. When the remaining Zone budget
+    falls to the reserve, metadata calls are refused so content fetches for
+    the daily report can still go through.
+    """
+
+    ZONE_HEADERS = {
+        1: ("X-Reader-Zone1-Usage", "X-Reader-Zone1-Limit"),
+        2: ("X-Reader-Zone2-Usage", "X-Reader-Zone2-Limit"),
+    }
+    RESET_HEADER = "X-Reader-Limits-Reset-After"
+
+    def __init__(self, path: str, metadata_reserve: float = 0.2):
+        self.path = Path(path)
+        self.lock_path = self.path.with_suffix(self.path.suffix + ".lock")
+        self.metadata_reserve = metadata_reserve
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        """Hold an exclusive lock on the quota file across processes"""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.lock_path, "w") as lock_file:
+            if FCNTL_AVAILABLE:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if FCNTL_AVAILABLE:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        """Load zone budgets, resetting any whose day has rolled over"""
+        zones = {}
+        if self.path.exists():
+            try:
+                zones = read_json(self.path)
+            except (JSONDecodeError, OSError):
+                zones = {}
+
+        now = time.time()
+        for zone in self.ZONE_HEADERS:
+            budget = zones.setdefault(str(zone), {"usage": 0, "limit": None, "reset_at": self._next_reset()})
+            if budget["reset_at"] <= now:
+                budget["usage"] = 0
+                budget["reset_at"] = self._next_reset()
+        return zones
+
+    def _save(self, zones: Dict[str, Dict[str, Any]]) -> None:
+        write_json(self.path, zones)
+
+    @staticmethod
+    def _next_reset() -> float:
+        """Inoreader limits reset at midnight UTC"""
+        now = datetime.now(timezone.utc)
+        midnight = (now + timedelta(days=1)).replace(hour=0, minute=0, second=0, microsecond=0)
+        return midnight.timestamp()
+
+    @staticmethod
+    def zone_for(endpoint: str, method: str = "GET") -> int:
+        """Zone 2 covers write calls, Zone 1 everything else"""
+        return 2 if method.upper() == "POST" and endpoint != "stream/items/contents" else 1
+
+    def acquire(self, zone: int, priority: str = RequestPriority.CONTENT) -> None:
+        """Check that a request may be sent, raising QuotaExceededError if not"""
+        with self._locked():
+            budget = self._load()[str(zone)]
+
+        if not budget["limit"]:
+            return
+
+        remaining = budget["limit"] - budget["usage"]
+        if remaining <= 0:
+            raise QuotaExceededError(
+                f"Inoreader Zone {zone} quota exhausted ({budget['usage']}/{budget['limit']})"
+            )
+        if priority == RequestPriority.METADATA and remaining <= budget["limit"] * self.metadata_reserve:
+            raise QuotaExceededError(
+                f"Inoreader Zone {zone} quota low ({remaining} left), shedding metadata request"
+            )
+
+    def record(self, zone: int, headers: Mapping[str, str]) -> None:
+        """Update the budget from a response's quota headers"""
+        usage_header, limit_header = self.ZONE_HEADERS[zone]
+
+        with self._locked():
+            zones = self._load()
+            budget = zones[str(zone)]
+
+            if headers.get(usage_header) is not None:
+                budget["usage"] = int(headers[usage_header])
+            else:
+                budget["usage"] += 1
+            if headers.get(limit_header):
+                budget["limit"] = int(headers[limit_header])
+            if headers.get(self.RESET_HEADER):
+                budget["reset_at"] = time.time() + float(headers[self.RESET_HEADER])
+
+            self._save(zones)
+
+    def status(self) -> Dict[int, Dict[str, Any]]:
+        """Current usage, limit and reset time for each zone"""
+        with self._locked():
+            zones = self._load()
+        return {int(zone): budget for zone, budget in zones.items()}
+
+    def remaining(self, zone: int) -> Optional[int]:
+        """Requests left in a zone today, or None if the limit is not known yet"""
+        budget = self.status()[zone]
+        if not budget["limit"]:
+            return None
+        return max(budget["limit"] - budget["usage"], 0)
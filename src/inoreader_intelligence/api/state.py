@@ -0,0 +1,136 @@
+"""Persisted fetch state for incremental syncing and ID-first fetching"""
+
+import time
+from pathlib import Path
+from typing import Optional, Dict, List, Iterable
+
+from ..serialization import read_json, write_json, JSONDecodeError
+from .models import Article
+
+
+class SyncState:
+    """Track the newest item seen per stream (its high-water mark)
+
+    Marks observed during a run are held as pending until commit() is
+    called, so a run that fails before its report ships will fetch the
+    same items again next time.
+    """
+
+    def __init__(self, path: str):
+        self.path = Path(path)
+        self._marks: Optional[Dict[str, Dict[str, int]]] = None
+        self._pending: Dict[str, Dict[str, int]] = {}
+
+    def _load(self) -> Dict[str, Dict[str, int]]:
+        """Load committed marks from disk once per process"""
+        if self._marks is None:
+            self._marks = {}
+            if self.path.exists():
+                try:
+                    self._marks = read_json(self.path)
+                except (JSONDecodeError, OSError):
+                    self._marks = {}
+        return self._marks
+
+    def get_high_water_mark(self, stream_id: str) -> Optional[int]:
+        """Get the committed newest timestampUsec for a stream"""
+        mark = self._load().get(stream_id)
+        return mark["timestamp_usec"] if mark else None
+
+    def filter_new(self, stream_id: str, articles: List[Article]) -> List[Article]:
+        """Drop articles at or below the stream's high-water mark"""
+        high_water_mark = self.get_high_water_mark(stream_id)
+        if high_water_mark is None:
+            return articles
+        return [article for article in articles if article.timestamp_usec > high_water_mark]
+
+    def record(self, stream_id: str, articles: List[Article]) -> None:
+        """Remember the newest article of a fetch as a pending mark"""
+        if not articles:
+            return
+
+        newest = max(articles, key=lambda article: article.timestamp_usec)
+        pending = self._pending.get(stream_id)
+        if pending is None or newest.timestamp_usec > pending["timestamp_usec"]:
+            self._pending[stream_id] = {
+                "timestamp_usec": newest.timestamp_usec,
+                "crawl_time_msec": newest.crawl_time_msec
+            }
+
+    def commit(self) -> None:
+        """Persist pending marks"""
+        if not self._pending:
+            return
+
+        marks = self._load()
+        for stream_id, mark in self._pending.items():
+            current = marks.get(stream_id)
+            if current is None or mark["timestamp_usec"] > current["timestamp_usec"]:
+                marks[stream_id] = mark
+        self._pending = {}
+
+        write_json(self.path, marks)
+
+    def reset(self, stream_id: Optional[str] = None) -> None:
+        """Forget the marks for one stream, or for all streams"""
+        marks = self._load()
+        if stream_id is None:
+            marks.clear()
+        else:
+            marks.pop(stream_id, None)
+        self._pending = {}
+        if self.path.exists():
+            write_json(self.path, marks)
+
+
+class SeenItemStore:
+    """Remember which item IDs earlier runs have already processed
+
+    Like SyncState, IDs are held as pending until commit(). Entries older
+    than max_age_days are pruned on commit so the file stays small.
+    """
+
+    def __init__(self, path: str, max_age_days: int = 14):
+        self.path = Path(path)
+        self.max_age_days = max_age_days
+        self._seen: Optional[Dict[str, float]] = None
+        self._pending: Dict[str, float] = {}
+
+    def _load(self) -> Dict[str, float]:
+        """Load seen IDs from disk once per process"""
+        if self._seen is None:
+            self._seen = {}
+            if self.path.exists():
+                try:
+                    self._seen = read_json(self.path)
+                except (JSONDecodeError, OSError):
+                    self._seen = {}
+        return self._seen
+
+    def __contains__(self, item_id: str) -> bool:
+        return item_id in self._load()
+
+    def filter_unseen(self, item_ids: Iterable[str]) -> List[str]:
+        """Keep only IDs that no committed run has processed"""
+        seen = self._load()
+        return [item_id for item_id in item_ids if item_id not in seen]
+
+    def record(self, item_ids: Iterable[str]) -> None:
+        """Mark IDs as processed by the current run"""
+        now = time.time()
+        for item_id in item_ids:
+            self._pending.setdefault(item_id, now)
+
+    def commit(self) -> None:
+        """Persist pending IDs and prune old entries"""
+        if not self._pending:
+            return
+
+        seen = self._load()
+        seen.update(self._pending)
+        self._pending = {}
+
+        cutoff = time.time() - self.max_age_days * 86400
+        self._seen = {item_id: seen_at for item_id, seen_at in seen.items() if seen_at >= cutoff}
+
+        write_json(self.path, self._seen)
@@ -0,0 +1,127 @@
+"""Incremental JSON decoding for large stream/contents responses"""
+
+import codecs
+import json
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional
+
+WHITESPACE = " \t\n\r"
+DELIMITERS = ",]}" + WHITESPACE
+
+
+class StreamingItemsDecoder:
+    """Decode a top-level JSON object from byte chunks, yielding one array field item by item
+
+    Only the current item and the unread tail of the body are held in
+    memory, so peak usage does not grow with the number of items. All other
+    top-level fields (e.g. "continuation") are collected in ``fields``;
+    fields that appear after the array are available once iteration ends.
+    """
+
+    def __init__(self, chunks: Iterable[bytes], array_key: str = "items",
+                 item_factory: Optional[Callable[[Dict[str, Any]], Any]] = None,
+                 on_close: Optional[Callable[[], None]] = None):
+        self.array_key = array_key
+        self.item_factory = item_factory
+        self.fields: Dict[str, Any] = {}
+        self._chunks = iter(chunks)
+        self._on_close = on_close
+        self._utf8 = codecs.getincrementaldecoder("utf-8")()
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+        self._consumed = False
+
+    @property
+    def continuation(self) -> Optional[str]:
+        """Continuation token of the page, once it has been decoded"""
+        return self.fields.get("continuation")
+
+    def _fill(self) -> bool:
+        """Read the next chunk into the buffer, returning False at end of body"""
+        if self._eof:
+            return False
+
+        # Drop what has already been decoded before growing the buffer
+        if self._pos:
+            self._buffer = self._buffer[self._pos:]
+            self._pos = 0
+
+        for chunk in self._chunks:
+            text = self._utf8.decode(chunk)
+            if text:
+                self._buffer += text
+                return True
+
+        self._buffer += self._utf8.decode(b"", final=True)
+        self._eof = True
+        return False
+
+    def _peek(self) -> str:
+        """Skip whitespace and return the next character"""
+        while True:
+            while self._pos < len(self._buffer) and self._buffer[self._pos] in WHITESPACE:
+                self._pos += 1
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._fill():
+                raise ValueError("Unexpected end of JSON stream")
+
+    def _expect(self, char: str) -> None:
+        if self._peek() != char:
+            raise ValueError(f"Expected '{char}' at offset {self._pos} of JSON stream")
+        self._pos += 1
+
+    def _decode_value(self) -> Any:
+        """Decode the next complete JSON value, reading more chunks as needed"""
+        self._peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                if not self._fill():
+                    raise
+                continue
+
+            # A number is only complete once a delimiter follows it: a chunk
+            # boundary inside "-2.5e10" decodes as a shorter number
+            if isinstance(value, (int, float)) and not self._eof and \
+                    (end == len(self._buffer) or self._buffer[end] not in DELIMITERS):
+                if self._fill():
+                    continue
+
+            self._pos = end
+            return value
+
+    def __iter__(self) -> Iterator[Any]:
+        if self._consumed:
+            raise RuntimeError("StreamingItemsDecoder can only be iterated once")
+        self._consumed = True
+
+        try:
+            self._expect("{")
+            while self._peek() != "}":
+                key = self._decode_value()
+                self._expect(":")
+
+                if key == self.array_key and self._peek() == "[":
+                    self._pos += 1
+                    while self._peek() != "]":
+                        item = self._decode_value()
+                        yield self.item_factory(item) if self.item_factory else item
+                        if self._peek() == ",":
+                            self._pos += 1
+                    self._pos += 1
+                else:
+                    self.fields[key] = self._decode_value()
+
+                if self._peek() == ",":
+                    self._pos += 1
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        """Release the underlying response"""
+        if self._on_close is not None:
+            self._on_close()
+            self._on_close = None
@@ -1,6 +1,5 @@
 """OAuth authentication for Inoreader API"""
 
-import json
 import os
 import webbrowser
 from typing import Optional, Dict, Any
@@ -8,6 +7,8 @@ from urllib.parse import urlencode, parse_qs
 import requests
 import time
 from ..config import Config
+from ..serialization import loads, read_json, write_json, JSONDecodeError
+from ..transport import create_session
 
 try:
     from selenium import webdriver
@@ -40,19 +41,22 @@ class InoreaderOAuth:
     AUTH_URL = f"{BASE_URL}/oauth2/auth"
     TOKEN_URL = f"{BASE_URL}/oauth2/token"
     
-    def __init__(self, config: Config):
+    def __init__(self, config: Config, session: Optional[requests.Session] = None):
         self.config = config
+        self.session = session or create_session(config)
         self.token_file = "inoreader_token.json"
         self.access_token: Optional[str] = None
         self.refresh_token: Optional[str] = None
         
     def get_authorization_url(self, redirect_uri: str = "http://localhost:8080/callback") -> str:
         """Generate authorization URL for OAuth flow"""
+        # Write access is only requested when reported articles are marked as read
+        scope = "read write" if self.config.mark_read_after_report else "read"
         params = {
             "client_id": self.config.inoreader_app_id,
             "redirect_uri": redirect_uri,
             "response_type": "code",
-            "scope": "read",
+            "scope": scope,
             "state": "random_state_string"
         }
         return f"{self.AUTH_URL}?{urlencode(params)}"
@@ -67,10 +71,10 @@ class InoreaderOAuth:
             "grant_type": "authorization_code"
         }
         
-        response = requests.post(self.TOKEN_URL, data=data)
+        response = self.session.post(self.TOKEN_URL, data=data)
         response.raise_for_status()
         
-        token_data = response.json()
+        token_data = loads(response.content)
         self.access_token = token_data["access_token"]
         self.refresh_token = token_data.get("refresh_token")
         
@@ -92,10 +96,10 @@ class InoreaderOAuth:
         }
         
         try:
-            response = requests.post(self.TOKEN_URL, data=data, timeout=30)
+            response = self.session.post(self.TOKEN_URL, data=data, timeout=30)
             response.raise_for_status()
             
-            token_data = response.json()
+            token_data = loads(response.content)
             self.access_token = token_data["access_token"]
             if "refresh_token" in token_data:
                 self.refresh_token = token_data["refresh_token"]
@@ -124,8 +128,7 @@ class InoreaderOAuth:
     
     def save_tokens(self, token_data: Dict[str, Any]) -> None:
         """Save tokens to file"""
-        with open(self.token_file, "w") as f:
-            json.dump(token_data, f)
+        write_json(self.token_file, token_data)
     
     def load_tokens(self) -> bool:
         """Load tokens from file"""
@@ -133,14 +136,13 @@ class InoreaderOAuth:
             return False
         
         try:
-            with open(self.token_file, "r") as f:
-                token_data = json.load(f)
+            token_data = read_json(self.token_file)
             
             self.access_token = token_data.get("access_token")
             self.refresh_token = token_data.get("refresh_token")
             
             return True
-        except (json.JSONDecodeError, KeyError):
+        except (JSONDecodeError, OSError, KeyError):
             return False
     
     def is_authenticated(self) -> bool:
@@ -219,7 +221,7 @@ class InoreaderOAuth:
         try:
             # Make a simple API call to test the token
             headers = self.get_auth_headers()
-            response = requests.get(
+            response = self.session.get(
                 "https://www.inoreader.com/reader/api/0/user-info",
                 headers=headers,
                 timeout=10
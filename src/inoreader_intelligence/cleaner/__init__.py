@@ -0,0 +1,7 @@
+"""Article content cleaning module"""
+
+from .cleaner import ContentCleaner
+from .dedupe import Deduplicator
+from .extract import html_to_text
+
+__all__ = ["ContentCleaner", "Deduplicator", "html_to_text"]
@@ -0,0 +1,101 @@
+"""Readability-style removal of page chrome around the article body"""
+
+import re
+
+from lxml import etree
+
+# Elements that are page chrome whatever their content
+CHROME_TAGS = ("nav", "aside", "footer", "form", "button", "select", "input", "textarea")
+
+# Containers scored by their text and link density
+CONTAINER_TAGS = frozenset(("div", "section", "ul", "ol", "table", "header", "p"))
+
+NEGATIVE_PATTERN = re.compile(
+    r"share|social|related|recommend|comment(?!ary)|cookie|consent|gdpr|subscribe|newsletter|signup|"
+    r"promo|sponsor|advert|\bads?\b|\bad-|banner|breadcrumb|menu|navbar|sidebar|popup|modal|"
+    r"widget|outbrain|taboola|footer|masthead|byline-share|print|follow",
+    re.IGNORECASE
+)
+POSITIVE_PATTERN = re.compile(r"article|body|content|entry|main|post|story|text", re.IGNORECASE)
+
+# A block whose text is mostly link text is a link list (related stories, tags, menus)
+MAX_LINK_DENSITY = 0.5
+# Short blocks tolerate less link text ("Read more: ...", "Follow us on ...")
+SHORT_BLOCK_CHARS = 200
+MAX_SHORT_BLOCK_LINK_DENSITY = 0.25
+# Give up and keep the page as-is if stripping would remove almost everything
+MIN_KEPT_SHARE = 0.2
+
+
+def _text_length(element: etree._Element) -> int:
+    return len(element.text_content().strip())
+
+
+def _link_density(element: etree._Element, text_length: int) -> float:
+    if not text_length:
+        return 0.0
+    link_chars = sum(_text_length(link) for link in element.iter("a"))
+    return link_chars / text_length
+
+
+def _class_weight(element: etree._Element) -> int:
+    """-1 for boilerplate-looking class/id names, +1 for content-looking ones"""
+    names = f"{element.get('class', '')} {element.get('id', '')}"
+    if not names.strip():
+        return 0
+    if POSITIVE_PATTERN.search(names):
+        return 1
+    return -1 if NEGATIVE_PATTERN.search(names) else 0
+
+
+def _is_boilerplate(element: etree._Element) -> bool:
+    weight = _class_weight(element)
+    if weight < 0:
+        return True
+    if element.find(".//a") is None:
+        return False
+    if weight > 0 or element.tag == "p":
+        # Paragraphs and content containers are only dropped if they are nothing but links
+        text_length = _text_length(element)
+        return bool(text_length) and _link_density(element, text_length) > 0.9
+
+    text_length = _text_length(element)
+    if not text_length:
+        return False
+    link_density = _link_density(element, text_length)
+    if link_density > MAX_LINK_DENSITY:
+        return True
+    return text_length < SHORT_BLOCK_CHARS and link_density > MAX_SHORT_BLOCK_LINK_DENSITY
+
+
+def strip_boilerplate(root: etree._Element) -> int:
+    """Remove navigation, share widgets, link lists and similar chrome from a parsed page
+
+    Blocks are dropped by tag, by class/id name and by link density. The
+    tree is left untouched if that would remove all but a small share of its
+    text. Returns the number of characters of text removed.
+    """
+    original_length = _text_length(root)
+    if not original_length:
+        return 0
+
+    candidates = [element for element in root.iter()
+                  if element is not root and isinstance(element.tag, str)
+                  and (element.tag in CHROME_TAGS or element.tag in CONTAINER_TAGS)]
+
+    doomed = []
+    doomed_set = set()
+    for element in candidates:
+        if any(ancestor in doomed_set for ancestor in element.iterancestors()):
+            continue
+        if element.tag in CHROME_TAGS or _is_boilerplate(element):
+            doomed.append(element)
+            doomed_set.add(element)
+
+    removed = sum(_text_length(element) for element in doomed)
+    if original_length - removed < original_length * MIN_KEPT_SHARE:
+        return 0
+
+    for element in doomed:
+        element.drop_tree()
+    return removed
@@ -0,0 +1,87 @@
+"""Article cleaning stage"""
+
+import os
+import time
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import List, Tuple
+
+from ..api.models import Article
+from ..config import Config
+from ..metrics import run_metrics
+from .extract import clean_html_pair
+
+# Rough size of an OpenAI token in English text
+CHARS_PER_TOKEN = 4
+
+
+class ContentCleaner:
+    """Turn article HTML into plain text, spreading large runs over a process pool"""
+
+    # Below this many articles, starting worker processes costs more than it saves
+    PARALLEL_THRESHOLD = 64
+    # Worker processes used when CLEANING_WORKERS is 0
+    DEFAULT_MAX_WORKERS = 4
+
+    def __init__(self, config: Config):
+        self.config = config
+        self.max_input_chars = config.cleaning_max_input_chars
+        self.workers = config.cleaning_workers or min(os.cpu_count() or 1, self.DEFAULT_MAX_WORKERS)
+        self.remove_boilerplate = config.strip_boilerplate
+
+    def clean_article(self, article: Article) -> Article:
+        """Clean a single article in place"""
+        result = clean_html_pair((article.content, article.summary), self.max_input_chars, self.remove_boilerplate)
+        return self._apply(article, result)
+
+    def clean_articles(self, articles: List[Article]) -> List[Article]:
+        """Clean many articles in place, keeping their order"""
+        started = time.perf_counter()
+        pairs = [(article.content, article.summary) for article in articles]
+        clean = partial(clean_html_pair, max_input_chars=self.max_input_chars,
+                        remove_boilerplate=self.remove_boilerplate)
+
+        if self.workers > 1 and len(articles) >= self.PARALLEL_THRESHOLD:
+            try:
+                cleaned = self._clean_parallel(clean, pairs)
+            except (OSError, RuntimeError) as e:
+                print(f"⚠️  Parallel cleaning unavailable ({e}), cleaning serially")
+                cleaned = [clean(pair) for pair in pairs]
+        else:
+            cleaned = [clean(pair) for pair in pairs]
+
+        for article, result in zip(articles, cleaned):
+            self._apply(article, result)
+
+        content_chars = sum(len(article.content or "") for article in articles)
+        run_metrics.increment("cleaning.articles", len(articles))
+        run_metrics.increment("cleaning.seconds", time.perf_counter() - started)
+        run_metrics.increment("cleaning.inputs_truncated", self._count_truncated(pairs))
+        run_metrics.increment("cleaning.boilerplate_chars_removed", sum(result[2] for result in cleaned))
+        run_metrics.increment("cleaning.content_chars", content_chars)
+        run_metrics.increment("cleaning.content_tokens_estimated", content_chars // CHARS_PER_TOKEN)
+        return articles
+
+    def _clean_parallel(self, clean, pairs: List[Tuple[str, str]]) -> List[Tuple[str, str, int]]:
+        workers = min(self.workers, len(pairs))
+        chunksize = max(1, len(pairs) // (workers * 4))
+        # Reports run on scheduler threads, and forking a threaded process can
+        # copy locks held by other threads into the children, so spawn instead
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context) as executor:
+            return list(executor.map(clean, pairs, chunksize=chunksize))
+
+    def _count_truncated(self, pairs: List[Tuple[str, str]]) -> int:
+        if not self.max_input_chars:
+            return 0
+        return sum(1 for pair in pairs for text in pair if text and len(text) > self.max_input_chars)
+
+    @staticmethod
+    def _apply(article: Article, result: Tuple[str, str, int]) -> Article:
+        content, summary, _ = result
+        if article.content:
+            article.content = content
+        if article.summary:
+            article.summary = summary
+        return article
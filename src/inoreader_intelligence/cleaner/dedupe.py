@@ -0,0 +1,155 @@
+"""Near-duplicate article detection with MinHash signatures and LSH"""
+
+import random
+import re
+import time
+import zlib
+from collections import defaultdict
+from typing import List, Dict, Set, Tuple
+
+from ..api.models import Article
+from ..config import Config
+from ..metrics import run_metrics
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+WORD_PATTERN = re.compile(r"\w+")
+
+# Hashes are reduced modulo a 31-bit prime so a * x + b fits in 64 bits
+PRIME = (1 << 31) - 1
+
+SHINGLE_SIZE = 3  # Words per shingle
+MIN_WORDS = 20  # Shorter texts have too few shingles to compare, so they are never merged
+MAX_WORDS = 1000  # Wire copies agree from the start, so later text adds little
+BANDS = 16
+ROWS = 4  # Per band; pairs above roughly (1 / BANDS) ** (1 / ROWS) = 0.5 similarity become candidates
+
+
+def shingles(text: str, size: int = SHINGLE_SIZE) -> Set[int]:
+    """Hashed overlapping word n-grams of a text"""
+    return word_shingles(WORD_PATTERN.findall(text.lower()), size)
+
+
+def word_shingles(words: List[str], size: int = SHINGLE_SIZE) -> Set[int]:
+    """Hashed overlapping n-grams of a lowercased word list"""
+    words = words[:MAX_WORDS]
+    if len(words) < size:
+        return {zlib.crc32(" ".join(words).encode("utf-8")) & PRIME} if words else set()
+    return {zlib.crc32(" ".join(words[i:i + size]).encode("utf-8")) & PRIME
+            for i in range(len(words) - size + 1)}
+
+
+class MinHasher:
+    """MinHash signatures from random linear hash functions"""
+
+    def __init__(self, num_perm: int = BANDS * ROWS, seed: int = 1):
+        rng = random.Random(seed)
+        self.num_perm = num_perm
+        self.a = [rng.randrange(1, PRIME) for _ in range(num_perm)]
+        self.b = [rng.randrange(0, PRIME) for _ in range(num_perm)]
+        if NUMPY_AVAILABLE:
+            self._a = np.array(self.a, dtype=np.uint64)[:, None]
+            self._b = np.array(self.b, dtype=np.uint64)[:, None]
+
+    def signature(self, shingle_set: Set[int]) -> Tuple[int, ...]:
+        """Minimum of each hash function over the shingles"""
+        if not shingle_set:
+            return ()
+        if NUMPY_AVAILABLE:
+            values = np.fromiter(shingle_set, dtype=np.uint64, count=len(shingle_set))
+            return tuple(((self._a * values + self._b) % PRIME).min(axis=1).tolist())
+        return tuple(min((a * value + b) % PRIME for value in shingle_set) for a, b in zip(self.a, self.b))
+
+
+def similarity(first: Tuple[int, ...], second: Tuple[int, ...]) -> float:
+    """Estimated Jaccard similarity of two signatures"""
+    if not first or not second:
+        return 0.0
+    return sum(x == y for x, y in zip(first, second)) / len(first)
+
+
+def near_duplicate_groups(texts: List[str], threshold: float = 0.7,
+                          hasher: "MinHasher" = None) -> List[List[int]]:
+    """Group indices of texts whose estimated similarity reaches threshold
+
+    Signatures are split into bands; texts sharing any band become
+    candidates, and candidates whose signatures agree closely enough are
+    merged with union-find. Texts under MIN_WORDS words are left on their
+    own. Groups come back ordered by their first index, singletons included.
+    """
+    hasher = hasher or MinHasher()
+    rows = hasher.num_perm // BANDS
+
+    signatures = []
+    for text in texts:
+        words = WORD_PATTERN.findall(text.lower())
+        # Two items titled "Live updates" would otherwise share every shingle
+        signatures.append(hasher.signature(word_shingles(words)) if len(words) >= MIN_WORDS else ())
+
+    parent = list(range(len(texts)))
+
+    def find(index: int) -> int:
+        while parent[index] != index:
+            parent[index] = parent[parent[index]]
+            index = parent[index]
+        return index
+
+    buckets: Dict[Tuple[int, Tuple[int, ...]], List[int]] = defaultdict(list)
+    for index, signature in enumerate(signatures):
+        if not signature:
+            continue
+        for band in range(BANDS):
+            buckets[(band, signature[band * rows:(band + 1) * rows])].append(index)
+
+    checked = set()
+    for members in buckets.values():
+        for position, first in enumerate(members):
+            for second in members[position + 1:]:
+                if (first, second) in checked:
+                    continue
+                checked.add((first, second))
+                if find(first) != find(second) and similarity(signatures[first], signatures[second]) >= threshold:
+                    parent[max(find(first), find(second))] = min(find(first), find(second))
+
+    groups: Dict[int, List[int]] = defaultdict(list)
+    for index in range(len(texts)):
+        groups[find(index)].append(index)
+    return sorted(groups.values())
+
+
+class Deduplicator:
+    """Collapse copies of the same story into one representative article
+
+    The representative is the copy with the most text; the other copies are
+    kept on its duplicates list so reports can show where else the story ran.
+    """
+
+    def __init__(self, config: Config):
+        self.threshold = config.dedupe_threshold
+        self.hasher = MinHasher()
+
+    def dedupe(self, articles: List[Article]) -> List[Article]:
+        """Return one article per story, in order of each story's first appearance"""
+        started = time.perf_counter()
+        texts = [f"{article.title} {article.content or article.summary or ''}" for article in articles]
+
+        representatives = []
+        clusters = 0
+        for group in near_duplicate_groups(texts, self.threshold, self.hasher):
+            members = [articles[index] for index in group]
+            best = max(range(len(group)), key=lambda n: len(texts[group[n]]))
+            representative = members[best]
+            if len(members) > 1:
+                clusters += 1
+                representative.duplicates = members[:best] + members[best + 1:]
+            representatives.append(representative)
+
+        run_metrics.increment("dedupe.articles", len(articles))
+        run_metrics.increment("dedupe.clusters", clusters)
+        run_metrics.increment("dedupe.duplicates_removed", len(articles) - len(representatives))
+        run_metrics.increment("dedupe.seconds", time.perf_counter() - started)
+        return representatives
@@ -0,0 +1,93 @@
+"""Fast HTML to text extraction with lxml"""
+
+import re
+from html import unescape
+from typing import Optional, Tuple
+
+import lxml.html
+from lxml import etree
+from bs4 import BeautifulSoup
+
+from .boilerplate import strip_boilerplate
+
+# Elements whose text never belongs in the article body
+DROPPED_TAGS = ("script", "style", "noscript", "template", "iframe", "svg", "head")
+
+# Elements that end a line of text
+BLOCK_TAGS = frozenset((
+    "p", "div", "br", "li", "ul", "ol", "h1", "h2", "h3", "h4", "h5", "h6",
+    "blockquote", "pre", "table", "tr", "section", "article", "header", "footer",
+    "aside", "nav", "figure", "figcaption", "dd", "dt", "hr"
+))
+
+INLINE_SPACE = re.compile(r"[^\S\n]+")
+BLANK_LINES = re.compile(r"\n\s*\n+")
+
+
+def normalize_whitespace(text: str) -> str:
+    """Collapse runs of spaces and blank lines"""
+    text = INLINE_SPACE.sub(" ", text)
+    text = BLANK_LINES.sub("\n", text.replace(" \n", "\n").replace("\n ", "\n"))
+    return text.strip()
+
+
+def parse_html(html: str) -> Optional[etree._Element]:
+    """Parse an HTML fragment or document, returning None if lxml can't"""
+    try:
+        return lxml.html.fromstring(html)
+    except (etree.ParserError, ValueError):
+        return None
+
+
+def element_text(root: etree._Element) -> str:
+    """Visible text of a parsed tree, with block elements on their own lines"""
+    for element in root.iter():
+        if isinstance(element.tag, str) and element.tag in BLOCK_TAGS:
+            element.tail = "\n" + (element.tail or "")
+
+    return normalize_whitespace(root.text_content())
+
+
+def extract_text(html: Optional[str], max_input_chars: int = 0,
+                 remove_boilerplate: bool = False) -> Tuple[str, int]:
+    """Extract readable text from an HTML string
+
+    Input longer than max_input_chars (when set) is cut before parsing, so a
+    single huge page can't stall the run. Plain text skips the parser. With
+    remove_boilerplate, navigation, share widgets and link lists are dropped
+    too. Returns the text and the number of boilerplate characters removed.
+    """
+    if not html:
+        return "", 0
+
+    if max_input_chars and len(html) > max_input_chars:
+        html = html[:max_input_chars]
+
+    if "<" not in html:
+        return normalize_whitespace(unescape(html)), 0
+
+    root = parse_html(html)
+    if root is None:
+        return BeautifulSoup(html, "html.parser").get_text().strip(), 0
+
+    etree.strip_elements(root, *DROPPED_TAGS, with_tail=False)
+    etree.strip_elements(root, etree.Comment, etree.ProcessingInstruction, with_tail=False)
+    removed = strip_boilerplate(root) if remove_boilerplate else 0
+    return element_text(root), removed
+
+
+def html_to_text(html: Optional[str], max_input_chars: int = 0, remove_boilerplate: bool = False) -> str:
+    """Extract readable text from an HTML string"""
+    return extract_text(html, max_input_chars, remove_boilerplate)[0]
+
+
+def clean_html_pair(pair: Tuple[Optional[str], Optional[str]], max_input_chars: int = 0,
+                    remove_boilerplate: bool = False) -> Tuple[str, str, int]:
+    """Clean an article's (content, summary); a top-level function so process pools can pickle it
+
+    Boilerplate removal only applies to the content. Returns the cleaned
+    content and summary and the boilerplate characters removed.
+    """
+    content, summary = pair
+    content, removed = extract_text(content, max_input_chars, remove_boilerplate)
+    return content, html_to_text(summary, max_input_chars), removed
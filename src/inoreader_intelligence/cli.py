@@ -6,14 +6,21 @@ from rich.table import Table
 from rich.prompt import Prompt, Confirm
 from rich.progress import Progress, TaskID
 from typing import Optional, List
+from datetime import datetime
+from pathlib import Path
 import sys
 
 from .config import Config
 from .api import InoreaderClient
-from .summarizer import SummarizationEngine
+from .cleaner import ContentCleaner, Deduplicator
+from .fulltext import FullTextFetcher
+from .summarizer import SummarizationEngine, EnrichmentStore
+from .summarizer.classifier import MODEL_FILENAME, NUMPY_AVAILABLE, train_from_examples
+from .summarizer.store import STORE_FILENAME
 from .reporter import ReportGenerator
 from .delivery import EmailDelivery
 from .scheduler import ReportScheduler
+from .metrics import run_metrics
 
 app = typer.Typer(help="Inoreader Intelligence Reports CLI")
 console = Console()
@@ -50,13 +57,15 @@ def setup():
 
 
 @app.command()
-def feeds():
+def feeds(
+    refresh: bool = typer.Option(False, "--refresh", help="Revalidate the cached feed list with Inoreader")
+):
     """List all subscribed feeds"""
     try:
         config = Config.from_env()
         client = InoreaderClient(config)
         
-        feeds = client.get_subscription_list()
+        feeds = client.get_subscription_list(use_cache=not refresh)
         
         if not feeds:
             console.print("No feeds found", style="yellow")
@@ -78,13 +87,15 @@ def feeds():
 
 
 @app.command()
-def tags():
+def tags(
+    refresh: bool = typer.Option(False, "--refresh", help="Revalidate the cached tag list with Inoreader")
+):
     """List all tags/folders"""
     try:
         config = Config.from_env()
         client = InoreaderClient(config)
         
-        tags = client.get_tag_list()
+        tags = client.get_tag_list(use_cache=not refresh)
         
         if not tags:
             console.print("No tags found", style="yellow")
@@ -105,6 +116,30 @@ def tags():
         console.print(f"❌ Error: {e}", style="bold red")
 
 
+@app.command()
+def quota():
+    """Show today's Inoreader API quota usage"""
+    try:
+        config = Config.from_env()
+        client = InoreaderClient(config)
+        
+        table = Table(title="Inoreader API Quota")
+        table.add_column("Zone", style="cyan")
+        table.add_column("Used", style="magenta")
+        table.add_column("Limit", style="green")
+        table.add_column("Resets", style="dim")
+        
+        for zone, budget in sorted(client.quota.status().items()):
+            limit = str(budget["limit"]) if budget["limit"] else "Unknown"
+            resets = datetime.fromtimestamp(budget["reset_at"]).strftime("%Y-%m-%d %H:%M")
+            table.add_row(f"Zone {zone}", str(budget["usage"]), limit, resets)
+        
+        console.print(table)
+        
+    except Exception as e:
+        console.print(f"❌ Error: {e}", style="bold red")
+
+
 @app.command()
 def generate(
     format: str = typer.Option("html", help="Output format: html, pdf, markdown"),
@@ -112,18 +147,30 @@ def generate(
     send_email: bool = typer.Option(False, "--email", help="Send report via email"),
     focus_only: bool = typer.Option(True, "--focus/--all", help="Use Focus folder only or all articles"),
     max_articles: int = typer.Option(100, "--max-articles", help="Maximum number of articles to process"),
-    paginate: bool = typer.Option(False, "--paginate", help="Use pagination to fetch all available articles")
+    paginate: bool = typer.Option(False, "--paginate", help="Use pagination to fetch all available articles"),
+    incremental: Optional[bool] = typer.Option(None, "--incremental/--full", help="Only fetch articles newer than the last run (defaults to INCREMENTAL_SYNC)"),
+    mark_read: Optional[bool] = typer.Option(None, "--mark-read/--no-mark-read", help="Mark reported articles as read in Inoreader (defaults to MARK_READ_AFTER_REPORT)"),
+    full_text: Optional[bool] = typer.Option(None, "--full-text/--no-full-text", help="Fetch original pages for snippet-only articles (defaults to FULLTEXT_ENABLED)"),
+    dry_run: bool = typer.Option(False, "--dry-run", help="Show the projected OpenAI token spend and stop before any request")
 ):
     """Generate a report now"""
     
     console.print("🔄 Generating intelligence report...", style="bold blue")
+    run_metrics.reset()
     
     if paginate:
         console.print(f"📄 Pagination enabled - fetching up to {max_articles} articles", style="blue")
     
     try:
         config = Config.from_env()
+        if mark_read is not None:
+            config.mark_read_after_report = mark_read
+        if full_text is not None:
+            config.fulltext_enabled = full_text
         client = InoreaderClient(config)
+        cleaner = ContentCleaner(config)
+        deduplicator = Deduplicator(config)
+        fulltext = FullTextFetcher(config)
         summarizer = SummarizationEngine(config)
         reporter = ReportGenerator(config)
         delivery = EmailDelivery(config)
@@ -136,23 +183,56 @@ def generate(
                 articles = client.get_focus_folder_articles(
                     count=max_articles,
                     use_pagination=paginate,
-                    max_total_articles=max_articles
+                    max_total_articles=max_articles,
+                    incremental=incremental
                 )
             else:
-                articles = client.get_todays_articles(tag_ids)
+                articles = client.get_todays_articles(tag_ids, incremental=incremental)
             progress.update(task, advance=20)
             
+            if not articles and client.focus_caught_up:
+                console.print("✅ No new articles since the last run", style="green")
+                return
+            
             if not articles:
                 console.print("❌ No articles found", style="yellow")
                 return
             
+            if config.fulltext_enabled:
+                progress.update(task, description="Fetching full text...")
+                fulltext.enrich(articles)
+            
             progress.update(task, description="Cleaning content...", advance=10)
             
             # Clean content
-            cleaned_articles = []
-            for article in articles:
-                cleaned = client.clean_article_content(article)
-                cleaned_articles.append(cleaned)
+            cleaned_articles = cleaner.clean_articles(articles)
+            
+            # Collapse copies of the same story
+            if config.dedupe_articles:
+                cleaned_articles = deduplicator.dedupe(cleaned_articles)
+            
+            if dry_run:
+                progress.update(task, description="Projecting token spend...", completed=100)
+                projection = summarizer.project_spend(cleaned_articles)
+                
+                table = Table(title=f"Projected OpenAI Spend ({config.openai_model}, upper bounds)")
+                table.add_column("Stage", style="cyan")
+                table.add_column("Requests", style="magenta")
+                table.add_column("Prompt Tokens", style="green")
+                table.add_column("Completion Tokens", style="green")
+                table.add_column("Cost (USD)", style="yellow")
+                
+                for stage, totals in projection.items():
+                    table.add_row(stage, str(totals["requests"]), str(totals["prompt_tokens"]),
+                                  str(totals["completion_tokens"]), f"{totals['cost']:.4f}")
+                table.add_row("total", *(str(sum(totals[key] for totals in projection.values()))
+                                         for key in ("requests", "prompt_tokens", "completion_tokens")),
+                              f"{sum(totals['cost'] for totals in projection.values()):.4f}", style="bold")
+                
+                progress.console.print(table)
+                if not projection:
+                    progress.console.print("No OpenAI requests would be made", style="yellow")
+                return
             
             progress.update(task, description="Categorizing articles...", advance=20)
             
@@ -178,9 +258,14 @@ def generate(
             # Generate report
             report_path = reporter.generate_report(categorized, theme_summaries, format)
             
+            # The fetched articles are now in a report, so the next run can skip them
+            client.commit_sync_state()
+            client.mark_reported_as_read(articles)
+            
             progress.update(task, description="Complete!", advance=5)
         
         console.print(f"✅ Report generated: {report_path}", style="bold green")
+        run_metrics.print_summary()
         
         # Send email if requested
         if send_email:
@@ -228,6 +313,58 @@ def schedule(
         console.print(f"❌ Error: {e}", style="bold red")
 
 
+@app.command("train-classifier")
+def train_classifier(
+    holdout: float = typer.Option(0.2, help="Share of labelled articles held out to measure accuracy"),
+    confidence: Optional[float] = typer.Option(None, help="Confidence threshold to report (defaults to CLASSIFIER_CONFIDENCE)")
+):
+    """Retrain the local theme classifier on stored AI categorizations"""
+    
+    console.print("🧠 Training local theme classifier...", style="bold blue")
+    
+    try:
+        config = Config.from_env()
+        if not NUMPY_AVAILABLE:
+            console.print("❌ NumPy is required: pip install numpy", style="bold red")
+            return
+        
+        store = EnrichmentStore(str(Path(config.cache_dir) / STORE_FILENAME),
+                                max_entries=config.enrichment_store_max_entries,
+                                max_age_days=config.enrichment_store_max_age_days)
+        examples = store.category_examples()
+        store.close()
+        
+        threshold = config.classifier_confidence if confidence is None else confidence
+        classifier, report = train_from_examples(examples, holdout, threshold)
+        
+        table = Table(title="Labelled Articles")
+        table.add_column("Theme", style="cyan")
+        table.add_column("Articles", style="green")
+        for label, count in report["labels"].items():
+            table.add_row(label, str(count))
+        console.print(table)
+        
+        if "accuracy" in report:
+            console.print(f"📊 Holdout accuracy vs AI labels: {report['accuracy']:.1%} "
+                          f"({report['holdout']} articles, trained on {report['train']})")
+            confident_accuracy = report["confident_accuracy"]
+            console.print(f"📊 At confidence ≥ {threshold:.2f}: {report['confident_share']:.1%} of articles "
+                          f"handled locally, {'n/a' if confident_accuracy is None else f'{confident_accuracy:.1%}'} "
+                          f"accurate")
+        else:
+            console.print("⚠️  Too few labelled articles to hold any out for evaluation", style="yellow")
+        
+        path = Path(config.cache_dir) / MODEL_FILENAME
+        classifier.save(str(path))
+        console.print(f"✅ Saved classifier ({len(classifier.labels)} classes, {len(classifier.terms)} terms, "
+                      f"{report['examples']} articles) to {path}", style="green")
+        if not config.local_classifier:
+            console.print("Set LOCAL_CLASSIFIER=true to use it when categorizing", style="dim")
+    
+    except Exception as e:
+        console.print(f"❌ Error: {e}", style="bold red")
+
+
 @app.command()
 def test():
     """Test the system with current configuration"""
@@ -8,6 +8,11 @@ from dotenv import load_dotenv
 load_dotenv()
 
 
+def _env(name: str, default: str) -> str:
+    """An environment variable, treating an empty value like an unset one"""
+    return os.getenv(name) or default
+
+
 @dataclass
 class Config:
     """Application configuration"""
@@ -22,6 +27,20 @@ class Config:
     # OpenAI Configuration
     openai_api_key: Optional[str] = None
     openai_model: str = "gpt-4"
+    openai_base_url: Optional[str] = None  # OpenAI-compatible endpoint; None uses api.openai.com
+    openai_max_concurrency: int = 8  # Parallel chat completions when categorizing articles
+    categorize_batch_size: int = 1  # Articles per categorization request; 1 sends one request per article
+    combined_enrichment: bool = False  # Categorize and summarize each article in the same request
+    enrichment_store: bool = True  # Reuse stored categories and summaries of unchanged articles
+    enrichment_store_max_entries: int = 50000
+    enrichment_store_max_age_days: int = 30
+    local_classifier: bool = False  # Categorize confidently with the trained local classifier before using AI
+    classifier_confidence: float = 0.8  # Local predictions below this confidence go to OpenAI
+    article_max_tokens: int = 1000  # Article text sent for summarization is cut to this many tokens
+    category_max_tokens: int = 250  # Article text sent for categorization is cut to this many tokens
+    theme_prompt_max_tokens: int = 4000  # Article summaries packed into one theme summary prompt
+    run_max_tokens: int = 0  # Prompt plus completion tokens per run (0 = no limit)
+    run_max_cost: float = 0.0  # Estimated OpenAI cost per run in USD (0 = no limit)
     
     # Report Configuration
     report_title: str = "Daily Intelligence Report"
@@ -31,6 +50,53 @@ class Config:
     use_pagination: bool = False
     content_chunk_limit: int = 400  # Character limit for content chunks
     
+    # API Fetching Configuration
+    max_concurrent_requests: int = 4  # Parallel stream fetches in the async client
+    incremental_sync: bool = False  # Only fetch items newer than the last committed run
+    id_first_fetch: bool = False  # Fetch item IDs first, then content for unseen IDs only
+    item_contents_batch_size: int = 250  # Item IDs per stream/items/contents request
+    seen_items_max_age_days: int = 14
+    streaming_decode: bool = False  # Decode stream/contents items incrementally to keep memory flat
+    exclude_read: bool = False  # Skip items already marked read (xt=read) when fetching streams
+    mark_read_after_report: bool = False  # Mark reported articles as read in Inoreader
+    edit_tag_batch_size: int = 250  # Item IDs per edit-tag request
+    
+    # Content Cleaning Configuration
+    cleaning_workers: int = 0  # Worker processes for HTML cleaning (0 = one per CPU up to 4, 1 = no pool)
+    cleaning_max_input_chars: int = 500000  # HTML beyond this is cut before parsing
+    strip_boilerplate: bool = True  # Drop navigation, share widgets and link lists from article content
+    dedupe_articles: bool = True  # Collapse copies of the same story from different feeds
+    dedupe_threshold: float = 0.7  # Estimated shingle similarity at which articles count as copies
+    
+    # Full-Text Fetching Configuration
+    fulltext_enabled: bool = False  # Fetch original pages for articles with only a feed snippet
+    fulltext_min_chars: int = 500  # Articles with less text than this are treated as snippets
+    fulltext_max_concurrency: int = 8
+    fulltext_per_host_concurrency: int = 2
+    fulltext_host_delay: float = 1.0  # Minimum seconds between requests to the same host
+    fulltext_time_budget: float = 60.0  # Seconds the whole full-text stage may take
+    fulltext_cache_max_mb: int = 200
+    fulltext_cache_max_age_days: int = 30
+    
+    # Cache Configuration
+    cache_dir: str = ".cache"
+    metadata_cache_ttl: int = 86400  # Seconds before tag/subscription lists are revalidated
+    quota_metadata_reserve: float = 0.2  # Share of the daily API quota held back for content fetches
+    
+    # Retry Configuration
+    api_max_retries: int = 4
+    api_backoff_base: float = 1.0  # Seconds, doubled on every retry
+    api_backoff_max: float = 60.0
+    api_request_deadline: float = 120.0  # Seconds a request may take, retries included
+    circuit_breaker_threshold: int = 5  # Consecutive failures before requests fail fast
+    circuit_breaker_reset: float = 300.0  # Seconds before a trial request is allowed
+    
+    # HTTP Transport Configuration
+    http_connect_timeout: float = 10.0
+    http_read_timeout: float = 60.0
+    http_pool_connections: int = 4  # Hosts kept in the connection pool
+    http_pool_maxsize: int = 10  # Keep-alive connections per host
+    
     # Scheduling Configuration
     report_time: str = "06:00"  # 6 AM SGT daily
     timezone: str = "Asia/Singapore"
@@ -49,10 +115,59 @@ class Config:
             inoreader_app_key=os.getenv("INOREADER_APP_KEY", ""),
             email_recipients=email_recipients,
             openai_api_key=os.getenv("OPENAI_API_KEY"),
-            openai_model=os.getenv("OPENAI_MODEL", "gpt-4"),
-            max_daily_articles=int(os.getenv("MAX_DAILY_ARTICLES", "100")),
-            use_pagination=os.getenv("USE_PAGINATION", "false").lower() == "true",
-            content_chunk_limit=int(os.getenv("CONTENT_CHUNK_LIMIT", "400")),
+            openai_model=_env("OPENAI_MODEL", "gpt-4"),
+            openai_base_url=os.getenv("OPENAI_BASE_URL") or None,
+            openai_max_concurrency=int(_env("OPENAI_MAX_CONCURRENCY", "8")),
+            categorize_batch_size=int(_env("CATEGORIZE_BATCH_SIZE", "1")),
+            combined_enrichment=_env("COMBINED_ENRICHMENT", "false").lower() == "true",
+            enrichment_store=_env("ENRICHMENT_STORE", "true").lower() == "true",
+            enrichment_store_max_entries=int(_env("ENRICHMENT_STORE_MAX_ENTRIES", "50000")),
+            enrichment_store_max_age_days=int(_env("ENRICHMENT_STORE_MAX_AGE_DAYS", "30")),
+            local_classifier=_env("LOCAL_CLASSIFIER", "false").lower() == "true",
+            classifier_confidence=float(_env("CLASSIFIER_CONFIDENCE", "0.8")),
+            article_max_tokens=int(_env("ARTICLE_MAX_TOKENS", "1000")),
+            category_max_tokens=int(_env("CATEGORY_MAX_TOKENS", "250")),
+            theme_prompt_max_tokens=int(_env("THEME_PROMPT_MAX_TOKENS", "4000")),
+            run_max_tokens=int(_env("RUN_MAX_TOKENS", "0")),
+            run_max_cost=float(_env("RUN_MAX_COST", "0")),
+            max_daily_articles=int(_env("MAX_DAILY_ARTICLES", "100")),
+            use_pagination=_env("USE_PAGINATION", "false").lower() == "true",
+            content_chunk_limit=int(_env("CONTENT_CHUNK_LIMIT", "400")),
+            max_concurrent_requests=int(_env("MAX_CONCURRENT_REQUESTS", "4")),
+            incremental_sync=_env("INCREMENTAL_SYNC", "false").lower() == "true",
+            id_first_fetch=_env("ID_FIRST_FETCH", "false").lower() == "true",
+            item_contents_batch_size=int(_env("ITEM_CONTENTS_BATCH_SIZE", "250")),
+            seen_items_max_age_days=int(_env("SEEN_ITEMS_MAX_AGE_DAYS", "14")),
+            streaming_decode=_env("STREAMING_DECODE", "false").lower() == "true",
+            exclude_read=_env("EXCLUDE_READ", "false").lower() == "true",
+            mark_read_after_report=_env("MARK_READ_AFTER_REPORT", "false").lower() == "true",
+            edit_tag_batch_size=int(_env("EDIT_TAG_BATCH_SIZE", "250")),
+            cleaning_workers=int(_env("CLEANING_WORKERS", "0")),
+            cleaning_max_input_chars=int(_env("CLEANING_MAX_INPUT_CHARS", "500000")),
+            strip_boilerplate=_env("STRIP_BOILERPLATE", "true").lower() == "true",
+            dedupe_articles=_env("DEDUPE_ARTICLES", "true").lower() == "true",
+            dedupe_threshold=float(_env("DEDUPE_THRESHOLD", "0.7")),
+            fulltext_enabled=_env("FULLTEXT_ENABLED", "false").lower() == "true",
+            fulltext_min_chars=int(_env("FULLTEXT_MIN_CHARS", "500")),
+            fulltext_max_concurrency=int(_env("FULLTEXT_MAX_CONCURRENCY", "8")),
+            fulltext_per_host_concurrency=int(_env("FULLTEXT_PER_HOST_CONCURRENCY", "2")),
+            fulltext_host_delay=float(_env("FULLTEXT_HOST_DELAY", "1.0")),
+            fulltext_time_budget=float(_env("FULLTEXT_TIME_BUDGET", "60")),
+            fulltext_cache_max_mb=int(_env("FULLTEXT_CACHE_MAX_MB", "200")),
+            fulltext_cache_max_age_days=int(_env("FULLTEXT_CACHE_MAX_AGE_DAYS", "30")),
+            cache_dir=_env("CACHE_DIR", ".cache"),
+            metadata_cache_ttl=int(_env("METADATA_CACHE_TTL", "86400")),
+            quota_metadata_reserve=float(_env("QUOTA_METADATA_RESERVE", "0.2")),
+            api_max_retries=int(_env("API_MAX_RETRIES", "4")),
+            api_backoff_base=float(_env("API_BACKOFF_BASE", "1.0")),
+            api_backoff_max=float(_env("API_BACKOFF_MAX", "60")),
+            api_request_deadline=float(_env("API_REQUEST_DEADLINE", "120")),
+            circuit_breaker_threshold=int(_env("CIRCUIT_BREAKER_THRESHOLD", "5")),
+            circuit_breaker_reset=float(_env("CIRCUIT_BREAKER_RESET", "300")),
+            http_connect_timeout=float(_env("HTTP_CONNECT_TIMEOUT", "10")),
+            http_read_timeout=float(_env("HTTP_READ_TIMEOUT", "60")),
+            http_pool_connections=int(_env("HTTP_POOL_CONNECTIONS", "4")),
+            http_pool_maxsize=int(_env("HTTP_POOL_MAXSIZE", "10")),
         )
     
     def validate(self) -> None:
@@ -0,0 +1,6 @@
+"""Full-text enrichment module"""
+
+from .fetcher import FullTextFetcher
+from .cache import PageCache
+
+__all__ = ["FullTextFetcher", "PageCache"]
@@ -0,0 +1,88 @@
+"""On-disk cache of fetched article pages"""
+
+import hashlib
+import os
+import time
+import zlib
+from pathlib import Path
+from typing import Optional
+
+
+class PageCache:
+    """Compressed article pages on disk, one file per URL
+
+    Reading a page refreshes its modification time, so eviction removes
+    expired pages first and then the least recently used ones until the
+    cache fits in max_bytes.
+    """
+
+    SUFFIX = ".html.z"
+
+    def __init__(self, directory: str, max_bytes: int = 200 * 1024 * 1024, max_age_days: int = 30):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.max_age_seconds = max_age_days * 86400
+
+    def _path(self, url: str) -> Path:
+        return self.directory / (hashlib.sha256(url.encode()).hexdigest() + self.SUFFIX)
+
+    def get(self, url: str) -> Optional[str]:
+        """Get a cached page if it has not expired"""
+        path = self._path(url)
+        try:
+            if time.time() - path.stat().st_mtime > self.max_age_seconds:
+                return None
+            page = zlib.decompress(path.read_bytes()).decode("utf-8")
+        except (OSError, zlib.error, UnicodeDecodeError):
+            return None
+        os.utime(path)
+        return page
+
+    def store(self, url: str, page: str) -> None:
+        """Atomically write a page to the cache"""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self._path(url)
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_bytes(zlib.compress(page.encode("utf-8")))
+        os.replace(tmp_path, path)
+
+    def evict(self) -> int:
+        """Remove expired pages, then least recently used ones over the size limit
+
+        Returns the number of pages removed.
+        """
+        if not self.directory.exists():
+            return 0
+
+        now = time.time()
+        entries = []
+        removed = 0
+        for path in self.directory.glob("*" + self.SUFFIX):
+            try:
+                stat = path.stat()
+                if now - stat.st_mtime > self.max_age_seconds:
+                    path.unlink()
+                    removed += 1
+                else:
+                    entries.append((stat.st_mtime, stat.st_size, path))
+            except OSError:
+                continue
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            total -= size
+            removed += 1
+
+        return removed
+
+    def clear(self) -> None:
+        """Remove all cached pages"""
+        if self.directory.exists():
+            for path in self.directory.glob("*" + self.SUFFIX):
+                path.unlink()
@@ -0,0 +1,162 @@
+"""Concurrent fetching of original article pages"""
+
+import asyncio
+import re
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+from urllib.parse import urlparse
+
+import aiohttp
+
+from ..api.models import Article
+from ..config import Config
+from ..metrics import run_metrics
+from ..transport import USER_AGENT, accept_encoding
+from .cache import PageCache
+
+# Tags and whitespace runs, for a cheap estimate of an article's visible text length
+MARKUP_PATTERN = re.compile(r"<[^>]*>|\s+")
+
+
+class FullTextFetcher:
+    """Replace snippet-only article content with the original page
+
+    Pages are downloaded concurrently, with at most a few requests and a
+    minimum delay per host, and cached on disk between runs. Fetching stops
+    when the run's time budget is spent; articles not reached by then keep
+    their feed content. The page HTML is stored in ``article.content`` for
+    the cleaning stage to extract.
+    """
+
+    def __init__(self, config: Config):
+        self.config = config
+        self.cache = PageCache(
+            str(Path(config.cache_dir) / "pages"),
+            max_bytes=config.fulltext_cache_max_mb * 1024 * 1024,
+            max_age_days=config.fulltext_cache_max_age_days
+        )
+        self._host_semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._host_next_slot: Dict[str, float] = {}
+
+    def needs_full_text(self, article: Article) -> bool:
+        """Check whether an article only has a short snippet and a fetchable URL"""
+        if urlparse(article.url or "").scheme not in ("http", "https"):
+            return False
+        # Stripping tags is enough to tell a snippet from an article, and leaves
+        # the full parse to the cleaning stage
+        html = article.content or article.summary or ""
+        return len(MARKUP_PATTERN.sub(" ", html).strip()) < self.config.fulltext_min_chars
+
+    def enrich(self, articles: List[Article]) -> int:
+        """Fetch full pages for snippet-only articles, returning how many were enriched"""
+        candidates = [article for article in articles if self.needs_full_text(article)]
+        if not candidates:
+            return 0
+
+        print(f"🌐 Fetching full text for {len(candidates)} snippet-only articles...")
+        enriched = asyncio.run(self.enrich_async(candidates))
+        evicted = self.cache.evict()
+        if evicted:
+            run_metrics.increment("fulltext.cache_evictions", evicted)
+        print(f"✅ Full text added to {enriched}/{len(candidates)} articles")
+        return enriched
+
+    async def enrich_async(self, articles: List[Article]) -> int:
+        """Fetch pages for the given articles within the time budget"""
+        self._host_semaphores = {}
+        self._host_next_slot = {}
+        deadline = time.monotonic() + self.config.fulltext_time_budget
+
+        connector = aiohttp.TCPConnector(limit=self.config.fulltext_max_concurrency, ttl_dns_cache=300)
+        headers = {"User-Agent": USER_AGENT, "Accept-Encoding": accept_encoding(),
+                   "Accept": "text/html,application/xhtml+xml"}
+        async with aiohttp.ClientSession(connector=connector, headers=headers) as session:
+            tasks = [asyncio.ensure_future(self._enrich_article(session, article, deadline))
+                     for article in articles]
+            done, pending = await asyncio.wait(tasks, timeout=max(deadline - time.monotonic(), 0))
+
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+                run_metrics.increment("fulltext.skipped_budget", len(pending))
+                print(f"⏱️  Full-text time budget spent, {len(pending)} articles keep their snippet")
+
+        # One article failing (a cache write, a bad page) must not abort the others
+        enriched = 0
+        for task in done:
+            if task.cancelled():
+                continue
+            if task.exception() is not None:
+                print(f"⚠️  Full-text enrichment failed: {task.exception()}")
+                run_metrics.increment("fulltext.failed")
+            elif task.result():
+                enriched += 1
+        return enriched
+
+    async def _enrich_article(self, session: aiohttp.ClientSession, article: Article, deadline: float) -> bool:
+        page = self.cache.get(article.url)
+        if page is not None:
+            run_metrics.increment("fulltext.cache_hits")
+        else:
+            page = await self._fetch_page(session, article.url, deadline)
+            if page is None:
+                return False
+            self.cache.store(article.url, page)
+
+        article.content = page
+        return True
+
+    async def _fetch_page(self, session: aiohttp.ClientSession, url: str, deadline: float) -> Optional[str]:
+        """Download one page, respecting the per-host limits; None if it can't be used"""
+        host = urlparse(url).netloc.lower()
+        semaphore = self._host_semaphores.setdefault(
+            host, asyncio.Semaphore(self.config.fulltext_per_host_concurrency)
+        )
+
+        async with semaphore:
+            await self._wait_for_host_slot(host)
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+
+            timeout = aiohttp.ClientTimeout(total=min(self.config.http_read_timeout, remaining),
+                                            sock_connect=self.config.http_connect_timeout)
+            try:
+                async with session.get(url, timeout=timeout) as response:
+                    content_type = response.headers.get("Content-Type", "")
+                    if response.status != 200 or "html" not in content_type:
+                        run_metrics.increment("fulltext.failed")
+                        return None
+                    body = await self._read_capped(response, self.config.cleaning_max_input_chars)
+                    page = body.decode(response.charset or "utf-8", errors="replace")
+            except (aiohttp.ClientError, asyncio.TimeoutError, LookupError) as e:
+                print(f"⚠️  Could not fetch {url}: {str(e) or type(e).__name__}")
+                run_metrics.increment("fulltext.failed")
+                return None
+
+        run_metrics.increment("fulltext.fetched")
+        run_metrics.increment("fulltext.bytes", len(body))
+        return page
+
+    @staticmethod
+    async def _read_capped(response: aiohttp.ClientResponse, limit: int) -> bytes:
+        """Read a response body, stopping once limit bytes have arrived"""
+        chunks = []
+        size = 0
+        async for chunk in response.content.iter_chunked(64 * 1024):
+            chunks.append(chunk)
+            size += len(chunk)
+            if limit and size >= limit:
+                break
+        body = b"".join(chunks)
+        return body[:limit] if limit else body
+
+    async def _wait_for_host_slot(self, host: str) -> None:
+        """Space requests to the same host at least fulltext_host_delay seconds apart"""
+        now = time.monotonic()
+        slot = max(now, self._host_next_slot.get(host, 0.0))
+        self._host_next_slot[host] = slot + self.config.fulltext_host_delay
+        if slot > now:
+            await asyncio.sleep(slot - now)
@@ -9,11 +9,14 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from .config import Config
 from .api import InoreaderClient
+from .cleaner import ContentCleaner, Deduplicator
+from .fulltext import FullTextFetcher
 from .summarizer import SummarizationEngine
 from .reporter import ReportGenerator
 from .delivery import EmailDelivery
 from .scheduler import ReportScheduler
 from .web_subscribers import WebSubscriberManager
+from .metrics import run_metrics
 
 
 class InoreaderIntelligence:
@@ -22,6 +25,9 @@ class InoreaderIntelligence:
     def __init__(self, config: Optional[Config] = None):
         self.config = config or Config.from_env()
         self.client = InoreaderClient(self.config)
+        self.cleaner = ContentCleaner(self.config)
+        self.deduplicator = Deduplicator(self.config)
+        self.fulltext = FullTextFetcher(self.config)
         self.summarizer = SummarizationEngine(self.config)
         self.reporter = ReportGenerator(self.config)
         self.delivery = EmailDelivery(self.config)
@@ -39,7 +45,9 @@ class InoreaderIntelligence:
                        send_email: bool = False,
                        use_focus_folder: bool = True,
                        interactive: bool = True) -> str:
-        """Generate a single report"""
+        """Generate a single report, or return "" when nothing is new since the last run"""
+        run_metrics.reset()
+        self.summarizer.start_run()
         
         # Ensure authentication is valid
         if not self.client.oauth.is_authenticated():
@@ -52,6 +60,9 @@ class InoreaderIntelligence:
                 use_pagination=self.config.use_pagination,
                 max_total_articles=self.config.max_daily_articles
             )
+            if not articles and self.client.focus_caught_up:
+                print("✅ No new articles since the last run")
+                return ""
             # Fallback to all unread articles if Focus folder is empty or not found
             if not articles:
                 print("📰 Focus folder empty or not found, falling back to unread articles...")
@@ -62,11 +73,16 @@ class InoreaderIntelligence:
         if not articles:
             raise ValueError("No articles found")
         
+        # Fetch full pages for snippet-only articles
+        if self.config.fulltext_enabled:
+            self.fulltext.enrich(articles)
+        
         # Clean content
-        cleaned_articles = []
-        for article in articles:
-            cleaned = self.client.clean_article_content(article)
-            cleaned_articles.append(cleaned)
+        cleaned_articles = self.cleaner.clean_articles(articles)
+        
+        # Collapse copies of the same story before any LLM calls
+        if self.config.dedupe_articles:
+            cleaned_articles = self.deduplicator.dedupe(cleaned_articles)
         
         # Categorize
         categorized = self.summarizer.categorize_articles(cleaned_articles)
@@ -86,6 +102,10 @@ class InoreaderIntelligence:
         # Generate report
         report_path = self.reporter.generate_report(categorized, theme_summaries, format)
         
+        # The fetched articles are now in a report, so the next run can skip them
+        self.client.commit_sync_state()
+        self.client.mark_reported_as_read(articles)
+        
         # Send email if requested
         if send_email:
             # Get combined recipients (config + web subscribers)
@@ -99,6 +119,7 @@ class InoreaderIntelligence:
                 # For non-HTML formats, send the file directly
                 self.delivery.send_report(report_path)
         
+        run_metrics.print_summary()
         return report_path
     
     def start_scheduler(self, time: str = "06:00", timezone: str = "Asia/Singapore") -> None:
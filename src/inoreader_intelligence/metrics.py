@@ -0,0 +1,50 @@
+"""Run metrics for Inoreader Intelligence"""
+
+import threading
+from collections import Counter
+from typing import Dict, Union
+
+Number = Union[int, float]
+
+
+class RunMetrics:
+    """Thread-safe counters describing the current report run"""
+
+    def __init__(self):
+        self._counts: Counter = Counter()
+        self._lock = threading.Lock()
+
+    def increment(self, name: str, amount: Number = 1) -> None:
+        """Add to a named counter"""
+        with self._lock:
+            self._counts[name] += amount
+
+    def get(self, name: str) -> Number:
+        """Get the current value of a counter"""
+        with self._lock:
+            return self._counts.get(name, 0)
+
+    def snapshot(self) -> Dict[str, Number]:
+        """Get a copy of all counters"""
+        with self._lock:
+            return dict(self._counts)
+
+    def reset(self) -> None:
+        """Clear all counters at the start of a run"""
+        with self._lock:
+            self._counts.clear()
+
+    def print_summary(self) -> None:
+        """Print all non-zero counters"""
+        counts = {name: value for name, value in sorted(self.snapshot().items()) if value}
+        if not counts:
+            return
+
+        print("📊 Run metrics:")
+        for name, value in counts.items():
+            formatted = f"{value:.2f}" if isinstance(value, float) else str(value)
+            print(f"   {name}: {formatted}")
+
+
+# Shared by all components of a run
+run_metrics = RunMetrics()
@@ -89,10 +89,15 @@ class ReportGenerator:
                     "title": article.title,
                     "summary": html_summary,
                     "url": article.url,
-                    "inoreader_url": article.get_inoreader_url(),
+                    "inoreader_url": article.inoreader_url,
                     "feed_title": article.feed_title,
                     "published": article.published.strftime("%Y-%m-%d %H:%M"),
-                    "author": article.author or "Unknown"
+                    "author": article.author or "Unknown",
+                    "key_actors": list(article.key_actors),
+                    "also_covered_by": [
+                        {"feed_title": duplicate.feed_title, "url": duplicate.url or duplicate.inoreader_url}
+                        for duplicate in article.duplicates
+                    ]
                 })
             
             # Handle theme overview
@@ -132,6 +132,14 @@ HTML_TEMPLATE = """
             overflow-wrap: break-word;
             white-space: pre-wrap;
         }
+        .also-covered {
+            font-size: 0.9em;
+            color: #7f8c8d;
+            margin-bottom: 10px;
+        }
+        .also-covered a {
+            color: #7f8c8d;
+        }
         .article-links {
             font-size: 0.9em;
             margin-top: 10px;
@@ -208,6 +216,16 @@ HTML_TEMPLATE = """
                 {{ article.summary|safe }}
             </div>
             
+            {% if article.key_actors %}
+            <div class="article-source"><strong>Key actors:</strong> {{ article.key_actors|join(", ") }}</div>
+            {% endif %}
+            
+            {% if article.also_covered_by %}
+            <div class="also-covered"><strong>Also covered by:</strong>
+                {% for other in article.also_covered_by %}{% if not loop.first %}, {% endif %}{% if other.url %}<a href="{{ other.url }}" target="_blank">{{ other.feed_title }}</a>{% else %}{{ other.feed_title }}{% endif %}{% endfor %}
+            </div>
+            {% endif %}
+            
             <div class="article-links">
                 {% if article.inoreader_url %}
                 <a href="{{ article.inoreader_url }}" target="_blank" class="inoreader-link">📖 Read in Inoreader</a>
@@ -253,6 +271,14 @@ MARKDOWN_TEMPLATE = """
 
 {{ article.summary }}
 
+{% if article.key_actors %}
+**Key actors:** {{ article.key_actors|join(", ") }}
+
+{% endif %}
+{% if article.also_covered_by %}
+**Also covered by:** {% for other in article.also_covered_by %}{% if not loop.first %}, {% endif %}{% if other.url %}[{{ other.feed_title }}]({{ other.url }}){% else %}{{ other.feed_title }}{% endif %}{% endfor %}
+
+{% endif %}
 {% if article.url %}
 [Read full article →]({{ article.url }})
 {% endif %}
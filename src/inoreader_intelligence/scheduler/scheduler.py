@@ -9,9 +9,12 @@ import pytz
 
 from ..config import Config
 from ..api import InoreaderClient
+from ..cleaner import ContentCleaner, Deduplicator
+from ..fulltext import FullTextFetcher
 from ..summarizer import SummarizationEngine
 from ..reporter import ReportGenerator
 from ..delivery import EmailDelivery
+from ..metrics import run_metrics
 
 
 class ReportScheduler:
@@ -21,6 +24,9 @@ class ReportScheduler:
         self.config = config
         self.scheduler = BlockingScheduler()
         self.client = InoreaderClient(config)
+        self.cleaner = ContentCleaner(config)
+        self.deduplicator = Deduplicator(config)
+        self.fulltext = FullTextFetcher(config)
         self.summarizer = SummarizationEngine(config)
         self.reporter = ReportGenerator(config)
         self.delivery = EmailDelivery(config)
@@ -51,6 +57,8 @@ class ReportScheduler:
         """Generate a daily intelligence report"""
         
         print(f"Starting daily report generation at {datetime.now()}")
+        run_metrics.reset()
+        self.summarizer.start_run()
         
         try:
             # Ensure authentication is valid
@@ -69,18 +77,29 @@ class ReportScheduler:
                 print("Fetching articles...")
                 articles = self.client.get_todays_articles(tag_ids)
             
+            if not articles and self.client.focus_caught_up:
+                print("No new articles since the last run")
+                return ""
+            
             if not articles:
                 print("No articles found for today")
                 return ""
             
             print(f"Found {len(articles)} articles")
             
+            # Fetch full pages for snippet-only articles
+            if self.config.fulltext_enabled:
+                self.fulltext.enrich(articles)
+            
             # Clean article content
             print("Cleaning article content...")
-            cleaned_articles = []
-            for article in articles:
-                cleaned = self.client.clean_article_content(article)
-                cleaned_articles.append(cleaned)
+            cleaned_articles = self.cleaner.clean_articles(articles)
+            
+            # Collapse copies of the same story
+            if self.config.dedupe_articles:
+                print("Collapsing duplicate stories...")
+                cleaned_articles = self.deduplicator.dedupe(cleaned_articles)
+                print(f"{len(cleaned_articles)} unique stories")
             
             # Categorize articles
             print("Categorizing articles...")
@@ -110,6 +129,10 @@ class ReportScheduler:
             
             print(f"Report generated: {report_path}")
             
+            # The fetched articles are now in a report, so the next run can skip them
+            self.client.commit_sync_state()
+            self.client.mark_reported_as_read(articles)
+            
             # Send email
             print("Sending email...")
             success = self.delivery.send_html_report(report_path)
@@ -119,6 +142,7 @@ class ReportScheduler:
             else:
                 print("Failed to send report via email")
             
+            run_metrics.print_summary()
             return report_path
             
         except Exception as e:
@@ -0,0 +1,57 @@
+"""JSON serialization for API responses, tokens and on-disk state
+
+Uses orjson when it is installed and the standard library otherwise. Both
+take and return bytes, so response bodies and files go to and from the
+decoder without an intermediate str copy.
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Union
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so this catches both
+JSONDecodeError = json.JSONDecodeError
+
+Buffer = Union[bytes, bytearray, memoryview, str]
+
+
+def loads(data: Buffer) -> Any:
+    """Decode JSON from bytes (or str)"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+    return json.loads(data)
+
+
+def dumps(obj: Any, indent: bool = False) -> bytes:
+    """Encode an object as UTF-8 JSON bytes"""
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(obj, option=option)
+    if indent:
+        return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def read_json(path: Union[str, Path]) -> Any:
+    """Read and decode a JSON file"""
+    with open(path, "rb") as f:
+        return loads(f.read())
+
+
+def write_json(path: Union[str, Path], obj: Any, indent: bool = False) -> None:
+    """Atomically write an object to a JSON file"""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(dumps(obj, indent))
+    os.replace(tmp_path, path)
@@ -1,5 +1,6 @@
 """Summarization module"""
 
 from .engine import SummarizationEngine
+from .store import EnrichmentStore
 
-__all__ = ["SummarizationEngine"]
\ No newline at end of file
+__all__ = ["SummarizationEngine", "EnrichmentStore"]
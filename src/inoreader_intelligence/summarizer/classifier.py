@@ -0,0 +1,177 @@
+"""Local TF-IDF theme classifier trained on stored LLM categorizations"""
+
+import hashlib
+import re
+from collections import Counter
+from pathlib import Path
+from typing import List, Dict, Optional, Tuple, Any, Iterable
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+MODEL_FILENAME = "theme_classifier.npz"
+
+# Class label for articles the LLM judged irrelevant
+IRRELEVANT_LABEL = "IRRELEVANT"
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+(?:[-'][a-z0-9]+)*")
+STOP_WORDS = frozenset(
+    "a an and are as at be been but by for from has have he her his in into is it its of on or "
+    "our said she that the their them they this to was we were which will with would you".split()
+)
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercased word unigrams and bigrams, without stop words"""
+    words = [word for word in TOKEN_PATTERN.findall(text.lower()) if word not in STOP_WORDS]
+    return words + [f"{first} {second}" for first, second in zip(words, words[1:])]
+
+
+class ThemeClassifier:
+    """Nearest-centroid classifier over L2-normalized TF-IDF vectors
+
+    Each theme is the normalized sum of its training articles' TF-IDF
+    vectors. An article's confidence is the softmax of its cosine
+    similarities to the centroids, sharpened by SHARPNESS.
+    """
+
+    SHARPNESS = 20.0
+
+    def __init__(self, terms: List[str], idf: "np.ndarray", labels: List[str], centroids: "np.ndarray"):
+        self.terms = terms
+        self.vocabulary = {term: index for index, term in enumerate(terms)}
+        self.idf = idf
+        self.labels = labels
+        self.centroids = centroids
+
+    @classmethod
+    def train(cls, texts: List[str], labels: List[str], min_df: int = 2,
+              max_features: int = 50000) -> "ThemeClassifier":
+        """Fit vocabulary, IDF weights and one centroid per label"""
+        if not NUMPY_AVAILABLE:
+            raise RuntimeError("NumPy is required for the local theme classifier")
+
+        documents = [tokenize(text) for text in texts]
+        document_frequency = Counter(term for tokens in documents for term in set(tokens))
+        terms = sorted(term for term, count in document_frequency.most_common(max_features) if count >= min_df)
+        frequencies = np.array([document_frequency[term] for term in terms], dtype=np.float32)
+        idf = np.log((1 + len(documents)) / (1 + frequencies)) + 1
+
+        classes = sorted(set(labels))
+        model = cls(terms, idf.astype(np.float32), classes,
+                    np.zeros((len(classes), len(terms)), dtype=np.float32))
+        class_index = {label: index for index, label in enumerate(classes)}
+        for tokens, label in zip(documents, labels):
+            indices, weights = model._vectorize(tokens)
+            model.centroids[class_index[label], indices] += weights
+
+        norms = np.linalg.norm(model.centroids, axis=1, keepdims=True)
+        model.centroids /= np.where(norms == 0, 1, norms)
+        return model
+
+    def _vectorize(self, tokens: Iterable[str]) -> Tuple["np.ndarray", "np.ndarray"]:
+        """Sparse L2-normalized TF-IDF vector as (term indices, weights)"""
+        counts = Counter(term for term in tokens if term in self.vocabulary)
+        indices = np.fromiter((self.vocabulary[term] for term in counts), dtype=np.int64, count=len(counts))
+        weights = (1 + np.log(np.fromiter(counts.values(), dtype=np.float32, count=len(counts)))) * self.idf[indices]
+        norm = np.linalg.norm(weights)
+        return indices, weights / norm if norm else weights
+
+    def predict(self, texts: List[str]) -> List[Tuple[Optional[str], float]]:
+        """Predict (theme, confidence) per text; theme is None for irrelevant articles"""
+        if not texts:
+            return []
+
+        # Score every article in one pass: gather each article's centroid
+        # columns, weight them, and sum per article with reduceat
+        vectors = [self._vectorize(tokenize(text)) for text in texts]
+        lengths = np.array([len(indices) for indices, _ in vectors])
+        nonempty = np.flatnonzero(lengths)
+        scores = np.zeros((len(texts), len(self.labels)), dtype=np.float32)
+        if len(nonempty):
+            indices = np.concatenate([vectors[n][0] for n in nonempty])
+            weights = np.concatenate([vectors[n][1] for n in nonempty])
+            offsets = np.concatenate(([0], np.cumsum(lengths[nonempty])[:-1]))
+            scores[nonempty] = np.add.reduceat(self.centroids[:, indices] * weights, offsets, axis=1).T
+
+        exponents = np.exp(self.SHARPNESS * (scores - scores.max(axis=1, keepdims=True)))
+        probabilities = exponents / exponents.sum(axis=1, keepdims=True)
+        best = probabilities.argmax(axis=1)
+
+        predictions = []
+        for n, label_index in enumerate(best):
+            label = self.labels[label_index]
+            if not lengths[n]:
+                # Articles without known terms carry no evidence either way
+                predictions.append((None, 0.0))
+            else:
+                theme = None if label == IRRELEVANT_LABEL else label
+                predictions.append((theme, float(probabilities[n, label_index])))
+        return predictions
+
+    def save(self, path: str) -> None:
+        """Write the model to an .npz file"""
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "wb") as f:
+            np.savez_compressed(f, terms=np.array(self.terms), idf=self.idf,
+                                labels=np.array(self.labels), centroids=self.centroids)
+
+    @classmethod
+    def load(cls, path: str) -> "ThemeClassifier":
+        """Read a model written by save()"""
+        with np.load(path, allow_pickle=False) as data:
+            return cls(data["terms"].tolist(), data["idf"], data["labels"].tolist(), data["centroids"])
+
+
+def load_classifier(path: str) -> Optional[ThemeClassifier]:
+    """Load a trained classifier, or None if NumPy or the model file is missing"""
+    if not NUMPY_AVAILABLE:
+        print("⚠️  NumPy not installed, local theme classifier disabled")
+        return None
+    if not Path(path).exists():
+        print("⚠️  No trained theme classifier found, run 'train-classifier' first")
+        return None
+    return ThemeClassifier.load(path)
+
+
+def _in_holdout(article_id: str, share: float) -> bool:
+    """Stable train/holdout assignment by article ID"""
+    digest = hashlib.blake2b(article_id.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "big") / 2 ** 64 < share
+
+
+def train_from_examples(examples: List[Tuple[str, str, Optional[str]]], holdout: float = 0.2,
+                        threshold: float = 0.8) -> Tuple[ThemeClassifier, Dict[str, Any]]:
+    """Measure accuracy against held-out LLM labels, then train on all examples
+
+    examples are (article_id, text, theme) rows from the enrichment store.
+    Returns the classifier and a report of holdout accuracy overall and for
+    predictions at or above the confidence threshold.
+    """
+    labelled = [(article_id, text, theme or IRRELEVANT_LABEL) for article_id, text, theme in examples]
+    if len({label for _, _, label in labelled}) < 2:
+        raise ValueError("Need LLM-labelled articles from at least two themes to train")
+
+    train = [row for row in labelled if not _in_holdout(row[0], holdout)]
+    test = [row for row in labelled if _in_holdout(row[0], holdout)]
+    report: Dict[str, Any] = {
+        "examples": len(labelled),
+        "train": len(train),
+        "holdout": len(test),
+        "labels": dict(Counter(label for _, _, label in labelled).most_common())
+    }
+
+    if train and test:
+        model = ThemeClassifier.train([text for _, text, _ in train], [label for _, _, label in train])
+        predictions = model.predict([text for _, text, _ in test])
+        correct = [(theme or IRRELEVANT_LABEL) == label for (theme, _), (_, _, label) in zip(predictions, test)]
+        confident = [ok for ok, (_, confidence) in zip(correct, predictions) if confidence >= threshold]
+        report["accuracy"] = sum(correct) / len(correct)
+        report["confident_share"] = len(confident) / len(correct)
+        report["confident_accuracy"] = sum(confident) / len(confident) if confident else None
+
+    classifier = ThemeClassifier.train([text for _, text, _ in labelled], [label for _, _, label in labelled])
+    return classifier, report
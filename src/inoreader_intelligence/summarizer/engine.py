@@ -1,13 +1,178 @@
 """AI-powered summarization engine"""
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
 import re
+import time
 import openai
 from openai import OpenAI
 
 from ..api.models import Article
 from ..config import Config
+from ..metrics import run_metrics
+from ..serialization import loads, JSONDecodeError
+from .classifier import MODEL_FILENAME, load_classifier
+from .keywords import THEME_MATCHER
+from .store import EnrichmentStore, STORE_FILENAME, content_hash
+from .tokens import TokenCounter, TokenBudget, BudgetExceeded, pack
+
+# Bump when a prompt changes so stored results from the old prompt are not reused
+CATEGORY_PROMPT_VERSION = "1"
+SUMMARY_PROMPT_VERSION = "1"
+
+# Completion token limits per request
+SUMMARY_COMPLETION_TOKENS = 1000
+CATEGORY_COMPLETION_TOKENS = 10
+THEME_COMPLETION_TOKENS = 1500
+
+
+THEMES = [
+    "Geopolitical Tensions",
+    "Cybersecurity Warfare",
+    "Emerging Tech",
+    "National Security",
+    "Military Modernization",
+    "Rules-Based Order",
+    "Strategic Foresight",
+]
+
+IRRELEVANT_CATEGORIES = ["irrelevant", "other", "uncategorized", "none"]
+
+# Common variations of the analytical themes
+CATEGORY_MAP = {
+    "geopolitics": "Geopolitical Tensions",
+    "geopolitical": "Geopolitical Tensions",
+    "tensions": "Geopolitical Tensions",
+    "statecraft": "Geopolitical Tensions",
+    "diplomacy": "Geopolitical Tensions",
+    "cyber": "Cybersecurity Warfare",
+    "cybersecurity": "Cybersecurity Warfare",
+    "security": "Cybersecurity Warfare",
+    "warfare": "Cybersecurity Warfare",
+    "espionage": "Cybersecurity Warfare",
+    "tech": "Emerging Tech",
+    "technology": "Emerging Tech",
+    "emerging": "Emerging Tech",
+    "innovation": "Emerging Tech",
+    "ai": "Emerging Tech",
+    "quantum": "Emerging Tech",
+    "national": "National Security",
+    "homeland": "National Security",
+    "terrorism": "National Security",
+    "extremism": "National Security",
+    "biosecurity": "National Security",
+    "military": "Military Modernization",
+    "defense": "Military Modernization",
+    "modernization": "Military Modernization",
+    "doctrine": "Military Modernization",
+    "alliance": "Military Modernization",
+    "rules": "Rules-Based Order",
+    "law": "Rules-Based Order",
+    "legal": "Rules-Based Order",
+    "international": "Rules-Based Order",
+    "un": "Rules-Based Order",
+    "treaty": "Rules-Based Order",
+    "foresight": "Strategic Foresight",
+    "trends": "Strategic Foresight",
+    "climate": "Strategic Foresight",
+    "demographic": "Strategic Foresight",
+    "future": "Strategic Foresight",
+    "asean": "Geopolitical Tensions"
+}
+
+
+def normalize_theme(category: str) -> Tuple[bool, Optional[str]]:
+    """Map a model-supplied theme to an analytical theme
+
+    Returns (valid, theme), where theme is None for irrelevant articles.
+    """
+    key = category.strip().lower()
+    if key in IRRELEVANT_CATEGORIES:
+        return True, None
+    for theme in THEMES:
+        if key == theme.lower():
+            return True, theme
+    if key in CATEGORY_MAP:
+        return True, CATEGORY_MAP[key]
+    return False, None
+
+
+def _json_array(text: str) -> List[Any]:
+    """The JSON array in a model reply, or an empty list if there is none"""
+    start, end = text.find("["), text.rfind("]")
+    if start == -1 or end < start:
+        return []
+    try:
+        entries = loads(text[start:end + 1])
+    except JSONDecodeError:
+        return []
+    return entries if isinstance(entries, list) else []
+
+
+def parse_batch_themes(text: str, count: int) -> Dict[int, Optional[str]]:
+    """Parse a batched categorization reply into {article number: theme}
+
+    Entries with unknown IDs or themes are dropped so their articles can be
+    retried individually.
+    """
+    themes = {}
+    for entry in _json_array(text):
+        if not isinstance(entry, dict) or not isinstance(entry.get("theme"), str):
+            continue
+        try:
+            number = int(entry.get("id"))
+        except (TypeError, ValueError):
+            continue
+        if not 1 <= number <= count or number in themes:
+            continue
+        valid, theme = normalize_theme(entry["theme"])
+        if valid:
+            themes[number] = theme
+    return themes
+
+
+@dataclass
+class Enrichment:
+    """Theme, relevance, key actors and summary of one article from a combined request"""
+    theme: Optional[str]
+    relevance: float
+    summary: str = ""
+    key_actors: List[str] = field(default_factory=list)
+
+
+def parse_enrichments(text: str, count: int) -> Dict[int, Enrichment]:
+    """Parse a combined enrichment reply into {article number: Enrichment}
+
+    Entries with unknown IDs or themes, or fields of the wrong type, are
+    dropped so their articles can be categorized individually.
+    """
+    enrichments = {}
+    for entry in _json_array(text):
+        if not isinstance(entry, dict) or not isinstance(entry.get("theme"), str):
+            continue
+        try:
+            number = int(entry.get("id"))
+            relevance = float(entry.get("relevance"))
+        except (TypeError, ValueError):
+            continue
+        summary = entry.get("summary") or ""
+        key_actors = entry.get("key_actors") or []
+        if not 1 <= number <= count or number in enrichments:
+            continue
+        if not isinstance(summary, str) or not isinstance(key_actors, list) or relevance != relevance:
+            continue
+        valid, theme = normalize_theme(entry["theme"])
+        if valid:
+            enrichments[number] = Enrichment(
+                theme=theme,
+                relevance=min(max(relevance, 0.0), 1.0),
+                summary=summary.strip(),
+                key_actors=[actor.strip() for actor in key_actors if isinstance(actor, str) and actor.strip()]
+            )
+    return enrichments
 
 
 class SummarizationEngine:
@@ -17,7 +182,72 @@ class SummarizationEngine:
         self.config = config
         self.client = None
         if config.openai_api_key:
-            self.client = OpenAI(api_key=config.openai_api_key)
+            self.client = OpenAI(api_key=config.openai_api_key, base_url=config.openai_base_url)
+        
+        self.store = None
+        if self.client and config.enrichment_store:
+            self.store = EnrichmentStore(
+                str(Path(config.cache_dir) / STORE_FILENAME),
+                max_entries=config.enrichment_store_max_entries,
+                max_age_days=config.enrichment_store_max_age_days
+            )
+            run_metrics.increment("enrichment.evicted", self.store.evict())
+        
+        self.classifier = None
+        if config.local_classifier:
+            self.classifier = load_classifier(str(Path(config.cache_dir) / MODEL_FILENAME))
+        
+        self.tokens = TokenCounter(config.openai_model)
+        self.budget = TokenBudget(config.openai_model, config.run_max_tokens, config.run_max_cost)
+        self._budget_warned = False
+        
+        # Results of combined enrichment requests this run, by article ID
+        self.enrichments: Dict[str, Enrichment] = {}
+        # Summaries generated this run as (summary, whether a request was sent), by article ID
+        self._summaries: Dict[str, Tuple[str, bool]] = {}
+    
+    def start_run(self) -> None:
+        """Forget the previous run's summaries, enrichments and token spend"""
+        self.enrichments.clear()
+        self._summaries.clear()
+        self.budget.reset()
+        self._budget_warned = False
+    
+    @staticmethod
+    def _record_usage(response: Any) -> None:
+        """Add a completion's token usage to the run metrics"""
+        run_metrics.increment("openai.requests")
+        usage = getattr(response, "usage", None)
+        if usage is not None:
+            run_metrics.increment("openai.prompt_tokens", usage.prompt_tokens or 0)
+            run_metrics.increment("openai.completion_tokens", usage.completion_tokens or 0)
+    
+    def _complete(self, messages: List[Dict[str, str]], max_tokens: int, temperature: float) -> Any:
+        """Send a chat completion, refusing it with BudgetExceeded if it would pass the run's ceilings"""
+        reserved = (self.tokens.count_messages(messages), max_tokens)
+        if not self.budget.reserve(*reserved):
+            run_metrics.increment("budget.refused")
+            if not self._budget_warned:
+                self._budget_warned = True
+                print("⚠️  Run token budget reached, remaining requests fall back to local results")
+            raise BudgetExceeded(f"{sum(reserved)} more tokens would pass the run budget")
+        
+        try:
+            response = self.client.chat.completions.create(
+                model=self.config.openai_model,
+                messages=messages,
+                max_tokens=max_tokens,
+                temperature=temperature
+            )
+        except Exception:
+            self.budget.settle(reserved, (0, 0))
+            raise
+        self._record_usage(response)
+        
+        usage = getattr(response, "usage", None)
+        if usage is not None:
+            self.budget.settle(reserved, (usage.prompt_tokens or 0, usage.completion_tokens or 0))
+        return response
     
     def _format_markdown_to_html(self, text: str) -> str:
         """Convert basic markdown formatting to HTML"""
@@ -45,7 +275,7 @@ class SummarizationEngine:
         return text
     
     def summarize_article(self, article: Article) -> str:
-        """Generate a summary for a single article"""
+        """Generate a summary for a single article, at most once per run"""
         if not self.client:
             # Fallback to simple text truncation if no OpenAI key
             return self._truncate_text(article.content or article.summary, self.config.summary_max_length)
@@ -54,35 +284,76 @@ class SummarizationEngine:
         if article.summary:
             return article.summary
         
+        # Theme summaries and the report both ask for the same articles
+        if article.id in self._summaries:
+            summary, requested = self._summaries[article.id]
+            run_metrics.increment("enrichment.summary_memo_hits")
+            if requested:
+                run_metrics.increment("openai.summary_calls_saved")
+            return summary
+        
+        summary, requested = self._summarize(article)
+        # A failed request falls back to truncated text but is retried on the next lookup
+        if requested is not None:
+            self._summaries[article.id] = (summary, requested)
+        return summary
+    
+    def _summarize(self, article: Article) -> Tuple[str, Optional[bool]]:
+        """Summarize an article from the store or the model
+        
+        Returns (summary, whether a request was sent), with None in place of
+        the flag when the request failed.
+        """
         content = article.content
         if not content:
-            return "No content"
+            return "No content", False
         
-        # Truncate content if too long
-        if len(content) > 4000:
-            content = content[:4000] + "..."
+        # Truncate content to the article token budget
+        content = self.tokens.truncate(content, self.config.article_max_tokens)
+        
+        digest = content_hash(article.title + "\n" + content)
+        found, summary = self._stored_summary(article, digest)
+        if found:
+            run_metrics.increment("enrichment.summary_hits")
+            return summary, False
         
         try:
-            response = self.client.chat.completions.create(
-                model=self.config.openai_model,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": f"You are an intelligence analyst for DIS scholarship preparation. Summarize this article in {self.config.summary_max_length} words or less with strategic focus: 1) Key events and actors involved 2) Strategic implications and goals 3) Relevance to regional security or global order 4) Potential escalations or indicators to monitor. Be analytical, not just descriptive."
-                    },
-                    {
-                        "role": "user",
-                        "content": f"Title: {article.title}\n\nContent: {content}"
-                    }
-                ],
-                max_tokens=1000,
-                temperature=0
-            )
+            response = self._complete(self._summary_messages(article, content),
+                                      SUMMARY_COMPLETION_TOKENS, temperature=0)
             
-            return response.choices[0].message.content.strip()
+            summary = response.choices[0].message.content.strip()
+            if self.store is not None:
+                self.store.put(article.id, "summary", digest, self.config.openai_model,
+                               self._summary_prompt_version(), summary)
+            return summary, True
+        except BudgetExceeded:
+            return self._truncate_text(content, self.config.summary_max_length), False
         except Exception as e:
             print(f"Error summarizing article {article.id}: {e}")
-            return self._truncate_text(content, self.config.summary_max_length)
+            return self._truncate_text(content, self.config.summary_max_length), None
+    
+    def _summary_prompt_version(self) -> str:
+        """Prompt version of stored summaries, which also depend on the requested length"""
+        return f"{SUMMARY_PROMPT_VERSION}:{self.config.summary_max_length}"
+    
+    def _stored_summary(self, article: Article, digest: str) -> Tuple[bool, Optional[str]]:
+        """Look up a stored summary of the article text with this digest"""
+        if self.store is None:
+            return False, None
+        return self.store.get(article.id, "summary", digest, self.config.openai_model, self._summary_prompt_version())
+    
+    def _summary_messages(self, article: Article, content: str) -> List[Dict[str, str]]:
+        """Chat messages asking for a summary of one article"""
+        return [
+            {
+                "role": "system",
+                "content": f"You are an intelligence analyst for DIS scholarship preparation. Summarize this article in {self.config.summary_max_length} words or less with strategic focus: 1) Key events and actors involved 2) Strategic implications and goals 3) Relevance to regional security or global order 4) Potential escalations or indicators to monitor. Be analytical, not just descriptive."
+            },
+            {
+                "role": "user",
+                "content": f"Title: {article.title}\n\nContent: {content}"
+            }
+        ]
     
     def _truncate_text(self, text: str, max_length: int) -> str:
         """Simple text truncation fallback"""
@@ -102,119 +373,296 @@ class SummarizationEngine:
     
     def categorize_articles(self, articles: List[Article]) -> Dict[str, List[Article]]:
         """Group articles by themes/categories, excluding irrelevant content"""
-        if not self.client:
+        if not self.client and self.classifier is None:
             return self._simple_categorization(articles)
         
-        # Use AI to categorize articles
         categories = defaultdict(list)
+        started = time.perf_counter()
         
-        for article in articles:
-            try:
-                category = self._get_article_category(article)
-                # Only include articles that fit into our analytical themes
-                if category and category != "Uncategorized":
-                    categories[category].append(article)
-                # Skip articles that don't fit our military/intelligence themes
-            except Exception as e:
-                print(f"Error categorizing article {article.id}: {e}")
-                # Don't add to any category if categorization fails
+        # Reuse stored categories, accept confident local predictions, and use
+        # AI for the rest, several requests in flight at once
+        known = self._known_categories(articles)
+        pending = [article for n, article in enumerate(articles) if n not in known]
+        if not self.client:
+            # Articles the classifier has no terms for fall back to keywords
+            computed = iter([self._keyword_category(article) for article in pending])
+        elif self.config.combined_enrichment:
+            computed = iter(self._enrich_concurrently(pending))
+        else:
+            computed = iter(self._categorize_concurrently(pending))
         
+        for n, article in enumerate(articles):
+            category = known[n] if n in known else next(computed)
+            # Only include articles that fit into our analytical themes
+            if category and category != "Uncategorized":
+                categories[category].append(article)
+            # Skip articles that don't fit our military/intelligence themes
+        
+        if self.config.combined_enrichment:
+            # Most relevant first, so the report and theme summaries keep the strongest
+            # articles; articles categorized without a relevance score count as 0.5
+            for theme_articles in categories.values():
+                theme_articles.sort(key=lambda article: -(self.enrichments[article.id].relevance
+                                                          if article.id in self.enrichments else 0.5))
+        
+        run_metrics.increment("openai.categorize_seconds", time.perf_counter() - started)
         return dict(categories)
     
-    def _get_article_category(self, article: Article) -> str:
+    def _known_categories(self, articles: List[Article]) -> Dict[int, Optional[str]]:
+        """Stored categories and confident local predictions, by position in articles"""
+        known = self._stored_categories(articles)
+        if self.classifier is not None:
+            # Without an API key every prediction backed by known terms is accepted
+            threshold = self.config.classifier_confidence if self.client else 0.0
+            known.update(self._local_categories(articles, known, threshold))
+        return known
+    
+    def _categorize_concurrently(self, articles: List[Article]) -> List[Optional[str]]:
+        """Categorize articles with bounded parallelism, returning categories in article order"""
+        batch_size = max(self.config.categorize_batch_size, 1)
+        if batch_size == 1:
+            return self._map_concurrently(self._categorize_one, articles)
+        
+        batches = [articles[i:i + batch_size] for i in range(0, len(articles), batch_size)]
+        return [category for batch in self._map_concurrently(self._categorize_batch, batches)
+                for category in batch]
+    
+    def _map_concurrently(self, func, items: List[Any]) -> List[Any]:
+        """Apply func to items on up to openai_max_concurrency threads, keeping item order"""
+        workers = min(max(self.config.openai_max_concurrency, 1), len(items))
+        if workers <= 1:
+            return [func(item) for item in items]
+        
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="categorize") as executor:
+            return list(executor.map(func, items))
+    
+    def _categorize_one(self, article: Article) -> Optional[str]:
+        """Categorize one article without letting its failure affect the others"""
+        try:
+            return self._get_article_category(article)
+        except BudgetExceeded:
+            # Past the run budget the article is still reported, themed locally
+            run_metrics.increment("budget.local_categories")
+            return self._local_category(article)
+        except Exception as e:
+            print(f"Error categorizing article {article.id}: {e}")
+            run_metrics.increment("openai.categorize_failed")
+            # Don't add to any category if categorization fails
+            return None
+    
+    def _category_input(self, article: Article) -> str:
+        """Text sent to the model to categorize an article"""
+        return self.tokens.truncate(article.title + " " + (article.summary or article.content or ""),
+                                    self.config.category_max_tokens, suffix="")
+    
+    def _stored_categories(self, articles: List[Article]) -> Dict[int, Optional[str]]:
+        """Categories already in the enrichment store, by position in articles"""
+        if self.store is None:
+            return {}
+        
+        stored = {}
+        for n, article in enumerate(articles):
+            found, category = self.store.get(article.id, "category", content_hash(self._category_input(article)),
+                                             self.config.openai_model, CATEGORY_PROMPT_VERSION)
+            if found:
+                stored[n] = category
+        run_metrics.increment("enrichment.category_hits", len(stored))
+        return stored
+    
+    def _store_category(self, article: Article, category: Optional[str]) -> None:
+        """Remember a category the model returned for an article, also as a training example"""
+        if self.store is not None:
+            text = self._category_input(article)
+            self.store.put(article.id, "category", content_hash(text),
+                           self.config.openai_model, CATEGORY_PROMPT_VERSION, category)
+            self.store.add_example(article.id, text, category, self.config.openai_model)
+    
+    def _local_categories(self, articles: List[Article], skip: Dict[int, Optional[str]],
+                          threshold: float) -> Dict[int, Optional[str]]:
+        """Local classifier predictions at or above threshold, by position in articles
+        
+        Predictions with zero confidence (no known terms) are never accepted.
+        """
+        positions = [n for n in range(len(articles)) if n not in skip]
+        predictions = self.classifier.predict([self._category_input(articles[n]) for n in positions])
+        
+        accepted = {n: theme for n, (theme, confidence) in zip(positions, predictions) if confidence > 0 and confidence >= threshold}
+        run_metrics.increment("classifier.accepted", len(accepted))
+        run_metrics.increment("classifier.deferred", len(positions) - len(accepted))
+        return accepted
+    
+    def _local_category(self, article: Article) -> Optional[str]:
+        """Theme an article without the model: the classifier if it knows any terms, otherwise keywords"""
+        if self.classifier is not None:
+            theme, confidence = self.classifier.predict([self._category_input(article)])[0]
+            if confidence > 0:
+                return theme
+        return self._keyword_category(article)
+    
+    @staticmethod
+    def _keyword_category(article: Article) -> Optional[str]:
+        """Best keyword-matched theme, or None below the matcher's minimum score"""
+        return THEME_MATCHER.best_label(article.title + " " + (article.summary or ""))
+    
+    def _get_article_category(self, article: Article) -> Optional[str]:
         """Get category for a single article using AI"""
-        content = (article.title + " " + (article.summary or article.content or ""))[:1000]
-        
-        response = self.client.chat.completions.create(
-            model=self.config.openai_model,
-            messages=[
-                {
-                    "role": "system",
-                    "content": "You are an intelligence analyst for DIS scholarship preparation. Categorize the following article into one of these analytical themes: Geopolitical Tensions, Cybersecurity Warfare, Emerging Tech, National Security, Military Modernization, Rules-Based Order, or Strategic Foresight. If the article is not relevant to military/intelligence analysis (e.g., sports, entertainment, local news, celebrity gossip), respond with 'IRRELEVANT'. Otherwise, respond with only the category name."
-                },
-                {
-                    "role": "user",
-                    "content": content
-                }
-            ],
-            max_tokens=10,
-            temperature=0.1
-        )
+        response = self._complete(self._category_messages(self._category_input(article)),
+                                  CATEGORY_COMPLETION_TOKENS, temperature=0.1)
         
         category = response.choices[0].message.content.strip()
         
-        # Map common variations to analytical themes
-        category_map = {
-            "geopolitics": "Geopolitical Tensions",
-            "geopolitical": "Geopolitical Tensions",
-            "tensions": "Geopolitical Tensions",
-            "statecraft": "Geopolitical Tensions",
-            "diplomacy": "Geopolitical Tensions",
-            "cyber": "Cybersecurity Warfare",
-            "cybersecurity": "Cybersecurity Warfare",
-            "security": "Cybersecurity Warfare",
-            "warfare": "Cybersecurity Warfare",
-            "espionage": "Cybersecurity Warfare",
-            "tech": "Emerging Tech",
-            "technology": "Emerging Tech",
-            "emerging": "Emerging Tech",
-            "innovation": "Emerging Tech",
-            "ai": "Emerging Tech",
-            "quantum": "Emerging Tech",
-            "national": "National Security",
-            "homeland": "National Security",
-            "terrorism": "National Security",
-            "extremism": "National Security",
-            "biosecurity": "National Security",
-            "military": "Military Modernization",
-            "defense": "Military Modernization",
-            "modernization": "Military Modernization",
-            "doctrine": "Military Modernization",
-            "alliance": "Military Modernization",
-            "rules": "Rules-Based Order",
-            "law": "Rules-Based Order",
-            "legal": "Rules-Based Order",
-            "international": "Rules-Based Order",
-            "un": "Rules-Based Order",
-            "treaty": "Rules-Based Order",
-            "foresight": "Strategic Foresight",
-            "trends": "Strategic Foresight",
-            "climate": "Strategic Foresight",
-            "demographic": "Strategic Foresight",
-            "future": "Strategic Foresight",
-            "asean": "Geopolitical Tensions"
-        }
-        
         # Filter out irrelevant content
-        if category.lower() in ["irrelevant", "other", "uncategorized", "none"]:
-            return None
+        if category.lower() in IRRELEVANT_CATEGORIES:
+            category = None
+        else:
+            # Map common variations to analytical themes
+            category = CATEGORY_MAP.get(category.lower(), category)
+        
+        self._store_category(article, category)
+        return category
+    
+    @staticmethod
+    def _category_messages(content: str) -> List[Dict[str, str]]:
+        """Chat messages asking for the theme of one article"""
+        return [
+            {
+                "role": "system",
+                "content": "You are an intelligence analyst for DIS scholarship preparation. Categorize the following article into one of these analytical themes: Geopolitical Tensions, Cybersecurity Warfare, Emerging Tech, National Security, Military Modernization, Rules-Based Order, or Strategic Foresight. If the article is not relevant to military/intelligence analysis (e.g., sports, entertainment, local news, celebrity gossip), respond with 'IRRELEVANT'. Otherwise, respond with only the category name."
+            },
+            {
+                "role": "user",
+                "content": content
+            }
+        ]
+    
+    def _batch_messages(self, articles: List[Article]) -> List[Dict[str, str]]:
+        """Chat messages asking for the themes of several articles as a JSON array"""
+        # Number articles within the batch; short IDs cost fewer tokens than Inoreader item IDs
+        lines = [f"[{n}] " + " ".join(self._category_input(article).split())
+                 for n, article in enumerate(articles, 1)]
+        return [
+            {
+                "role": "system",
+                "content": "You are an intelligence analyst for DIS scholarship preparation. Each numbered line below is an article. Categorize every article into one of these analytical themes: Geopolitical Tensions, Cybersecurity Warfare, Emerging Tech, National Security, Military Modernization, Rules-Based Order, or Strategic Foresight. Use 'IRRELEVANT' for articles that are not relevant to military/intelligence analysis (e.g., sports, entertainment, local news, celebrity gossip). Respond with only a JSON array with one object per article, like [{\"id\": 1, \"theme\": \"Emerging Tech\"}]."
+            },
+            {
+                "role": "user",
+                "content": "\n".join(lines)
+            }
+        ]
+    
+    @staticmethod
+    def _batch_completion_tokens(count: int) -> int:
+        """Completion token limit for a batch of count articles"""
+        return 20 * count + 20
+    
+    def _categorize_batch(self, articles: List[Article]) -> List[Optional[str]]:
+        """Categorize several articles in one request, retrying unparsed items one at a time"""
+        run_metrics.increment("openai.categorize_batches")
+        
+        parsed: Dict[int, Optional[str]] = {}
+        try:
+            response = self._complete(self._batch_messages(articles),
+                                      self._batch_completion_tokens(len(articles)), temperature=0.1)
+            parsed = parse_batch_themes(response.choices[0].message.content or "", len(articles))
+        except BudgetExceeded:
+            pass
+        except Exception as e:
+            print(f"Error categorizing batch of {len(articles)} articles: {e}")
+        
+        categories = []
+        for n, article in enumerate(articles, 1):
+            if n in parsed:
+                self._store_category(article, parsed[n])
+                categories.append(parsed[n])
+            else:
+                run_metrics.increment("openai.categorize_fallbacks")
+                categories.append(self._categorize_one(article))
+        return categories
+    
+    def _enrich_concurrently(self, articles: List[Article]) -> List[Optional[str]]:
+        """Enrich articles in batches with bounded parallelism, returning categories in article order"""
+        batch_size = max(self.config.categorize_batch_size, 1)
+        batches = [articles[i:i + batch_size] for i in range(0, len(articles), batch_size)]
+        return [category for batch in self._map_concurrently(self._enrich_batch, batches)
+                for category in batch]
+    
+    @staticmethod
+    def _needs_summary(article: Article) -> bool:
+        """Whether the report will need a generated summary for the article"""
+        return not article.summary and bool(article.content)
+    
+    def _enrichment_messages(self, articles: List[Article]) -> List[Dict[str, str]]:
+        """Chat messages asking for theme, relevance, key actors and, where needed, a summary per article"""
+        lines = []
+        for n, article in enumerate(articles, 1):
+            if self._needs_summary(article):
+                text = article.title + " " + self.tokens.truncate(article.content, self.config.article_max_tokens)
+                lines.append(f"[{n}] (summarize) " + " ".join(text.split()))
+            else:
+                lines.append(f"[{n}] " + " ".join(self._category_input(article).split()))
+        return [
+            {
+                "role": "system",
+                "content": f"You are an intelligence analyst for DIS scholarship preparation. Each numbered line below is an article. For every article give: theme, one of these analytical themes: Geopolitical Tensions, Cybersecurity Warfare, Emerging Tech, National Security, Military Modernization, Rules-Based Order, or Strategic Foresight, or 'IRRELEVANT' for articles that are not relevant to military/intelligence analysis (e.g., sports, entertainment, local news, celebrity gossip); relevance, a number from 0 to 1 for how much the article matters to strategic analysis; key_actors, up to 5 states, organisations or people driving the events; summary, for articles marked (summarize) only, {self.config.summary_max_length} words or less with strategic focus: 1) Key events and actors involved 2) Strategic implications and goals 3) Relevance to regional security or global order 4) Potential escalations or indicators to monitor, analytical rather than descriptive, and otherwise an empty string. Respond with only a JSON array with one object per article, like [{{\"id\": 1, \"theme\": \"Emerging Tech\", \"relevance\": 0.7, \"key_actors\": [\"China\"], \"summary\": \"\"}}]."
+            },
+            {
+                "role": "user",
+                "content": "\n".join(lines)
+            }
+        ]
+    
+    def _enrichment_completion_tokens(self, articles: List[Article]) -> int:
+        """Completion token limit for a combined request; summaries take about two tokens per word"""
+        return sum(40 + (2 * self.config.summary_max_length if self._needs_summary(article) else 0)
+                   for article in articles) + 20
+    
+    def _enrich_batch(self, articles: List[Article]) -> List[Optional[str]]:
+        """Enrich several articles in one request, categorizing unparsed items one at a time"""
+        run_metrics.increment("openai.enrich_batches")
+        
+        parsed: Dict[int, Enrichment] = {}
+        try:
+            response = self._complete(self._enrichment_messages(articles),
+                                      self._enrichment_completion_tokens(articles), temperature=0.1)
+            parsed = parse_enrichments(response.choices[0].message.content or "", len(articles))
+        except BudgetExceeded:
+            pass
+        except Exception as e:
+            print(f"Error enriching batch of {len(articles)} articles: {e}")
+        
+        categories = []
+        for n, article in enumerate(articles, 1):
+            if n in parsed:
+                self._remember_enrichment(article, parsed[n])
+                categories.append(parsed[n].theme)
+            else:
+                run_metrics.increment("openai.categorize_fallbacks")
+                categories.append(self._categorize_one(article))
+        return categories
+    
+    def _remember_enrichment(self, article: Article, enrichment: Enrichment) -> None:
+        """Keep a combined result for the summary stage and store its category and summary"""
+        self.enrichments[article.id] = enrichment
+        article.key_actors = tuple(enrichment.key_actors)
+        self._store_category(article, enrichment.theme)
         
-        return category_map.get(category.lower(), category)
+        if enrichment.summary and self._needs_summary(article):
+            self._summaries[article.id] = (enrichment.summary, True)
+            if self.store is not None:
+                # Stored like a summarize_article result, which the combined prompt mirrors
+                content = self.tokens.truncate(article.content, self.config.article_max_tokens)
+                self.store.put(article.id, "summary", content_hash(article.title + "\n" + content),
+                               self.config.openai_model, self._summary_prompt_version(), enrichment.summary)
     
     def _simple_categorization(self, articles: List[Article]) -> Dict[str, List[Article]]:
-        """Simple keyword-based categorization fallback"""
+        """Keyword-based categorization fallback, scoring every theme and keeping the best"""
         categories = defaultdict(list)
         
-        keyword_map = {
-            "Geopolitical Tensions": ["china", "russia", "taiwan", "ukraine", "iran", "diplomacy", "sanctions", "trade war", "nuclear", "middle east", "africa", "asean", "indo-pacific"],
-            "Cybersecurity Warfare": ["cyber", "hack", "breach", "malware", "ransomware", "apt", "espionage", "disinformation", "deepfake", "infrastructure attack", "zero-day"],
-            "Emerging Tech": ["ai", "artificial intelligence", "quantum", "autonomous", "drone", "space", "satellite", "semiconductor", "chip", "biotech", "crispr", "5g"],
-            "National Security": ["terrorism", "extremism", "pandemic", "biosecurity", "food security", "energy security", "homeland", "radicalization", "social cohesion"],
-            "Military Modernization": ["military", "defense", "weapons", "hypersonic", "fighter", "naval", "alliance", "nato", "exercise", "doctrine", "hybrid warfare"],
-            "Rules-Based Order": ["un", "united nations", "sanctions", "peacekeeping", "unclos", "maritime law", "sovereignty", "international law", "humanitarian"],
-            "Strategic Foresight": ["climate", "demographic", "aging", "urbanization", "migration", "arctic", "resource", "megacities", "non-state", "wagner", "pmc"]
-        }
-        
         for article in articles:
-            content = (article.title + " " + (article.summary or "")).lower()
-            categorized = False
-            
-            for category, keywords in keyword_map.items():
-                if any(keyword in content for keyword in keywords):
-                    categories[category].append(article)
-                    categorized = True
-                    break
-            
+            theme = self._keyword_category(article)
+            if theme:
+                categories[theme].append(article)
             # Skip articles that don't match any military/intelligence themes
             # Don't add to "Uncategorized" - just exclude them completely
         
@@ -234,27 +682,86 @@ class SummarizationEngine:
             summary = self.summarize_article(article)
             article_summaries.append(f"• {article.title}: {summary}")
         
-        summaries_text = "\n".join(article_summaries)
+        # Trim the longest summaries, or drop the last articles, to fit the prompt budget
+        packed = pack(article_summaries, self.config.theme_prompt_max_tokens, self.tokens)
+        run_metrics.increment("budget.theme_articles_dropped", len(article_summaries) - len(packed))
+        summaries_text = "\n".join(packed)
         
         try:
-            response = self.client.chat.completions.create(
-                model=self.config.openai_model,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": f"You are an intelligence analyst for DIS scholarship preparation. Analyze the {theme} theme based on these articles. Provide a strategic brief covering: 1) Top 2-3 key developments and why they matter 2) Strategic trends and connections between events 3) First and second-order effects 4) Relevance to Singapore/regional stability if applicable 5) Key indicators to monitor next. Be analytical and trend-aware, not just summarizing."
-                    },
-                    {
-                        "role": "user",
-                        "content": summaries_text
-                    }
-                ],
-                max_tokens=1500,
-                temperature=0
-            )
+            response = self._complete(self._theme_messages(theme, summaries_text),
+                                      THEME_COMPLETION_TOKENS, temperature=0)
             
             formatted_content = self._format_markdown_to_html(response.choices[0].message.content.strip())
             return formatted_content
+        except BudgetExceeded:
+            return f"Theme: {theme} - {len(articles)} articles covering recent developments."
         except Exception as e:
             print(f"Error generating theme summary for {theme}: {e}")
-            return f"Theme: {theme} - {len(articles)} articles covering recent developments."
\ No newline at end of file
+            return f"Theme: {theme} - {len(articles)} articles covering recent developments."
+    
+    @staticmethod
+    def _theme_messages(theme: str, summaries_text: str) -> List[Dict[str, str]]:
+        """Chat messages asking for a strategic brief on one theme"""
+        return [
+            {
+                "role": "system",
+                "content": f"You are an intelligence analyst for DIS scholarship preparation. Analyze the {theme} theme based on these articles. Provide a strategic brief covering: 1) Top 2-3 key developments and why they matter 2) Strategic trends and connections between events 3) First and second-order effects 4) Relevance to Singapore/regional stability if applicable 5) Key indicators to monitor next. Be analytical and trend-aware, not just summarizing."
+            },
+            {
+                "role": "user",
+                "content": summaries_text
+            }
+        ]
+    
+    def project_spend(self, articles: List[Article]) -> Dict[str, Dict[str, float]]:
+        """Projected OpenAI requests, tokens and cost per stage, without sending any request
+        
+        Completion tokens are request limits, so they and the cost are upper
+        bounds. Summaries are projected for every article without one that is
+        not already summarized by a combined request, and a full theme prompt
+        for every theme that could have articles.
+        """
+        stages: Dict[str, Dict[str, float]] = {}
+        if not self.client:
+            return stages
+        
+        def add(stage: str, prompt_tokens: int, completion_tokens: int) -> None:
+            totals = stages.setdefault(stage, {"requests": 0, "prompt_tokens": 0, "completion_tokens": 0, "cost": 0.0})
+            totals["requests"] += 1
+            totals["prompt_tokens"] += prompt_tokens
+            totals["completion_tokens"] += completion_tokens
+            totals["cost"] += self.budget.cost_of(prompt_tokens, completion_tokens)
+        
+        known = self._known_categories(articles)
+        pending = [article for n, article in enumerate(articles) if n not in known]
+        batch_size = max(self.config.categorize_batch_size, 1)
+        if self.config.combined_enrichment:
+            for i in range(0, len(pending), batch_size):
+                batch = pending[i:i + batch_size]
+                add("enrich", self.tokens.count_messages(self._enrichment_messages(batch)),
+                    self._enrichment_completion_tokens(batch))
+        elif batch_size == 1:
+            for article in pending:
+                add("categorize", self.tokens.count_messages(self._category_messages(self._category_input(article))),
+                    CATEGORY_COMPLETION_TOKENS)
+        else:
+            for i in range(0, len(pending), batch_size):
+                batch = pending[i:i + batch_size]
+                add("categorize", self.tokens.count_messages(self._batch_messages(batch)),
+                    self._batch_completion_tokens(len(batch)))
+        
+        # Combined requests already summarize the articles they enrich
+        enriched = {article.id for article in pending} if self.config.combined_enrichment else set()
+        for article in articles:
+            if not self._needs_summary(article) or article.id in enriched:
+                continue
+            content = self.tokens.truncate(article.content, self.config.article_max_tokens)
+            if not self._stored_summary(article, content_hash(article.title + "\n" + content))[0]:
+                add("summarize", self.tokens.count_messages(self._summary_messages(article, content)),
+                    SUMMARY_COMPLETION_TOKENS)
+        
+        for theme in THEMES[:len(articles)]:
+            add("theme summaries", self.tokens.count_messages(self._theme_messages(theme, ""))
+                + self.config.theme_prompt_max_tokens, THEME_COMPLETION_TOKENS)
+        
+        return stages
@@ -0,0 +1,190 @@
+"""Keyword-based theme scoring for categorizing without an API key"""
+
+import re
+from collections import deque
+from typing import List, Dict, Optional, Tuple, Iterable
+
+WORD_PATTERN = re.compile(r"[a-z0-9]+")
+
+# Keyword weights per analytical theme; phrases and unambiguous terms weigh
+# more than short or generic words. Inflections ("sanctioned", "drones") are
+# added automatically, so list base forms.
+THEME_KEYWORDS: Dict[str, Dict[str, float]] = {
+    "Geopolitical Tensions": {
+        "china": 1.0, "russia": 1.0, "taiwan": 1.0, "ukraine": 1.0, "iran": 1.0, "diplomacy": 1.0,
+        "sanction": 1.0, "trade war": 2.0, "nuclear": 1.0, "middle east": 2.0, "africa": 0.5,
+        "asean": 1.0, "indo-pacific": 2.0,
+    },
+    "Cybersecurity Warfare": {
+        "cyber": 1.0, "cyberattack": 2.0, "cybersecurity": 2.0, "hack": 1.0, "hacker": 1.0,
+        "breach": 1.0, "malware": 2.0, "ransomware": 2.0, "apt": 0.5, "espionage": 1.0,
+        "disinformation": 1.0, "deepfake": 1.0, "infrastructure attack": 2.0, "zero-day": 2.0,
+    },
+    "Emerging Tech": {
+        "ai": 1.0, "artificial intelligence": 2.0, "quantum": 1.0, "autonomous": 1.0, "drone": 1.0,
+        "space": 0.5, "satellite": 1.0, "semiconductor": 1.0, "chip": 0.5, "biotech": 1.0,
+        "crispr": 1.0, "5g": 1.0,
+    },
+    "National Security": {
+        "terrorism": 2.0, "terrorist": 2.0, "extremism": 1.0, "pandemic": 1.0, "biosecurity": 2.0,
+        "food security": 2.0, "energy security": 2.0, "homeland": 1.0, "radicalization": 1.0,
+        "social cohesion": 2.0,
+    },
+    "Military Modernization": {
+        "military": 1.0, "defense": 1.0, "defence": 1.0, "weapon": 1.0, "hypersonic": 2.0,
+        "fighter": 0.5, "naval": 1.0, "alliance": 0.5, "nato": 1.0, "exercise": 0.5, "doctrine": 1.0,
+        "hybrid warfare": 2.0,
+    },
+    "Rules-Based Order": {
+        "un": 1.0, "united nations": 2.0, "sanction": 1.0, "peacekeeping": 2.0, "unclos": 2.0,
+        "maritime law": 2.0, "sovereignty": 1.0, "international law": 2.0, "humanitarian": 1.0,
+    },
+    "Strategic Foresight": {
+        "climate": 1.0, "demographic": 1.0, "aging": 0.5, "urbanization": 1.0, "migration": 1.0,
+        "arctic": 1.0, "resource": 0.5, "megacity": 1.0, "megacities": 1.0, "non-state": 1.0,
+        "wagner": 1.0, "pmc": 1.0,
+    },
+}
+
+# Least total weight an article needs before it is assigned a theme
+MIN_SCORE = 1.0
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercased alphanumeric words"""
+    return WORD_PATTERN.findall(text.lower())
+
+
+def word_pattern(words: Iterable[str]) -> "re.Pattern":
+    """Regex matching any of words as a whole word, compiled as a character trie
+
+    A trie-shaped pattern lets the regex engine reject most positions after
+    one character instead of trying every word in turn.
+    """
+    trie: Dict[str, dict] = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def build(node: Dict[str, dict]) -> str:
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        if "" in node:
+            return "(?:" + "|".join(branches) + ")?"
+        return branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+
+    return re.compile(r"(?<![a-z0-9])" + build(trie) + r"(?![a-z0-9])")
+
+
+def inflections(word: str) -> List[str]:
+    """Common English inflections of a keyword's last word"""
+    if len(word) < 3 or word.isdigit():
+        return [word, word + "s"]
+    if word.endswith("e"):
+        return [word, word + "s", word + "d", word + "r", word + "rs", word[:-1] + "ing"]
+    if word.endswith("y"):
+        return [word, word[:-1] + "ies", word + "s", word + "ing"]
+    return [word, word + "s", word + "es", word + "ed", word + "ing", word + "er", word + "ers"]
+
+
+class KeywordMatcher:
+    """Aho-Corasick automaton over word tokens with weighted labels
+
+    Keywords are sequences of whole words, so "un" never matches inside
+    "under" and "ai" never inside "said". Every match adds its weight to its
+    label, and all labels are scored in a single pass over the text no
+    matter how many keywords there are.
+
+    Splitting text into words costs more than matching them, so a trie regex
+    over the keyword vocabulary picks out only the words that can take part
+    in a match. A gap containing any other word resets the automaton.
+    """
+
+    def __init__(self, keywords: Iterable[Tuple[str, str, float]], expand_inflections: bool = True):
+        self.labels: List[str] = []
+        label_index: Dict[str, int] = {}
+
+        goto: List[Dict[str, int]] = [{}]
+        outputs: List[List[Tuple[int, float]]] = [[]]
+        for phrase, label, weight in keywords:
+            if label not in label_index:
+                label_index[label] = len(self.labels)
+                self.labels.append(label)
+            words = tokenize(phrase)
+            if not words:
+                continue
+            variants = inflections(words[-1]) if expand_inflections else [words[-1]]
+            for last in variants:
+                state = 0
+                for word in words[:-1] + [last]:
+                    if word not in goto[state]:
+                        goto[state][word] = len(goto)
+                        goto.append({})
+                        outputs.append([])
+                    state = goto[state][word]
+                if (label_index[label], weight) not in outputs[state]:
+                    outputs[state].append((label_index[label], weight))
+
+        # Breadth-first failure links. Each state keeps only transitions that
+        # lead somewhere other than a child of the root; matching falls back
+        # to the root transitions, which keeps the tables small.
+        fail = [0] * len(goto)
+        self._transitions: List[Dict[str, int]] = [{} for _ in goto]
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            transitions = dict(self._transitions[fail[state]])
+            transitions.update(goto[state])
+            self._transitions[state] = transitions
+            outputs[state].extend(outputs[fail[state]])
+            for word, child in goto[state].items():
+                target = fail[state]
+                while target and word not in goto[target]:
+                    target = fail[target]
+                fail[child] = goto[target].get(word, 0)
+                queue.append(child)
+
+        self._root = goto[0]
+        self._outputs = [tuple(output) for output in outputs]
+        self._pattern = word_pattern({word for transitions in goto for word in transitions})
+
+    @classmethod
+    def from_themes(cls, themes: Dict[str, Dict[str, float]], **kwargs) -> "KeywordMatcher":
+        """Build a matcher from {theme: {keyword: weight}}"""
+        return cls(((keyword, theme, weight) for theme, keywords in themes.items()
+                    for keyword, weight in keywords.items()), **kwargs)
+
+    def _totals(self, text: str) -> List[float]:
+        """Total keyword weight per label index"""
+        totals = [0.0] * len(self.labels)
+        root, transitions, outputs = self._root, self._transitions, self._outputs
+        text = text.lower()
+        state = 0
+        previous_end = 0
+        for match in self._pattern.finditer(text):
+            word = match.group()
+            if state and not WORD_PATTERN.search(text, previous_end, match.start()):
+                state = transitions[state].get(word) or root.get(word, 0)
+            else:
+                state = root.get(word, 0)
+            previous_end = match.end()
+            for label, weight in outputs[state]:
+                totals[label] += weight
+        return totals
+
+    def scores(self, text: str) -> Dict[str, float]:
+        """Total keyword weight per label found in text"""
+        return {self.labels[index]: total for index, total in enumerate(self._totals(text)) if total}
+
+    def best_label(self, text: str, min_score: float = MIN_SCORE) -> Optional[str]:
+        """The highest-scoring label, or None below min_score; ties go to the earlier label"""
+        totals = self._totals(text)
+        best = max(range(len(totals)), key=totals.__getitem__)
+        return self.labels[best] if totals[best] >= min_score else None
+
+
+# Shared by every engine; built once at import
+THEME_MATCHER = KeywordMatcher.from_themes(THEME_KEYWORDS)
@@ -0,0 +1,143 @@
+"""Persistent store of per-article LLM results"""
+
+import hashlib
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+STORE_FILENAME = "enrichment.sqlite3"
+
+
+def content_hash(text: str) -> str:
+    """Hash of the text an enrichment was computed from"""
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+
+class EnrichmentStore:
+    """SQLite table of categories and summaries, one row per article and kind
+
+    A stored value is only returned while the article's content hash, the
+    model and the prompt version all match, so edited articles, model
+    changes and prompt changes are enriched again. Reading a value refreshes
+    its access time; eviction removes rows older than max_age_days, then the
+    least recently used rows beyond max_entries.
+
+    The text each category was computed from is kept in a separate table of
+    labelled examples, used to train the local theme classifier. Examples
+    do not expire; only the oldest beyond max_entries are removed.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS enrichment (
+            article_id TEXT NOT NULL,
+            kind TEXT NOT NULL,
+            content_hash TEXT NOT NULL,
+            model TEXT NOT NULL,
+            prompt_version TEXT NOT NULL,
+            value TEXT,
+            created_at REAL NOT NULL,
+            accessed_at REAL NOT NULL,
+            PRIMARY KEY (article_id, kind)
+        );
+        CREATE INDEX IF NOT EXISTS enrichment_accessed ON enrichment (accessed_at);
+        CREATE TABLE IF NOT EXISTS category_examples (
+            article_id TEXT PRIMARY KEY,
+            text TEXT NOT NULL,
+            theme TEXT,
+            model TEXT NOT NULL,
+            created_at REAL NOT NULL
+        );
+    """
+
+    def __init__(self, path: str, max_entries: int = 50000, max_age_days: int = 30):
+        self.path = Path(path)
+        self.max_entries = max_entries
+        self.max_age_seconds = max_age_days * 86400
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # Categorization runs on a thread pool, so share one connection behind a lock
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._conn:
+            self._conn.executescript(self.SCHEMA)
+
+    def get(self, article_id: str, kind: str, digest: str, model: str,
+            prompt_version: str) -> Tuple[bool, Optional[str]]:
+        """Look up a stored value, returning (found, value)
+
+        value may be None when found, e.g. for articles categorized as irrelevant.
+        """
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                "SELECT value FROM enrichment WHERE article_id = ? AND kind = ? AND content_hash = ? "
+                "AND model = ? AND prompt_version = ? AND created_at >= ?",
+                (article_id, kind, digest, model, prompt_version, time.time() - self.max_age_seconds)
+            ).fetchone()
+            if row is None:
+                return False, None
+            self._conn.execute("UPDATE enrichment SET accessed_at = ? WHERE article_id = ? AND kind = ?",
+                               (time.time(), article_id, kind))
+        return True, row[0]
+
+    def put(self, article_id: str, kind: str, digest: str, model: str,
+            prompt_version: str, value: Optional[str]) -> None:
+        """Store a value, replacing any older one for the same article and kind"""
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO enrichment VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (article_id, kind, digest, model, prompt_version, value, now, now)
+            )
+
+    def add_example(self, article_id: str, text: str, theme: Optional[str], model: str) -> None:
+        """Record the text and theme of an article categorized by the LLM"""
+        with self._lock, self._conn:
+            self._conn.execute("INSERT OR REPLACE INTO category_examples VALUES (?, ?, ?, ?, ?)",
+                               (article_id, text, theme, model, time.time()))
+
+    def category_examples(self) -> List[Tuple[str, str, Optional[str]]]:
+        """All labelled examples as (article_id, text, theme), oldest first"""
+        with self._lock:
+            return self._conn.execute(
+                "SELECT article_id, text, theme FROM category_examples ORDER BY created_at"
+            ).fetchall()
+
+    def evict(self) -> int:
+        """Remove expired rows, then least recently used ones over the entry limit
+
+        Returns the number of rows removed.
+        """
+        with self._lock, self._conn:
+            removed = self._conn.execute("DELETE FROM enrichment WHERE created_at < ?",
+                                         (time.time() - self.max_age_seconds,)).rowcount
+            (count,) = self._conn.execute("SELECT COUNT(*) FROM enrichment").fetchone()
+            if count > self.max_entries:
+                removed += self._conn.execute(
+                    "DELETE FROM enrichment WHERE rowid IN "
+                    "(SELECT rowid FROM enrichment ORDER BY accessed_at LIMIT ?)",
+                    (count - self.max_entries,)
+                ).rowcount
+            (count,) = self._conn.execute("SELECT COUNT(*) FROM category_examples").fetchone()
+            if count > self.max_entries:
+                removed += self._conn.execute(
+                    "DELETE FROM category_examples WHERE rowid IN "
+                    "(SELECT rowid FROM category_examples ORDER BY created_at LIMIT ?)",
+                    (count - self.max_entries,)
+                ).rowcount
+        return removed
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM enrichment").fetchone()[0]
+
+    def clear(self) -> None:
+        """Remove all stored enrichments"""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM enrichment")
+            self._conn.execute("DELETE FROM category_examples")
+
+    def close(self) -> None:
+        """Close the database connection"""
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,165 @@
+"""Token counting, prompt packing and per-run token budgets for OpenAI requests"""
+
+import threading
+from functools import lru_cache
+from typing import List, Dict, Optional, Tuple, Any
+
+try:
+    import tiktoken
+    TIKTOKEN_AVAILABLE = True
+except ImportError:
+    TIKTOKEN_AVAILABLE = False
+
+# Rough average for English text, used when no tokenizer is available
+CHARS_PER_TOKEN = 4
+
+# Tokens a chat message adds for its role and separators, and a reply adds for priming
+MESSAGE_OVERHEAD = 4
+REPLY_OVERHEAD = 3
+
+# USD per million (prompt, completion) tokens; the longest matching model prefix wins
+MODEL_PRICES: Dict[str, Tuple[float, float]] = {
+    "gpt-3.5-turbo": (0.50, 1.50),
+    "gpt-4": (30.00, 60.00),
+    "gpt-4-turbo": (10.00, 30.00),
+    "gpt-4o": (2.50, 10.00),
+    "gpt-4o-mini": (0.15, 0.60),
+    "gpt-4.1": (2.00, 8.00),
+    "gpt-4.1-mini": (0.40, 1.60),
+    "gpt-4.1-nano": (0.10, 0.40),
+}
+
+
+class BudgetExceeded(Exception):
+    """Raised when a request would pass the run's token or cost ceiling"""
+
+
+def model_prices(model: str) -> Optional[Tuple[float, float]]:
+    """Prices for a model, or None if it is not in MODEL_PRICES"""
+    matches = [name for name in MODEL_PRICES if model.startswith(name)]
+    return MODEL_PRICES[max(matches, key=len)] if matches else None
+
+
+@lru_cache(maxsize=None)
+def _encoding(model: str) -> Optional[Any]:
+    """The model's tiktoken encoding, or None to estimate from characters"""
+    if not TIKTOKEN_AVAILABLE:
+        return None
+    try:
+        try:
+            return tiktoken.encoding_for_model(model)
+        except KeyError:
+            return tiktoken.get_encoding("o200k_base")
+    except Exception as e:
+        # Encodings are downloaded on first use, which fails offline
+        print(f"⚠️  No tokenizer for {model}, estimating tokens from characters: {e}")
+        return None
+
+
+class TokenCounter:
+    """Count and cut text in a model's tokens"""
+
+    def __init__(self, model: str):
+        self.model = model
+
+    def count(self, text: str) -> int:
+        """Number of tokens in text"""
+        encoding = _encoding(self.model)
+        if encoding is None:
+            return -(-len(text) // CHARS_PER_TOKEN)
+        return len(encoding.encode(text, disallowed_special=()))
+
+    def count_messages(self, messages: List[Dict[str, str]]) -> int:
+        """Prompt tokens of a chat completion request"""
+        return sum(self.count(message["content"]) + MESSAGE_OVERHEAD for message in messages) + REPLY_OVERHEAD
+
+    def truncate(self, text: str, max_tokens: int, suffix: str = "...") -> str:
+        """Cut text to at most max_tokens, marking the cut with suffix"""
+        if len(text) <= max_tokens:
+            # Every token covers at least one character
+            return text
+        encoding = _encoding(self.model)
+        if encoding is None:
+            limit = max_tokens * CHARS_PER_TOKEN
+            return text if len(text) <= limit else text[:max(limit - len(suffix), 0)] + suffix
+        tokens = encoding.encode(text, disallowed_special=())
+        if len(tokens) <= max_tokens:
+            return text
+        return encoding.decode(tokens[:max(max_tokens - self.count(suffix), 0)]) + suffix
+
+
+def pack(texts: List[str], max_tokens: int, counter: TokenCounter, min_tokens: int = 32,
+         separator_tokens: int = 1) -> List[str]:
+    """Fit texts into max_tokens in total, covering as many of them as possible
+
+    texts are in order of priority. When even min_tokens each does not fit,
+    the lowest-priority texts are dropped. The rest share the budget
+    equally: texts shorter than their share leave the remainder to the
+    others, and only the longest are trimmed, all to the same length.
+    """
+    keep = min(len(texts), max_tokens // (min_tokens + separator_tokens))
+    counts = [counter.count(text) for text in texts[:keep]]
+    remaining = max_tokens - keep * separator_tokens
+
+    cap = None
+    for position, count in enumerate(sorted(counts)):
+        share = remaining // (keep - position)
+        if count > share:
+            cap = share
+            break
+        remaining -= count
+
+    return [text if cap is None or count <= cap else counter.truncate(text, cap)
+            for text, count in zip(texts, counts)]
+
+
+class TokenBudget:
+    """Per-run ceilings on OpenAI tokens and estimated cost, shared across threads
+
+    Before a request is sent its prompt tokens and completion limit are
+    reserved; once it returns the reservation is replaced by its reported
+    usage. Requests whose reservation would pass a ceiling are refused.
+    A ceiling of 0 means no limit.
+    """
+
+    def __init__(self, model: str, max_tokens: int = 0, max_cost: float = 0.0):
+        self.max_tokens = max_tokens
+        self.max_cost = max_cost
+        self.prices = model_prices(model)
+        if max_cost and self.prices is None:
+            print(f"⚠️  No prices known for {model}, the run cost ceiling is not enforced")
+        self.tokens = 0
+        self.cost = 0.0
+        self._lock = threading.Lock()
+
+    def cost_of(self, prompt_tokens: int, completion_tokens: int) -> float:
+        """Estimated USD cost of a request"""
+        if self.prices is None:
+            return 0.0
+        prompt_price, completion_price = self.prices
+        return (prompt_tokens * prompt_price + completion_tokens * completion_price) / 1_000_000
+
+    def reserve(self, prompt_tokens: int, completion_tokens: int) -> bool:
+        """Reserve a request's tokens, or return False if they would pass a ceiling"""
+        tokens = prompt_tokens + completion_tokens
+        cost = self.cost_of(prompt_tokens, completion_tokens)
+        with self._lock:
+            if self.max_tokens and self.tokens + tokens > self.max_tokens:
+                return False
+            if self.max_cost and self.prices is not None and self.cost + cost > self.max_cost:
+                return False
+            self.tokens += tokens
+            self.cost += cost
+        return True
+
+    def reset(self) -> None:
+        """Start a new run with nothing spent"""
+        with self._lock:
+            self.tokens = 0
+            self.cost = 0.0
+
+    def settle(self, reserved: Tuple[int, int], used: Tuple[int, int]) -> None:
+        """Replace a reservation of (prompt, completion) tokens with actual usage"""
+        with self._lock:
+            self.tokens += sum(used) - sum(reserved)
+            self.cost += self.cost_of(*used) - self.cost_of(*reserved)
@@ -0,0 +1,69 @@
+"""Shared HTTP transport for the Inoreader API client and OAuth"""
+
+from typing import Optional, Tuple, Union
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from . import __version__
+from .config import Config
+
+try:
+    import brotli  # noqa: F401 - enables br decoding in urllib3 and aiohttp
+    BROTLI_AVAILABLE = True
+except ImportError:
+    try:
+        import brotlicffi  # noqa: F401
+        BROTLI_AVAILABLE = True
+    except ImportError:
+        BROTLI_AVAILABLE = False
+
+Timeout = Union[float, Tuple[float, float]]
+
+USER_AGENT = f"inoreader-intelligence/{__version__}"
+
+
+def accept_encoding() -> str:
+    """Compression schemes we can decode"""
+    return "gzip, deflate, br" if BROTLI_AVAILABLE else "gzip, deflate"
+
+
+class TimeoutHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter that applies a default (connect, read) timeout to every request"""
+
+    def __init__(self, timeout: Timeout, *args, **kwargs):
+        self.timeout = timeout
+        super().__init__(*args, **kwargs)
+
+    def send(self, request, timeout: Optional[Timeout] = None, **kwargs):
+        return super().send(request, timeout=timeout if timeout is not None else self.timeout, **kwargs)
+
+
+def create_session(config: Config) -> requests.Session:
+    """Create a pooled keep-alive session with timeouts
+
+    requests already asks for gzip; brotli is added when it is installed.
+    Retries are handled by the API client, so the adapter itself never
+    retries.
+    """
+    session = requests.Session()
+    adapter = TimeoutHTTPAdapter(
+        timeout=(config.http_connect_timeout, config.http_read_timeout),
+        pool_connections=config.http_pool_connections,
+        pool_maxsize=config.http_pool_maxsize,
+        max_retries=0
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update({
+        "User-Agent": USER_AGENT,
+        "Accept-Encoding": accept_encoding(),
+        "Connection": "keep-alive"
+    })
+    return session
+
+
+def request_timeout(config: Config, remaining: float) -> Tuple[float, float]:
+    """Connect/read timeouts capped by the time left before a request's deadline"""
+    remaining = max(remaining, 1.0)
+    return min(config.http_connect_timeout, remaining), min(config.http_read_timeout, remaining)
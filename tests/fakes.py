@@ -0,0 +1,99 @@
+"""
+Local stand-ins for the OpenAI and Inoreader APIs shared by the test scripts
+Tests subclass a handler and override only the behaviour their scenario needs
+"""
+
+import json
+import threading
+from contextlib import contextmanager
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from typing import Any, Dict, Iterator, List, Optional
+
+
+def chat_completion(content: str, prompt_tokens: int = 100, completion_tokens: int = 50) -> Dict[str, Any]:
+    """A chat.completion response body with the given reply and usage"""
+    return {
+        "id": "chatcmpl-test", "object": "chat.completion", "created": 0, "model": "gpt-4o-mini",
+        "choices": [{"index": 0, "message": {"role": "assistant", "content": content},
+                     "finish_reason": "stop"}],
+        "usage": {"prompt_tokens": prompt_tokens, "completion_tokens": completion_tokens,
+                  "total_tokens": prompt_tokens + completion_tokens}
+    }
+
+
+class QuietHandler(BaseHTTPRequestHandler):
+    """Request handler with body helpers that keeps test output free of access logs"""
+
+    def read_body(self) -> bytes:
+        return self.rfile.read(int(self.headers["Content-Length"]))
+
+    def read_json(self) -> Any:
+        return json.loads(self.read_body())
+
+    def send_body(self, body: bytes, status: int = 200, content_type: str = "application/json",
+                  headers: Optional[Dict[str, str]] = None) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def send_json(self, payload: Any, status: int = 200, headers: Optional[Dict[str, str]] = None) -> None:
+        self.send_body(json.dumps(payload).encode(), status, headers=headers)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class FakeOpenAIHandler(QuietHandler):
+    """Answer chat completions with reply(), or a 400 error when it returns None"""
+
+    usage = (100, 50)
+
+    def do_POST(self):
+        content = self.reply(self.read_json()["messages"])
+        if content is None:
+            self.send_json({"error": {"message": "bad request", "type": "invalid_request_error"}}, status=400)
+        else:
+            self.send_json(chat_completion(content, *self.usage))
+
+    def reply(self, messages: List[Dict[str, str]]) -> Optional[str]:
+        raise NotImplementedError
+
+
+@contextmanager
+def serve(handler) -> Iterator[str]:
+    """Run a handler on a free local port for the duration of the block, yielding its base URL"""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        yield f"http://127.0.0.1:{server.server_port}"
+    finally:
+        server.shutdown()
+
+
+def make_inoreader_client(base_url: str, cache_dir: Optional[str] = None, **overrides):
+    """An InoreaderClient with a token, sending its requests to base_url"""
+    from inoreader_intelligence.config import Config
+    from inoreader_intelligence.api import InoreaderClient
+
+    if cache_dir is not None:
+        overrides["cache_dir"] = cache_dir
+    client = InoreaderClient(Config(inoreader_app_id="id", inoreader_app_key="key", email_recipients=[],
+                                    **overrides))
+    client.oauth.access_token = "token"
+    client.BASE_URL = base_url
+    return client
+
+
+def make_engine(base_url: str, **overrides):
+    """A SummarizationEngine whose OpenAI client talks to base_url; pass openai_api_key=None for none"""
+    from inoreader_intelligence.config import Config
+    from inoreader_intelligence.summarizer import SummarizationEngine
+
+    settings = {"openai_api_key": "sk-test", "openai_model": "gpt-4o-mini"}
+    settings.update(overrides)
+    return SummarizationEngine(Config(inoreader_app_id="id", inoreader_app_key="key", email_recipients=[],
+                                      openai_base_url=f"{base_url}/v1", **settings))
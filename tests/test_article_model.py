@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Test script for the slotted Article model and its lazy fields
+"""
+
+import sys
+import json
+from datetime import datetime
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+
+def _item(number):
+    return {
+        "id": f"tag:google.com,2005:reader/item/{number:016x}",
+        "title": f"Article {number}",
+        "published": 1700000000 + number,
+        "updated": 1700000100 + number,
+        "timestampUsec": str((1700000000 + number) * 1000000),
+        "categories": ["user/-/state/com.google/reading-list"],
+        "tags": [{"id": "user/-/label/Focus", "label": "Focus"}],
+        "alternate": [{"href": f"https://example.com/{number}", "type": "text/html"}],
+        "summary": {"content": "<p>Snippet</p>"},
+        "content": {"content": f"<div><p>Body of article {number}</p><script>x()</script></div>"},
+        "author": "Staff",
+        "origin": {"streamId": "feed/https://example.com/rss", "title": "Example News"},
+    }
+
+
+def test_article_model():
+    """API articles should decode lazily and match keyword-constructed ones"""
+    from inoreader_intelligence.api import Article
+
+    # Decoded JSON gives every article its own copy of the feed strings
+    first, second = json.loads(json.dumps([_item(1), _item(2)]))
+    assert first["origin"]["title"] is not second["origin"]["title"]
+
+    article = Article.from_api_response(first)
+    assert not hasattr(article, "__dict__")
+    assert article._published == 1700000001 and article._tags is None
+
+    assert article.published == datetime.fromtimestamp(1700000001)
+    assert isinstance(article._published, datetime)
+    assert article.tags == ["Focus"] and article._raw_tags is None
+    assert article.text == "Body of article 1"
+    article.content = "<p>Replaced</p>"
+    assert article.text == "Replaced"
+    print("✅ Timestamps, tag labels and text decoded on first access")
+
+    other = Article.from_api_response(second)
+    assert article.feed_title is other.feed_title
+    assert article.feed_id is other.feed_id
+    print("✅ Feed strings interned")
+
+    built = Article(
+        id=other.id, title=other.title, summary=other.summary, content=other.content,
+        url=other.url, author="Staff", published=datetime.fromtimestamp(1700000002),
+        updated=datetime.fromtimestamp(1700000102), feed_id=other.feed_id,
+        feed_title="Example News", categories=["user/-/state/com.google/reading-list"], tags=["Focus"],
+        timestamp_usec=1700000002 * 1000000
+    )
+    assert built == other and built != article
+    assert Article.from_api_response({"id": "1"}).tags == []
+    print("✅ Keyword constructor matches API construction")
+    return True
+
+
+def test_inoreader_urls():
+    """Deep links should be computed once per batch, with fallbacks counted instead of printed"""
+    import io
+    from contextlib import redirect_stdout
+    from inoreader_intelligence.api import Article
+    from inoreader_intelligence.api.models import assign_inoreader_urls
+    from inoreader_intelligence.metrics import run_metrics
+
+    articles = [
+        Article.from_api_response({"id": "tag:google.com,2005:reader/item/255", "title": "Decimal"}),
+        Article.from_api_response({"id": "tag:google.com,2005:reader/item/00000000000000ff",
+                                   "title": "South China Sea patrols expand again"}),
+        Article.from_api_response({"id": "unexpected", "alternate": [{"href": "https://example.com/a"}]}),
+    ]
+
+    run_metrics.reset()
+    output = io.StringIO()
+    with redirect_stdout(output):
+        assert assign_inoreader_urls(articles) == 2
+        assert assign_inoreader_urls(articles) == 0
+
+    assert output.getvalue() == ""
+    assert articles[0].inoreader_url == "https://www.inoreader.com/article/ff"
+    assert articles[1].get_inoreader_url() == "https://www.inoreader.com/search/global/South%20China%20Sea%20patrols"
+    assert articles[2].inoreader_url == "https://example.com/a"
+    assert run_metrics.get("articles.inoreader_url_fallbacks") == 2
+    print("✅ Inoreader links precomputed, fallbacks counted once")
+    return True
+
+
+def main():
+    """Main test function"""
+    print("🧪 Testing Article Model")
+    print("=" * 50)
+
+    try:
+        success = test_article_model() and test_inoreader_urls()
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        success = False
+
+    print(f"\n{'🎉 Article model tests passed!' if success else '❌ Article model tests failed'}")
+    return success
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
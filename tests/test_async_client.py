@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Test script for concurrent multi-stream fetching
+Runs the async client against a local stand-in for the Inoreader API
+"""
+
+import sys
+import time
+from unittest import mock
+from pathlib import Path
+from urllib.parse import urlparse, unquote
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from fakes import QuietHandler, serve, make_inoreader_client
+
+STREAM_DELAY = 0.2
+
+
+class FakeInoreaderHandler(QuietHandler):
+    """Serve one article per stream, shared across two streams for dedupe"""
+
+    def do_GET(self):
+        path = unquote(urlparse(self.path).path)
+        stream_id = path.split("stream/contents/")[-1]
+        time.sleep(STREAM_DELAY)
+
+        items = [
+            {"id": f"tag:google.com,2005:reader/item/{stream_id}", "title": stream_id},
+            {"id": "tag:google.com,2005:reader/item/shared", "title": "Shared"},
+        ]
+        self.send_json({"items": items})
+
+
+def test_concurrent_tag_fetch():
+    """Fetching several tags should overlap and keep tag order"""
+    from inoreader_intelligence.api import AsyncInoreaderClient
+
+    with serve(FakeInoreaderHandler) as base_url, mock.patch.object(AsyncInoreaderClient, "BASE_URL", base_url):
+        client = make_inoreader_client(base_url, max_concurrent_requests=8)
+        tag_ids = [f"user/-/label/Tag{i}" for i in range(6)]
+
+        started = time.perf_counter()
+        articles = client.get_articles_by_tags(tag_ids, count=10)
+        elapsed = time.perf_counter() - started
+
+        print(f"✅ Fetched {len(articles)} articles from {len(tag_ids)} tags in {elapsed:.2f}s")
+        assert [a.title for a in articles[::2]] == tag_ids
+        assert elapsed < STREAM_DELAY * len(tag_ids) / 2
+
+        unique = client._dedupe_articles(articles)
+        print(f"✅ Dedupe kept {len(unique)} unique articles")
+        assert len(unique) == len(tag_ids) + 1
+
+    return True
+
+
+def main():
+    """Main test function"""
+    print("🧪 Testing Async Multi-Stream Fetching")
+    print("=" * 50)
+
+    try:
+        success = test_concurrent_tag_fetch()
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        success = False
+
+    print(f"\n{'🎉 Async client tests passed!' if success else '❌ Async client tests failed'}")
+    return success
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Test script for combined categorize-and-summarize requests against a local fake OpenAI endpoint
+"""
+
+import sys
+import json
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from fakes import FakeOpenAIHandler, serve, make_engine
+
+requests = []
+
+
+def _theme(text):
+    return "IRRELEVANT" if "football" in text else "cyber" if "hack" in text else "Emerging Tech"
+
+
+class EnrichmentHandler(FakeOpenAIHandler):
+    """Answer combined requests with JSON enrichments and single categorizations with a theme"""
+
+    def reply(self, messages):
+        system, prompt = [m["content"] for m in messages]
+        requests.append(system)
+
+        if "key_actors" not in system:
+            return _theme(prompt)
+
+        # Leave "missing" articles out so they are categorized individually
+        entries = []
+        for line in prompt.splitlines():
+            if "missing" in line:
+                continue
+            number = int(line[1:line.index("]")])
+            entries.append({
+                "id": number, "theme": _theme(line), "relevance": number / 10,
+                "key_actors": ["Lazarus Group"] if "hack" in line else [],
+                "summary": f"Summary of article {number}." if "(summarize)" in line else ""
+            })
+        return json.dumps(entries)
+
+
+def test_parse_enrichments():
+    """Combined replies should be validated field by field"""
+    from inoreader_intelligence.summarizer.engine import parse_enrichments, Enrichment
+
+    reply = json.dumps([
+        {"id": 1, "theme": "cyber", "relevance": 1.4, "key_actors": ["APT29", 7, " "], "summary": " Brief. "},
+        {"id": 2, "theme": "IRRELEVANT", "relevance": "0.1", "key_actors": [], "summary": ""},
+        {"id": 3, "theme": "Sports", "relevance": 0.5},
+        {"id": 4, "theme": "Emerging Tech"},
+        {"id": 5, "theme": "Emerging Tech", "relevance": 0.5, "key_actors": "NASA"},
+        {"id": 1, "theme": "Emerging Tech", "relevance": 0.5},
+    ])
+    assert parse_enrichments("```json\n" + reply + "\n```", 5) == {
+        1: Enrichment("Cybersecurity Warfare", 1.0, "Brief.", ["APT29"]),
+        2: Enrichment(None, 0.1, "", []),
+    }
+    assert parse_enrichments("No JSON here", 5) == {}
+    print("✅ Invalid themes, relevance scores, actor lists and duplicate IDs are dropped")
+
+    return True
+
+
+def test_combined_enrichment():
+    """One request per batch should return categories and summaries together"""
+    from inoreader_intelligence.api import Article
+    from inoreader_intelligence.metrics import run_metrics
+
+    with serve(EnrichmentHandler) as base_url:
+        engine = make_engine(base_url, enrichment_store=False, combined_enrichment=True, categorize_batch_size=3)
+
+        # Feed summaries need no generated summary; full content does
+        articles = [Article.from_api_response({"id": f"item-{n}", "title": f"Article {n} about {topic}",
+                                               **({"content": {"content": "Full text. " * 20}} if n % 2
+                                                  else {"summary": {"content": "Feed summary."}})})
+                    for n, topic in enumerate(["quantum", "hack", "football", "hack missing", "drone", "hack"])]
+
+        projection = engine.project_spend(articles)
+        assert projection["enrich"]["requests"] == 2 and "summarize" not in projection
+        print("✅ Dry runs project combined requests and no separate summaries")
+
+        run_metrics.reset()
+        categories = engine.categorize_articles(articles)
+        assert categories == {
+            "Emerging Tech": [articles[4], articles[0]],
+            "Cybersecurity Warfare": [articles[3], articles[5], articles[1]],
+        }
+        assert run_metrics.get("openai.enrich_batches") == 2
+        assert run_metrics.get("openai.categorize_fallbacks") == 1
+        assert len(requests) == 3
+        assert articles[1].key_actors == ("Lazarus Group",) and articles[0].key_actors == ()
+        print("✅ Articles are categorized in two combined requests, most relevant first, unscored ones at 0.5")
+
+        summaries = [engine.summarize_article(article) for article in articles]
+        assert summaries[1] == "Summary of article 2." and summaries[5] == "Summary of article 3."
+        assert summaries[0] == "Feed summary."
+        assert len(requests) == 4
+        print("✅ Combined summaries are reused; only the article that fell back is summarized separately")
+
+    return True
+
+
+def main():
+    """Main test function"""
+    print("🧪 Testing Combined Enrichment")
+    print("=" * 50)
+
+    try:
+        success = test_parse_enrichments() and test_combined_enrichment()
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        success = False
+
+    print(f"\n{'🎉 Combined enrichment tests passed!' if success else '❌ Combined enrichment tests failed'}")
+    return success
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Test script for concurrent and batched article categorization against a local fake OpenAI endpoint
+"""
+
+import sys
+import json
+import time
+import threading
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from fakes import FakeOpenAIHandler, serve, make_engine
+
+active = {"now": 0, "max": 0}
+active_lock = threading.Lock()
+batch_sizes = []
+
+
+def _theme(text):
+    return "IRRELEVANT" if "football" in text else "cyber" if "hack" in text else "Emerging Tech"
+
+
+class ThemeHandler(FakeOpenAIHandler):
+    """Answer chat completions with the theme named in the article title, counting requests in flight"""
+
+    def do_POST(self):
+        with active_lock:
+            active["now"] += 1
+            active["max"] = max(active["max"], active["now"])
+        try:
+            super().do_POST()
+        finally:
+            with active_lock:
+                active["now"] -= 1
+
+    def reply(self, messages):
+        system, prompt = [m["content"] for m in messages]
+
+        if "JSON array" in system:
+            # Drop "missing" articles and give "weird" ones an unknown theme
+            lines = prompt.splitlines()
+            batch_sizes.append(len(lines))
+            entries = [{"id": int(line[1:line.index("]")]),
+                        "theme": "Sports" if "weird" in line else _theme(line)}
+                       for line in lines if "missing" not in line]
+            return "```json\n" + json.dumps(entries) + "\n```"
+
+        # Later articles answer sooner, so completion order differs from article order
+        index = int(prompt.split()[1])
+        time.sleep(0.02 * (12 - index % 12))
+        return None if "broken" in prompt else _theme(prompt)
+
+
+def _articles(topics):
+    from inoreader_intelligence.api import Article
+
+    return [Article.from_api_response({"id": f"item-{n}", "title": f"Article {n} about {topic}"})
+            for n, topic in enumerate(topics)]
+
+
+def test_concurrent_categorization():
+    """Articles should be categorized in parallel, in order, with failures isolated"""
+    from inoreader_intelligence.metrics import run_metrics
+
+    with serve(ThemeHandler) as base_url:
+        engine = make_engine(base_url, enrichment_store=False, openai_max_concurrency=4)
+        articles = _articles(["hack", "quantum chip", "football", "broken", "drone", "hack"] * 4)
+
+        run_metrics.reset()
+        started = time.perf_counter()
+        categories = engine.categorize_articles(articles)
+        elapsed = time.perf_counter() - started
+
+        expected_cyber = [a for a in articles if "hack" in a.title]
+        expected_tech = [a for a in articles if "quantum" in a.title or "drone" in a.title]
+        assert categories == {"Cybersecurity Warfare": expected_cyber, "Emerging Tech": expected_tech}
+        print(f"✅ {len(articles)} articles categorized in article order in {elapsed:.2f}s")
+
+        assert active["max"] == 4
+        print(f"✅ At most {active['max']} completions in flight")
+
+        assert run_metrics.get("openai.categorize_failed") == 4
+        assert run_metrics.get("openai.requests") == 20
+        print("✅ Failed articles are skipped without affecting the rest")
+
+    return True
+
+
+def test_batched_categorization():
+    """Batches should be answered as JSON, with only unparsed articles retried individually"""
+    from inoreader_intelligence.metrics import run_metrics
+    from inoreader_intelligence.summarizer.engine import parse_batch_themes
+
+    assert parse_batch_themes('[{"id": 1, "theme": "cyber"}, {"id": "2", "theme": "IRRELEVANT"}]', 2) == \
+        {1: "Cybersecurity Warfare", 2: None}
+    assert parse_batch_themes('[{"id": 3, "theme": "Emerging Tech"}, {"id": 1, "theme": 5}]', 2) == {}
+    assert parse_batch_themes("Sorry, I can't help with that.", 2) == {}
+    print("✅ Batch replies are validated against article IDs and themes")
+
+    with serve(ThemeHandler) as base_url:
+        engine = make_engine(base_url, enrichment_store=False, openai_max_concurrency=2, categorize_batch_size=10)
+        articles = _articles(["hack", "quantum\nchip", "football", "missing hack", "weird drone"] * 5)
+
+        batch_sizes.clear()
+        run_metrics.reset()
+        categories = engine.categorize_articles(articles)
+
+        assert categories == {
+            "Cybersecurity Warfare": [a for a in articles if "hack" in a.title],
+            "Emerging Tech": [a for a in articles if "chip" in a.title or "drone" in a.title]
+        }
+        assert sorted(batch_sizes) == [5, 10, 10]
+        assert run_metrics.get("openai.categorize_batches") == 3
+        assert run_metrics.get("openai.categorize_fallbacks") == 10
+        assert run_metrics.get("openai.requests") == 13
+        print(f"✅ {len(articles)} articles categorized with {run_metrics.get('openai.requests')} requests, "
+              f"{run_metrics.get('openai.categorize_fallbacks')} retried individually")
+
+    return True
+
+
+def main():
+    """Main test function"""
+    print("🧪 Testing Concurrent Categorization")
+    print("=" * 50)
+
+    try:
+        success = test_concurrent_categorization() and test_batched_categorization()
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        success = False
+
+    print(f"\n{'🎉 Concurrent categorization tests passed!' if success else '❌ Concurrent categorization tests failed'}")
+    return success
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
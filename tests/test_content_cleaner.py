@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Test script for the HTML cleaning stage
+"""
+
+import os
+import sys
+from unittest import mock
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+
+def _make_cleaner(**overrides):
+    from inoreader_intelligence.config import Config
+    from inoreader_intelligence.cleaner import ContentCleaner
+
+    config = Config(inoreader_app_id="id", inoreader_app_key="key", email_recipients=[], **overrides)
+    return ContentCleaner(config)
+
+
+def test_html_to_text():
+    """Scripts, styles and comments should be dropped and blocks kept on separate lines"""
+    from inoreader_intelligence.cleaner import html_to_text
+
+    html = ("<div><h2>Title</h2><p>Hello &amp; <b>world</b>.</p><script>var x = 1;</script>"
+            "<style>p { color: red; }</style><!-- tracking --><ul><li>one</li><li>two</li></ul>tail</div>")
+    assert html_to_text(html) == "Title\nHello & world.\none\ntwo\ntail"
+    assert html_to_text("plain &amp;  text") == "plain & text"
+    assert html_to_text("") == ""
+    assert html_to_text("<p>" + "word " * 1000 + "</p>", max_input_chars=105) == "word " * 20 + "wo"
+    print("✅ HTML converted to text")
+    return True
+
+
+def test_strip_boilerplate():
+    """Navigation, share widgets, link lists and footers should be dropped, the body kept"""
+    from inoreader_intelligence.cleaner.extract import extract_text
+
+    body = "".join(f"<p>Paragraph {i} on maritime security, citing <a href='#'>a source</a>.</p>" for i in range(5))
+    html = (
+        "<article><nav><a href='/'>Home</a> <a href='/world'>World</a></nav>"
+        "<div class='share-tools'><a href='#'>Share</a> <a href='#'>Email</a></div>"
+        "<div id='cookie-consent'>We use cookies to improve your experience.</div>"
+        f"<h1>Headline</h1><div class='commentary'>{body}</div>"
+        "<section><h3>Related</h3><ul><li><a href='/a'>Another story</a></li>"
+        "<li><a href='/b'>Yet another story</a></li></ul></section>"
+        "<footer>Copyright Example News</footer></article>"
+    )
+
+    text, removed = extract_text(html, remove_boilerplate=True)
+    assert text.startswith("Headline\nParagraph 0")
+    assert text.endswith("Paragraph 4 on maritime security, citing a source.")
+    assert removed > 0
+    assert "cookies" in extract_text(html)[0]
+
+    # A page that is nothing but links is left alone rather than emptied
+    assert extract_text("<ul><li><a href='/a'>Only links</a></li></ul>", remove_boilerplate=True)[0] == "Only links"
+    print(f"✅ Removed {removed} characters of boilerplate")
+
+    # The blank STRIP_BOILERPLATE= line in .env.example keeps the default
+    from inoreader_intelligence.config import Config
+    with mock.patch.dict(os.environ, {"STRIP_BOILERPLATE": ""}):
+        assert Config.from_env().strip_boilerplate
+    print("✅ An empty STRIP_BOILERPLATE keeps boilerplate stripping on")
+    return True
+
+
+def test_clean_articles():
+    """Serial and process-pool cleaning should give the same text in the same order"""
+    from inoreader_intelligence.api import Article
+
+    def make_articles():
+        return [Article.from_api_response({
+            "id": str(i),
+            "content": {"content": f"<p>Body {i}</p><script>track({i})</script>"},
+            "summary": {"content": f"<b>Summary</b> {i}"} if i % 3 else {"content": ""}
+        }) for i in range(100)]
+
+    serial = _make_cleaner(cleaning_workers=1).clean_articles(make_articles())
+    parallel = _make_cleaner(cleaning_workers=2).clean_articles(make_articles())
+
+    assert [a.content for a in serial] == [f"Body {i}" for i in range(100)]
+    assert serial[1].summary == "Summary 1" and serial[0].summary == ""
+    assert [(a.id, a.content, a.summary) for a in parallel] == [(a.id, a.content, a.summary) for a in serial]
+    print(f"✅ Cleaned {len(parallel)} articles serially and in a process pool")
+    return True
+
+
+def main():
+    """Main test function"""
+    print("🧪 Testing Content Cleaner")
+    print("=" * 50)
+
+    try:
+        success = test_html_to_text() and test_strip_boilerplate() and test_clean_articles()
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        success = False
+
+    print(f"\n{'🎉 Content cleaner tests passed!' if success else '❌ Content cleaner tests failed'}")
+    return success
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Test script for collapsing near-duplicate stories with MinHash and LSH
+"""
+
+import os
+import sys
+from unittest import mock
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+WIRE_STORY = (
+    "Chinese and Philippine vessels collided near the Second Thomas Shoal on Monday, the coast guard said, "
+    "the latest in a series of confrontations in the disputed waters of the South China Sea that have raised "
+    "concerns about escalation between Beijing and Manila and its treaty ally Washington. Both governments "
+    "blamed each other for the incident and summoned diplomats in protest."
+)
+
+
+def make_article(article_id: str, feed_title: str, title: str, content: str):
+    from inoreader_intelligence.api import Article
+
+    return Article.from_api_response({
+        "id": article_id,
+        "title": title,
+        "content": {"content": content},
+        "origin": {"title": feed_title},
+        "alternate": [{"href": f"https://example.com/{article_id}"}],
+    })
+
+
+def test_near_duplicate_groups():
+    """Lightly edited copies should group together, different stories apart"""
+    from inoreader_intelligence.cleaner import dedupe
+
+    texts = [
+        WIRE_STORY,
+        "Quantum computing chips face new export controls announced by the commerce department on Tuesday.",
+        WIRE_STORY.replace("Monday", "Tuesday"),
+        WIRE_STORY + " Officials are expected to meet later this week.",
+        "Manila protests after Chinese and Philippine vessels collide near a disputed South China Sea shoal.",
+        "",
+    ]
+    assert dedupe.near_duplicate_groups(texts) == [[0, 2, 3], [1], [4], [5]]
+    print("✅ Wire copies group together; related but rewritten stories stay separate")
+
+    hasher = dedupe.MinHasher()
+    shingles = dedupe.shingles(WIRE_STORY)
+    original = dedupe.NUMPY_AVAILABLE
+    try:
+        dedupe.NUMPY_AVAILABLE = False
+        fallback = dedupe.MinHasher().signature(shingles)
+    finally:
+        dedupe.NUMPY_AVAILABLE = original
+    assert hasher.signature(shingles) == fallback
+    assert len(fallback) == dedupe.BANDS * dedupe.ROWS
+    print("✅ Signatures match with and without NumPy")
+
+    return True
+
+
+def test_deduplicator():
+    """One representative per story should remain, listing the other sources"""
+    from inoreader_intelligence.config import Config
+    from inoreader_intelligence.cleaner import Deduplicator
+    from inoreader_intelligence.metrics import run_metrics
+
+    config = Config(inoreader_app_id="id", inoreader_app_key="key", email_recipients=[])
+    articles = [
+        make_article("1", "Wire A", "Vessels collide near shoal", WIRE_STORY),
+        make_article("2", "Tech Daily", "New chip export controls",
+                      "Quantum computing chips face new export controls announced on Tuesday."),
+        make_article("3", "Wire B", "Vessels collide near shoal",
+                      WIRE_STORY + " Officials are expected to meet later this week."),
+        make_article("4", "Wire C", "Vessels collide near shoal", WIRE_STORY.replace("Monday", "Tuesday")),
+    ]
+
+    run_metrics.reset()
+    unique = Deduplicator(config).dedupe(articles)
+    assert [article.id for article in unique] == ["3", "2"]
+    assert [article.feed_title for article in unique[0].duplicates] == ["Wire A", "Wire C"]
+    assert unique[1].duplicates == ()
+    assert run_metrics.get("dedupe.articles") == 4
+    assert run_metrics.get("dedupe.clusters") == 1
+    assert run_metrics.get("dedupe.duplicates_removed") == 2
+    print("✅ The fullest copy represents the story and keeps the others as duplicates")
+
+    # Short items sharing a title are different stories, not copies
+    briefs = [
+        make_article("5", "Wire A", "Weekly roundup", ""),
+        make_article("6", "Wire B", "Weekly roundup", ""),
+        make_article("7", "Wire C", "Live updates", "Markets fall."),
+        make_article("8", "Wire D", "Live updates", "Markets rise."),
+    ]
+    assert [article.id for article in Deduplicator(config).dedupe(briefs)] == ["5", "6", "7", "8"]
+    print("✅ Different short stories with the same title are kept apart")
+
+    # The blank DEDUPE_ARTICLES= line in .env.example keeps the default
+    with mock.patch.dict(os.environ, {"DEDUPE_ARTICLES": ""}):
+        assert Config.from_env().dedupe_articles
+    print("✅ An empty DEDUPE_ARTICLES keeps deduplication on")
+
+    return True
+
+
+def main():
+    """Main test function"""
+    print("🧪 Testing Near-Duplicate Collapsing")
+    print("=" * 50)
+
+    try:
+        success = test_near_duplicate_groups() and test_deduplicator()
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        success = False
+
+    print(f"\n{'🎉 Dedupe tests passed!' if success else '❌ Dedupe tests failed'}")
+    return success
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
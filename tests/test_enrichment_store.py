@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Test script for the persistent enrichment store against a local fake OpenAI endpoint
+"""
+
+import os
+import sys
+import tempfile
+from unittest import mock
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from fakes import FakeOpenAIHandler, serve, make_engine as make_fake_engine
+
+
+class SummaryHandler(FakeOpenAIHandler):
+    """Answer categorization prompts with a theme and anything else with a summary"""
+
+    usage = (20, 5)
+
+    def reply(self, messages):
+        system, prompt = [m["content"] for m in messages]
+        if "Categorize" in system:
+            return "IRRELEVANT" if "football" in prompt else "Military Modernization"
+        return "Summary of " + prompt.splitlines()[0]
+
+
+def test_store():
+    """Stored values should be keyed by content hash, model and prompt version, and evicted"""
+    from inoreader_intelligence.summarizer.store import EnrichmentStore
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = EnrichmentStore(str(Path(tmp) / "enrichment.sqlite3"), max_entries=2, max_age_days=1)
+        store.put("item-1", "category", "hash-a", "gpt-4", "1", "Emerging Tech")
+        store.put("item-2", "category", "hash-b", "gpt-4", "1", None)
+
+        assert store.get("item-1", "category", "hash-a", "gpt-4", "1") == (True, "Emerging Tech")
+        assert store.get("item-2", "category", "hash-b", "gpt-4", "1") == (True, None)
+        assert store.get("item-1", "category", "hash-changed", "gpt-4", "1") == (False, None)
+        assert store.get("item-1", "category", "hash-a", "gpt-4o", "1") == (False, None)
+        assert store.get("item-1", "category", "hash-a", "gpt-4", "2") == (False, None)
+        assert store.get("item-1", "summary", "hash-a", "gpt-4", "1") == (False, None)
+        print("✅ Values only match the same content hash, model and prompt version")
+
+        for n in range(3, 6):
+            store.put(f"item-{n}", "category", "hash", "gpt-4", "1", "National Security")
+        # Make item-2 and item-4 the least recently used and item-5 expired
+        store._conn.execute("UPDATE enrichment SET accessed_at = accessed_at - 60 "
+                            "WHERE article_id IN ('item-2', 'item-4')")
+        store._conn.execute("UPDATE enrichment SET created_at = created_at - 2 * 86400 WHERE article_id = 'item-5'")
+        assert store.evict() == 3
+        assert len(store) == 2
+        assert store.get("item-1", "category", "hash-a", "gpt-4", "1")[0]
+        assert store.get("item-3", "category", "hash", "gpt-4", "1")[0]
+        print("✅ Expired rows and least recently used rows over the limit are evicted")
+        store.close()
+
+    # The blank limit keys in .env.example fall back to the defaults
+    from inoreader_intelligence.config import Config
+    with mock.patch.dict(os.environ, {"ENRICHMENT_STORE_MAX_ENTRIES": "", "ENRICHMENT_STORE_MAX_AGE_DAYS": ""}):
+        config = Config.from_env()
+    assert (config.enrichment_store_max_entries, config.enrichment_store_max_age_days) == (50000, 30)
+    print("✅ Empty store limits use the defaults")
+
+    return True
+
+
+def test_engine_reuses_store():
+    """A second run over unchanged articles should not call the API"""
+    from inoreader_intelligence.api import Article
+    from inoreader_intelligence.metrics import run_metrics
+
+    def make_articles(topics):
+        return [Article.from_api_response({"id": f"item-{n}", "title": f"Article {n} about {topic}",
+                                           "content": {"content": f"Report on {topic}."}})
+                for n, topic in enumerate(topics)]
+
+    with serve(SummaryHandler) as base_url, tempfile.TemporaryDirectory() as cache_dir:
+        def make_engine(**overrides):
+            return make_fake_engine(base_url, cache_dir=cache_dir, **overrides)
+
+        articles = make_articles(["naval drills", "football", "hypersonic tests"])
+
+        run_metrics.reset()
+        first = make_engine().categorize_articles(articles)
+        summaries = [make_engine().summarize_article(a) for a in articles]
+        assert run_metrics.get("openai.requests") == 6
+
+        run_metrics.reset()
+        engine = make_engine()
+        assert engine.categorize_articles(articles) == first
+        assert [engine.summarize_article(a) for a in articles] == summaries
+        assert run_metrics.get("openai.requests") == 0
+        assert run_metrics.get("enrichment.category_hits") == 3
+        assert run_metrics.get("enrichment.summary_hits") == 3
+        print("✅ Unchanged articles are categorized and summarized from the store")
+
+        run_metrics.reset()
+        changed = make_articles(["naval drills", "football", "carrier deployment"])
+        engine.categorize_articles(changed)
+        make_engine(openai_model="gpt-4o").categorize_articles(articles[:1])
+        make_engine(enrichment_store=False).categorize_articles(articles[:1])
+        assert run_metrics.get("openai.requests") == 3
+        print("✅ Edited articles, other models and a disabled store call the API again")
+
+    return True
+
+
+def main():
+    """Main test function"""
+    print("🧪 Testing Enrichment Store")
+    print("=" * 50)
+
+    try:
+        success = test_store() and test_engine_reuses_store()
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        success = False
+
+    print(f"\n{'🎉 Enrichment store tests passed!' if success else '❌ Enrichment store tests failed'}")
+    return success
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Test script for the full-text fetcher against a local stand-in site
+"""
+
+import sys
+import os
+import time
+import tempfile
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+page_requests = []
+request_starts = []
+active = {"now": 0, "max": 0}
+active_lock = threading.Lock()
+
+
+class SiteHandler(BaseHTTPRequestHandler):
+    """Serve article pages, a slow page and a non-HTML document"""
+
+    def do_GET(self):
+        with active_lock:
+            page_requests.append(self.path)
+            request_starts.append(time.monotonic())
+            active["now"] += 1
+            active["max"] = max(active["max"], active["now"])
+
+        try:
+            time.sleep(2 if self.path == "/slow" else 0.05)
+            if self.path == "/report.pdf":
+                body, content_type = b"%PDF-1.4", "application/pdf"
+            else:
+                body = (f"<html><head><title>t</title><script>track()</script></head><body>"
+                        f"<nav><a href='/'>Home</a></nav><p>Full story for {self.path}.</p></body></html>").encode()
+                content_type = "text/html; charset=utf-8"
+            self.send_response(200)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+        finally:
+            with active_lock:
+                active["now"] -= 1
+
+    def log_message(self, format, *args):
+        pass
+
+
+def _make_fetcher(cache_dir, **overrides):
+    from inoreader_intelligence.config import Config
+    from inoreader_intelligence.fulltext import FullTextFetcher
+
+    settings = dict(fulltext_per_host_concurrency=2, fulltext_host_delay=0.0, fulltext_time_budget=10.0)
+    settings.update(overrides)
+    config = Config(inoreader_app_id="id", inoreader_app_key="key", email_recipients=[],
+                    cache_dir=cache_dir, **settings)
+    return FullTextFetcher(config)
+
+
+def _article(url, content="<p>Short snippet…</p>"):
+    from inoreader_intelligence.api import Article
+
+    return Article.from_api_response({"id": url, "content": {"content": content}, "alternate": [{"href": url}]})
+
+
+def test_fulltext_fetcher():
+    """Snippets should be replaced by cached pages fetched politely and within the budget"""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), SiteHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_port}"
+
+    try:
+        with tempfile.TemporaryDirectory() as cache_dir:
+            articles = [_article(f"{base_url}/story/{n}") for n in range(6)]
+            articles.append(_article(f"{base_url}/report.pdf"))
+            articles.append(_article(f"{base_url}/long", content="<p>" + "word " * 200 + "</p>"))
+
+            assert _make_fetcher(cache_dir).enrich(articles) == 6
+            assert "Full story for /story/3." in articles[3].content
+            assert articles[6].content == "<p>Short snippet…</p>"
+            assert "/long" not in page_requests
+            assert articles[7]._text is None
+            assert active["max"] <= 2
+            print(f"✅ Enriched 6 snippet articles with at most {active['max']} requests per host")
+
+            page_requests.clear()
+            again = [_article(f"{base_url}/story/{n}") for n in range(6)]
+            assert _make_fetcher(cache_dir).enrich(again) == 6
+            assert page_requests == []
+            print("✅ Second run served pages from the on-disk cache")
+
+            page_requests.clear()
+            request_starts.clear()
+            spaced = [_article(f"{base_url}/spaced/{n}") for n in range(3)]
+            _make_fetcher(cache_dir, fulltext_host_delay=0.2).enrich(spaced)
+            gaps = [b - a for a, b in zip(request_starts, request_starts[1:])]
+            assert len(gaps) == 2 and min(gaps) >= 0.15
+            print("✅ Requests to one host were spaced by the politeness delay")
+
+            slow = _article(f"{base_url}/slow")
+            started = time.monotonic()
+            assert _make_fetcher(cache_dir, fulltext_time_budget=0.5).enrich([slow]) == 0
+            assert time.monotonic() - started < 1.5
+            assert slow.content == "<p>Short snippet…</p>"
+            print("✅ Time budget stopped the slow fetch")
+
+            # A failing cache write only loses that article
+            fetcher = _make_fetcher(cache_dir)
+            store = fetcher.cache.store
+            def store_or_fail(url, page):
+                if url.endswith("/broken"):
+                    raise OSError("disk full")
+                store(url, page)
+            fetcher.cache.store = store_or_fail
+            mixed = [_article(f"{base_url}/broken"), _article(f"{base_url}/fresh")]
+            assert fetcher.enrich(mixed) == 1
+            assert "Full story for /fresh." in mixed[1].content
+            print("✅ One article's failure did not abort the others")
+    finally:
+        server.shutdown()
+
+    return True
+
+
+def test_page_cache_eviction():
+    """Eviction should drop expired pages, then the least recently used ones"""
+    from inoreader_intelligence.fulltext import PageCache
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        cache = PageCache(cache_dir, max_bytes=10 ** 6, max_age_days=1)
+        page = os.urandom(3000).hex()
+        for n in range(4):
+            cache.store(f"https://example.com/{n}", page)
+            path = cache._path(f"https://example.com/{n}")
+            os.utime(path, (time.time() - 100 + n, time.time() - 100 + n))
+
+        expired = cache._path("https://example.com/0")
+        os.utime(expired, (time.time() - 2 * 86400, time.time() - 2 * 86400))
+        assert cache.get("https://example.com/1") == page  # now the most recently used
+
+        cache.max_bytes = expired.stat().st_size * 2
+        assert cache.evict() == 2
+        assert cache.get("https://example.com/0") is None
+        assert cache.get("https://example.com/2") is None
+        assert cache.get("https://example.com/1") == page and cache.get("https://example.com/3") == page
+        print("✅ Page cache evicted expired and least recently used pages")
+
+    return True
+
+
+def main():
+    """Main test function"""
+    print("🧪 Testing Full-Text Fetcher")
+    print("=" * 50)
+
+    try:
+        success = test_fulltext_fetcher() and test_page_cache_eviction()
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        success = False
+
+    print(f"\n{'🎉 Full-text fetcher tests passed!' if success else '❌ Full-text fetcher tests failed'}")
+    return success
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Test script for ID-first fetching (stream/items/ids + batched stream/items/contents)
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+from urllib.parse import urlparse, parse_qs
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from fakes import QuietHandler, serve, make_inoreader_client
+
+ITEM_NUMBERS = list(range(1, 8))
+contents_requests = []
+
+
+def _long_id(number):
+    return f"tag:google.com,2005:reader/item/{number:016x}"
+
+
+class ItemsHandler(QuietHandler):
+    """Serve item IDs and item contents for a single stream"""
+
+    def do_GET(self):
+        assert urlparse(self.path).path.endswith("stream/items/ids")
+        self.send_json({"items": [], "itemRefs": [{"id": str(n), "directStreamIds": []} for n in ITEM_NUMBERS]})
+
+    def do_POST(self):
+        assert urlparse(self.path).path.endswith("stream/items/contents")
+        requested = parse_qs(self.read_body().decode())["i"]
+        contents_requests.append(requested)
+        self.send_json({"items": [{"id": item_id, "title": item_id[-4:]} for item_id in requested]})
+
+
+def _make_client(base_url, cache_dir):
+    return make_inoreader_client(base_url, cache_dir, id_first_fetch=True, item_contents_batch_size=3)
+
+
+def test_id_first_fetch():
+    """Only unseen IDs should have their content downloaded, in batches"""
+    with serve(ItemsHandler) as base_url, tempfile.TemporaryDirectory() as cache_dir:
+        client = _make_client(base_url, cache_dir)
+        client.seen_items.record([_long_id(1), _long_id(2)])
+        client.commit_sync_state()
+
+        contents_requests.clear()
+        articles = client.get_unseen_stream_articles("user/-/label/Focus", count=100)
+        assert [a.id for a in articles] == [_long_id(n) for n in ITEM_NUMBERS[2:]]
+        assert [len(batch) for batch in contents_requests] == [3, 2]
+        print(f"✅ Fetched content for {len(articles)} unseen items in {len(contents_requests)} batches")
+
+        client.commit_sync_state()
+        contents_requests.clear()
+        assert _make_client(base_url, cache_dir).get_unseen_stream_articles("user/-/label/Focus") == []
+        assert contents_requests == []
+        print("✅ Re-run downloaded no content")
+
+        # Every ID already seen means nothing new, so callers must not fall back
+        client = _make_client(base_url, cache_dir)
+        client.find_focus_folder_id = lambda: "user/-/label/Focus"
+        assert client.get_focus_folder_articles() == [] and client.focus_caught_up
+        print("✅ A Focus fetch with every ID seen reports nothing new")
+
+    return True
+
+
+def main():
+    """Main test function"""
+    print("🧪 Testing ID-First Fetching")
+    print("=" * 50)
+
+    try:
+        success = test_id_first_fetch()
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        success = False
+
+    print(f"\n{'🎉 ID-first fetch tests passed!' if success else '❌ ID-first fetch tests failed'}")
+    return success
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Test script for incremental syncing with a persisted high-water mark
+"""
+
+import sys
+import time
+import tempfile
+from pathlib import Path
+from urllib.parse import urlparse, parse_qs
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from fakes import QuietHandler, serve, make_inoreader_client
+
+NOW_USEC = int(time.time()) * 1000000
+stream_items = []
+request_log = []
+
+
+class StreamHandler(QuietHandler):
+    """Serve stream items newer than the ot parameter"""
+
+    def do_GET(self):
+        query = parse_qs(urlparse(self.path).query)
+        ot = int(query.get("ot", ["0"])[0])
+        request_log.append(ot)
+
+        items = [item for item in stream_items if int(item["timestampUsec"]) // 1000000 >= ot]
+        self.send_json({"items": items})
+
+
+def _item(number, timestamp_usec):
+    return {"id": f"tag:google.com,2005:reader/item/{number}", "title": f"Article {number}",
+            "timestampUsec": str(timestamp_usec), "crawlTimeMsec": str(timestamp_usec // 1000)}
+
+
+def _make_client(base_url, cache_dir):
+    return make_inoreader_client(base_url, cache_dir, incremental_sync=True)
+
+
+def test_incremental_sync():
+    """A re-run should only return items newer than the committed mark"""
+    tag_id = "user/-/label/World"
+
+    with serve(StreamHandler) as base_url, tempfile.TemporaryDirectory() as cache_dir:
+        stream_items[:] = [_item(1, NOW_USEC - 2000000), _item(2, NOW_USEC)]
+
+        client = _make_client(base_url, cache_dir)
+        first_run = client.get_todays_articles([tag_id])
+        assert len(first_run) == 2
+
+        # Nothing committed yet, so a failed run would see the same items again
+        assert len(_make_client(base_url, cache_dir).get_todays_articles([tag_id])) == 2
+        client.commit_sync_state()
+        print("✅ First run fetched 2 articles and committed the high-water mark")
+
+        # Same-second item that was already reported is filtered out, a newer one is kept
+        stream_items.append(_item(3, NOW_USEC + 500))
+        client = _make_client(base_url, cache_dir)
+        second_run = client.get_todays_articles([tag_id])
+        assert [a.title for a in second_run] == ["Article 3"]
+        assert request_log[-1] == NOW_USEC // 1000000
+        print("✅ Re-run requested ot at the mark and only returned the new article")
+
+        # An empty Focus fetch means "nothing new", not "fall back to the reading list"
+        client.commit_sync_state()
+        client = _make_client(base_url, cache_dir)
+        client.find_focus_folder_id = lambda: tag_id
+        assert client.get_focus_folder_articles() == [] and client.focus_caught_up
+        assert client.get_focus_folder_articles(incremental=False) and not client.focus_caught_up
+        stream_items.clear()
+        assert client.get_focus_folder_articles(incremental=False) == [] and not client.focus_caught_up
+        client.find_focus_folder_id = lambda: None
+        assert client.get_focus_folder_articles() == [] and not client.focus_caught_up
+        print("✅ Focus fetches tell nothing new apart from an empty or missing folder")
+
+    return True
+
+
+def main():
+    """Main test function"""
+    print("🧪 Testing Incremental Sync")
+    print("=" * 50)
+
+    try:
+        success = test_incremental_sync()
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        success = False
+
+    print(f"\n{'🎉 Incremental sync tests passed!' if success else '❌ Incremental sync tests failed'}")
+    return success
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
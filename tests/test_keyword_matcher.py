@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Test script for the Aho-Corasick keyword matcher used without an API key
+"""
+
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+
+def test_keyword_matcher():
+    """Keywords should match whole words and phrases, with every label scored"""
+    from inoreader_intelligence.summarizer.keywords import KeywordMatcher, THEME_MATCHER
+
+    matcher = KeywordMatcher([("a b c", "X", 1.0), ("b c d", "Y", 2.0), ("c", "Z", 0.5)], expand_inflections=False)
+    assert matcher.scores("a b c d") == {"X": 1.0, "Y": 2.0, "Z": 0.5}
+    assert matcher.scores("a b, c d!") == {"X": 1.0, "Y": 2.0, "Z": 0.5}
+    assert matcher.scores("a b x c d") == {"Z": 0.5}
+    assert matcher.scores("abc cd c c") == {"Z": 1.0}
+    print("✅ Overlapping phrases are all found, and only across adjacent words")
+
+    assert THEME_MATCHER.scores("Said officials under rain, with aptitude and funding") == {}
+    assert THEME_MATCHER.scores("The UN met as AI rules and an APT group were discussed") == {
+        "Rules-Based Order": 1.0, "Emerging Tech": 1.0, "Cybersecurity Warfare": 0.5}
+    assert THEME_MATCHER.scores("Hackers hacked systems; drones sanctioned")["Cybersecurity Warfare"] == 2.0
+    assert THEME_MATCHER.scores("Zero-day in United Nations systems") == {
+        "Cybersecurity Warfare": 2.0, "Rules-Based Order": 2.0}
+    print("✅ Short keywords only match whole words, inflections and hyphenated phrases included")
+
+    # The old loop returned the first theme with any hit
+    assert THEME_MATCHER.best_label("Sanctions follow ransomware attack and malware breach") == "Cybersecurity Warfare"
+    assert THEME_MATCHER.best_label("Sanctions on Russia") == "Geopolitical Tensions"
+    assert THEME_MATCHER.best_label("New chip on sale") is None
+    print("✅ The best-scoring theme wins, and weak matches are left uncategorized")
+
+    return True
+
+
+def test_simple_categorization():
+    """The no-API-key path should use the matcher"""
+    from inoreader_intelligence.config import Config
+    from inoreader_intelligence.api import Article
+    from inoreader_intelligence.summarizer import SummarizationEngine
+
+    engine = SummarizationEngine(Config(inoreader_app_id="id", inoreader_app_key="key", email_recipients=[]))
+    articles = [Article.from_api_response({"id": str(n), "title": title, "summary": {"content": summary}})
+                for n, (title, summary) in enumerate([
+                    ("Under-the-radar funding round", "Startup said to raise again"),
+                    ("Navy tests hypersonic missile", "Sanctions expected"),
+                    ("Ransomware gang hits port", "Sanctions threatened"),
+                ])]
+    assert engine.categorize_articles(articles) == {
+        "Military Modernization": [articles[1]],
+        "Cybersecurity Warfare": [articles[2]],
+    }
+    print("✅ Offline categorization skips substring false positives")
+
+    return True
+
+
+def main():
+    """Main test function"""
+    print("🧪 Testing Keyword Matcher")
+    print("=" * 50)
+
+    try:
+        success = test_keyword_matcher() and test_simple_categorization()
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        success = False
+
+    print(f"\n{'🎉 Keyword matcher tests passed!' if success else '❌ Keyword matcher tests failed'}")
+    return success
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
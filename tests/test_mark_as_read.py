@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Test script for batched mark-as-read (edit-tag) and exclude-read fetching
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+from urllib.parse import urlparse, parse_qs
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from fakes import QuietHandler, serve, make_inoreader_client
+
+READ_STATE = "user/-/state/com.google/read"
+edit_requests = []
+stream_queries = []
+
+
+class EditTagHandler(QuietHandler):
+    """Record edit-tag bodies and stream/contents query strings"""
+
+    def do_GET(self):
+        stream_queries.append(parse_qs(urlparse(self.path).query))
+        self.send_json({"items": []})
+
+    def do_POST(self):
+        assert urlparse(self.path).path.endswith("edit-tag")
+        edit_requests.append(parse_qs(self.read_body().decode()))
+        self.send_body(b"OK", content_type="text/plain")
+
+
+def test_mark_as_read():
+    """Items should be marked read in batches, and read items excluded from fetches"""
+    from inoreader_intelligence.api import Article
+
+    with serve(EditTagHandler) as base_url, tempfile.TemporaryDirectory() as cache_dir:
+        client = make_inoreader_client(base_url, cache_dir, edit_tag_batch_size=4)
+        item_ids = [f"tag:google.com,2005:reader/item/{n:016x}" for n in range(10)]
+
+        edit_requests.clear()
+        assert client.mark_as_read(item_ids + item_ids[:3]) == 10
+        assert [len(body["i"]) for body in edit_requests] == [4, 4, 2]
+        assert all(body["a"] == [READ_STATE] for body in edit_requests)
+        assert [i for body in edit_requests for i in body["i"]] == item_ids
+        print(f"✅ Marked {len(item_ids)} items read in {len(edit_requests)} edit-tag requests")
+
+        edit_requests.clear()
+        articles = [Article.from_api_response({"id": item_id}) for item_id in item_ids]
+        client.mark_reported_as_read(articles)
+        assert edit_requests == []
+        print("✅ Reported articles left unread unless MARK_READ_AFTER_REPORT is set")
+
+        assert "scope=read&" in client.oauth.get_authorization_url()
+        assert "scope=read+write&" in make_inoreader_client(base_url, cache_dir, mark_read_after_report=True) \
+            .oauth.get_authorization_url()
+        print("✅ Write scope is only requested when MARK_READ_AFTER_REPORT is set")
+
+        stream_queries.clear()
+        client.get_articles_by_tag("user/-/label/Focus")
+        make_inoreader_client(base_url, cache_dir, exclude_read=True).get_articles_by_tag("user/-/label/Focus")
+        assert "xt" not in stream_queries[0]
+        assert stream_queries[1]["xt"] == [READ_STATE]
+        print("✅ Exclude-read fetches send xt=read")
+
+    return True
+
+
+def main():
+    """Main test function"""
+    print("🧪 Testing Mark As Read")
+    print("=" * 50)
+
+    try:
+        success = test_mark_as_read()
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        success = False
+
+    print(f"\n{'🎉 Mark as read tests passed!' if success else '❌ Mark as read tests failed'}")
+    return success
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
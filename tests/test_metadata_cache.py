@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Test script for the on-disk metadata cache
+Checks TTL hits, ETag revalidation and the memoized Focus folder ID, including a stale one
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from fakes import QuietHandler, serve, make_inoreader_client
+
+TAG_ETAG = '"tags-Focus"'
+focus = {"label": "Focus"}
+request_log = []
+
+
+class TagListHandler(QuietHandler):
+    """Serve tag/list with an ETag and honour If-None-Match, and the Focus stream under its current ID"""
+
+    def do_GET(self):
+        if "/stream/contents/" in self.path:
+            stream_id = self.path.split("/stream/contents/", 1)[1].split("?")[0]
+            if stream_id != f"user/1/label/{focus['label']}":
+                self.send_body(b"", status=404)
+                return
+            self.send_json({"items": [{"id": "tag:google.com,2005:reader/item/1", "title": "Story"}]})
+            return
+
+        etag = f'"tags-{focus["label"]}"'
+        request_log.append(self.headers.get("If-None-Match"))
+
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.end_headers()
+            return
+
+        self.send_json({"tags": [
+            {"id": "user/1/label/News"},
+            {"id": f"user/1/label/{focus['label']}"},
+        ]}, headers={"ETag": etag})
+
+
+def _make_client(base_url, cache_dir, ttl):
+    return make_inoreader_client(base_url, cache_dir, metadata_cache_ttl=ttl)
+
+
+def test_metadata_cache():
+    """Repeat runs should make zero metadata round trips"""
+    with serve(TagListHandler) as base_url, tempfile.TemporaryDirectory() as cache_dir:
+        request_log.clear()
+
+        client = _make_client(base_url, cache_dir, ttl=3600)
+        assert client.find_focus_folder_id() == "user/1/label/Focus"
+        assert len(request_log) == 1
+
+        # A new client (a later run) reads everything from disk
+        client = _make_client(base_url, cache_dir, ttl=3600)
+        assert client.find_focus_folder_id() == "user/1/label/Focus"
+        assert len(client.get_tag_list()) == 2
+        assert len(request_log) == 1
+        print("✅ Fresh cache served tag list and Focus ID without requests")
+
+        # Expired entries are revalidated with a conditional GET
+        client = _make_client(base_url, cache_dir, ttl=0)
+        assert len(client.get_tag_list()) == 2
+        assert request_log[-1] == TAG_ETAG
+        print("✅ Stale tag list revalidated with If-None-Match (304)")
+
+        # Renaming the folder makes the cached ID 404; it is resolved again and retried once
+        focus["label"] = "Focus-Renamed"
+        client = _make_client(base_url, cache_dir, ttl=3600)
+        articles = client.get_focus_folder_articles()
+        assert [article.title for article in articles] == ["Story"]
+        assert client.find_focus_folder_id() == "user/1/label/Focus-Renamed"
+        print("✅ A stale Focus folder ID is dropped and looked up again")
+
+    return True
+
+
+def main():
+    """Main test function"""
+    print("🧪 Testing Metadata Cache")
+    print("=" * 50)
+
+    try:
+        success = test_metadata_cache()
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        success = False
+
+    print(f"\n{'🎉 Metadata cache tests passed!' if success else '❌ Metadata cache tests failed'}")
+    return success
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
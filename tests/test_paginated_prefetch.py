@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Test script for the prefetching Focus folder paginator
+Serves paged stream/contents responses from a local stand-in server
+"""
+
+import sys
+import time
+from pathlib import Path
+from urllib.parse import urlparse, parse_qs
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from fakes import QuietHandler, serve, make_inoreader_client
+
+TOTAL_ITEMS = 250
+request_log = []
+
+
+class PagedStreamHandler(QuietHandler):
+    """Serve TOTAL_ITEMS articles in pages addressed by a numeric continuation"""
+
+    def do_GET(self):
+        query = parse_qs(urlparse(self.path).query)
+        start = int(query.get("c", ["0"])[0])
+        count = int(query["n"][0])
+        request_log.append((start, time.perf_counter()))
+        time.sleep(0.05)
+
+        end = min(start + count, TOTAL_ITEMS)
+        payload = {
+            "items": [{"id": f"tag:google.com,2005:reader/item/{i}", "title": f"Article {i}"}
+                      for i in range(start, end)],
+        }
+        if end < TOTAL_ITEMS:
+            payload["continuation"] = str(end)
+
+        self.send_json(payload)
+
+
+def test_prefetching_paginator():
+    """Next page should be requested before the current one is consumed"""
+    with serve(PagedStreamHandler) as base_url:
+        client = make_inoreader_client(base_url)
+
+        request_log.clear()
+        stream = client.iter_focus_articles_paginated("user/-/label/Focus", max_total_articles=220)
+        first = next(stream)
+        # Give the prefetch a moment, then check page 2 was requested before page 1 was drained
+        time.sleep(0.02)
+        assert len(request_log) == 2, request_log
+        print("✅ Page 2 requested while page 1 was still being consumed")
+
+        articles = [first] + list(stream)
+        print(f"✅ Paginated fetch returned {len(articles)} articles over {len(request_log)} requests")
+        assert len(articles) == 220
+        assert [a.title for a in articles] == [f"Article {i}" for i in range(220)]
+        assert [start for start, _ in request_log] == [0, 100, 200]
+
+        everything = client.get_all_focus_articles_paginated("user/-/label/Focus", max_total_articles=500)
+        assert len(everything) == TOTAL_ITEMS
+        print(f"✅ Stops at the end of the stream ({len(everything)} articles)")
+
+    return True
+
+
+def main():
+    """Main test function"""
+    print("🧪 Testing Prefetching Paginator")
+    print("=" * 50)
+
+    try:
+        success = test_prefetching_paginator()
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        success = False
+
+    print(f"\n{'🎉 Paginator tests passed!' if success else '❌ Paginator tests failed'}")
+    return success
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
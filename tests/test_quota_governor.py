@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Test script for the Inoreader quota governor
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from fakes import QuietHandler, serve, make_inoreader_client
+
+zone1_usage = {"value": 0}
+
+
+class QuotaHandler(QuietHandler):
+    """Report Zone 1 usage against a limit of 100 on every response"""
+
+    def do_GET(self):
+        zone1_usage["value"] += 1
+        if "tag/list" in self.path:
+            payload = {"tags": [{"id": "user/1/label/Focus"}]}
+        else:
+            payload = {"items": []}
+
+        self.send_json(payload, headers={"X-Reader-Zone1-Usage": str(zone1_usage["value"]),
+                                         "X-Reader-Zone1-Limit": "100"})
+
+
+def _make_client(base_url, cache_dir):
+    return make_inoreader_client(base_url, cache_dir, metadata_cache_ttl=0, quota_metadata_reserve=0.2)
+
+
+def test_quota_governor():
+    """Metadata calls are shed near the limit, content calls are not"""
+    from inoreader_intelligence.api.quota import QuotaExceededError
+
+    with serve(QuotaHandler) as base_url, tempfile.TemporaryDirectory() as cache_dir:
+        client = _make_client(base_url, cache_dir)
+        assert len(client.get_tag_list()) == 1
+        assert client.quota.status()[1]["limit"] == 100
+
+        # Another process has used most of today's budget
+        zone1_usage["value"] = 85
+        client.get_articles_by_tag("user/1/label/Focus")
+
+        requests_before = zone1_usage["value"]
+        fresh_client = _make_client(base_url, cache_dir)
+        assert fresh_client.quota.remaining(1) == 14
+        assert len(fresh_client.get_tag_list()) == 1
+        assert zone1_usage["value"] == requests_before
+        print("✅ Metadata request shed near the limit, stale cache served instead")
+
+        fresh_client.get_articles_by_tag("user/1/label/Focus")
+        assert zone1_usage["value"] == requests_before + 1
+        print("✅ Content request still allowed inside the reserve")
+
+        zone1_usage["value"] = 99
+        fresh_client.get_articles_by_tag("user/1/label/Focus")
+        try:
+            fresh_client.get_articles_by_tag("user/1/label/Focus")
+            raise AssertionError("Expected QuotaExceededError")
+        except QuotaExceededError as e:
+            print(f"✅ Exhausted quota refused: {e}")
+
+    return True
+
+
+def main():
+    """Main test function"""
+    print("🧪 Testing Quota Governor")
+    print("=" * 50)
+
+    try:
+        success = test_quota_governor()
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        success = False
+
+    print(f"\n{'🎉 Quota governor tests passed!' if success else '❌ Quota governor tests failed'}")
+    return success
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
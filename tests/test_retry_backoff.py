@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Test script for API retries, Retry-After handling and the circuit breaker
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from fakes import QuietHandler, serve, make_inoreader_client
+
+responses = []
+request_count = {"value": 0}
+
+
+class FlakyHandler(QuietHandler):
+    """Answer with the next queued status code, then 200"""
+
+    def do_GET(self):
+        request_count["value"] += 1
+        status = responses.pop(0) if responses else 200
+        headers = {"Retry-After": "0"} if status == 429 else None
+        self.send_json({"items": [{"id": "tag:google.com,2005:reader/item/1"}]}, status, headers)
+
+
+def _make_client(base_url, cache_dir):
+    return make_inoreader_client(base_url, cache_dir, api_max_retries=3, api_backoff_base=0.01,
+                                 circuit_breaker_threshold=4, circuit_breaker_reset=60)
+
+
+def test_retries_and_circuit_breaker():
+    """Transient errors are retried and counted; persistent ones open the circuit"""
+    import requests
+    from inoreader_intelligence.metrics import run_metrics
+    from inoreader_intelligence.api.retry import CircuitOpenError
+
+    try:
+        with serve(FlakyHandler) as base_url, tempfile.TemporaryDirectory() as cache_dir:
+            client = _make_client(base_url, cache_dir)
+            run_metrics.reset()
+
+            responses[:] = [503, 429]
+            articles = client.get_articles_by_tag("user/-/label/Focus")
+            assert len(articles) == 1
+            assert run_metrics.get("api.retries") == 2
+            print(f"✅ Recovered after {run_metrics.get('api.retries')} retries (503, 429 with Retry-After)")
+
+            responses[:] = [500] * 10
+            try:
+                client.get_articles_by_tag("user/-/label/Focus")
+                raise AssertionError("Expected HTTPError")
+            except requests.HTTPError:
+                pass
+            assert run_metrics.get("api.requests_failed") == 1
+            print("✅ Gave up after the retry limit and raised instead of returning partial data")
+
+            before = request_count["value"]
+            try:
+                client.get_articles_by_tag("user/-/label/Focus")
+                raise AssertionError("Expected CircuitOpenError")
+            except CircuitOpenError as e:
+                print(f"✅ Circuit breaker failing fast: {e}")
+            assert request_count["value"] == before
+    finally:
+        responses.clear()
+
+    return True
+
+
+def main():
+    """Main test function"""
+    print("🧪 Testing Retry and Circuit Breaker")
+    print("=" * 50)
+
+    try:
+        success = test_retries_and_circuit_breaker()
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        success = False
+
+    print(f"\n{'🎉 Retry tests passed!' if success else '❌ Retry tests failed'}")
+    return success
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Test script for the JSON serialization module
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+
+def test_serialization():
+    """Round-trip bytes and files through both backends"""
+    from inoreader_intelligence import serialization
+
+    obj = {"items": [{"id": "tag:google.com,2005:reader/item/1", "title": "Café — überblick"}],
+           "continuation": None}
+    backends = [serialization.ORJSON_AVAILABLE, False] if serialization.ORJSON_AVAILABLE else [False]
+
+    original = serialization.ORJSON_AVAILABLE
+    try:
+        for use_orjson in backends:
+            serialization.ORJSON_AVAILABLE = use_orjson
+            name = "orjson" if use_orjson else "stdlib"
+
+            encoded = serialization.dumps(obj)
+            assert isinstance(encoded, bytes)
+            assert "Café".encode() in encoded
+            assert serialization.loads(encoded) == obj
+            assert serialization.loads(memoryview(encoded)) == obj
+            assert serialization.loads(serialization.dumps({1: "a"})) == {"1": "a"}
+
+            with tempfile.TemporaryDirectory() as tmp:
+                path = Path(tmp) / "nested" / "state.json"
+                serialization.write_json(path, obj, indent=True)
+                assert serialization.read_json(path) == obj
+                assert not path.with_suffix(".json.tmp").exists()
+
+                path.write_bytes(b"{not json")
+                try:
+                    serialization.read_json(path)
+                    raise AssertionError("corrupt file should not decode")
+                except serialization.JSONDecodeError:
+                    pass
+            print(f"✅ {name} backend round-trips bytes and files")
+    finally:
+        serialization.ORJSON_AVAILABLE = original
+
+    return True
+
+
+def main():
+    """Main test function"""
+    print("🧪 Testing Serialization")
+    print("=" * 50)
+
+    try:
+        success = test_serialization()
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        success = False
+
+    print(f"\n{'🎉 Serialization tests passed!' if success else '❌ Serialization tests failed'}")
+    return success
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Test script for incremental decoding of stream/contents responses
+"""
+
+import sys
+import json
+import tracemalloc
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+
+def _chunked(data, size):
+    for start in range(0, len(data), size):
+        yield data[start:start + size]
+
+
+def _page(item_count, content_size=200):
+    return {
+        "direction": "ltr",
+        "updated": 1700000000,
+        "items": [
+            {"id": f"tag:google.com,2005:reader/item/{i:016x}", "title": f"Ünïcödé title {i} — 東京",
+             "published": 1700000000 + i, "content": {"content": "<p>" + "x" * content_size + "</p>"}}
+            for i in range(item_count)
+        ],
+        "continuation": "next-page-token",
+        "count": 12345,
+    }
+
+
+def test_chunk_boundaries():
+    """Items and trailing fields should decode identically for any chunk size"""
+    from inoreader_intelligence.api.streaming import StreamingItemsDecoder
+
+    page = _page(5)
+    body = json.dumps(page, ensure_ascii=False, indent=1).encode("utf-8")
+
+    for chunk_size in (1, 3, 7, 64, len(body)):
+        decoder = StreamingItemsDecoder(_chunked(body, chunk_size))
+        items = list(decoder)
+        assert items == page["items"], chunk_size
+        assert decoder.continuation == "next-page-token"
+        assert decoder.fields["count"] == 12345
+        assert decoder.fields["updated"] == 1700000000
+
+    print("✅ Decoded items and trailing fields at every chunk size")
+
+    # Numbers split inside a fraction or exponent must not be cut short
+    numbers = {"items": [-2.5e10, 1.5, 3E-2, 42], "count": 6.02e+23}
+    body = json.dumps(numbers).encode("utf-8")
+    for chunk_size in (1, 2, 4, 7):
+        decoder = StreamingItemsDecoder(_chunked(body, chunk_size))
+        assert list(decoder) == numbers["items"], chunk_size
+        assert decoder.fields["count"] == numbers["count"]
+    print("✅ Floats and exponents split across chunks decoded whole")
+    return True
+
+
+def test_articles_and_memory():
+    """Decoding into Articles one at a time should not hold the whole body"""
+    from inoreader_intelligence.api.models import Article
+    from inoreader_intelligence.api.streaming import StreamingItemsDecoder
+
+    body = json.dumps(_page(2000, content_size=2000)).encode("utf-8")
+
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    decoder = StreamingItemsDecoder(_chunked(body, 64 * 1024), item_factory=Article.from_api_response)
+    count = 0
+    for article in decoder:
+        assert isinstance(article, Article)
+        count += 1
+    peak = tracemalloc.get_traced_memory()[1] - baseline
+    tracemalloc.stop()
+
+    print(f"✅ Streamed {count} articles from a {len(body) / 1e6:.1f} MB body with {peak / 1e6:.2f} MB peak")
+    assert count == 2000
+    assert peak < len(body) / 4
+    return True
+
+
+def main():
+    """Main test function"""
+    print("🧪 Testing Streaming JSON Decoding")
+    print("=" * 50)
+
+    try:
+        success = test_chunk_boundaries() and test_articles_and_memory()
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        success = False
+
+    print(f"\n{'🎉 Streaming decode tests passed!' if success else '❌ Streaming decode tests failed'}")
+    return success
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
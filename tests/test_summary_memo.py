@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Test script for the per-run summary memo shared by theme summaries and the report
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from fakes import FakeOpenAIHandler, serve, make_engine as make_fake_engine
+
+requests = []
+
+
+class NumberedReplyHandler(FakeOpenAIHandler):
+    """Answer every chat completion with a numbered reply, and reject articles marked broken"""
+
+    def reply(self, messages):
+        requests.append(messages)
+        if "Broken" in messages[-1]["content"]:
+            return None
+        return f"Reply {len(requests)}"
+
+
+def test_summary_memo():
+    """Each article should be summarized once per run, with the saved calls counted"""
+    from inoreader_intelligence.api import Article
+    from inoreader_intelligence.metrics import run_metrics
+
+    with serve(NumberedReplyHandler) as base_url, tempfile.TemporaryDirectory() as cache_dir:
+        def make_engine(**overrides):
+            return make_fake_engine(base_url, cache_dir=cache_dir, **overrides)
+
+        articles = [Article.from_api_response({"id": f"item-{n}", "title": f"Article {n}",
+                                               "content": {"content": f"Naval drills, day {n}."}})
+                    for n in range(3)]
+
+        engine = make_engine(enrichment_store=False)
+        run_metrics.reset()
+        engine.generate_theme_summary("Military Modernization", articles)
+        assert len(requests) == 4
+
+        # The report loop asks again for every article without a feed summary
+        summaries = [engine.summarize_article(article) for article in articles]
+        assert summaries == ["Reply 1", "Reply 2", "Reply 3"]
+        assert len(requests) == 4
+        assert run_metrics.get("openai.summary_calls_saved") == 3
+        print(f"✅ {len(articles)} articles summarized once for both stages, "
+              f"{run_metrics.get('openai.summary_calls_saved')} calls saved")
+
+        engine.start_run()
+        engine.summarize_article(articles[0])
+        assert len(requests) == 5
+        print("✅ A new run starts with an empty memo")
+
+        requests.clear()
+        run_metrics.reset()
+        broken = Article.from_api_response({"id": "item-broken", "title": "Broken article",
+                                            "content": {"content": "Naval drills, day 9."}})
+        assert engine.summarize_article(broken) == engine.summarize_article(broken) == "Naval drills, day 9."
+        assert len(requests) == 2
+        assert run_metrics.get("openai.summary_calls_saved") == 0
+        print("✅ Failed summaries are not memoized and are retried")
+
+        requests.clear()
+        engine = make_engine()
+        engine.summarize_article(articles[0])
+        engine.store.close()
+        engine = make_engine()
+        run_metrics.reset()
+        assert engine.summarize_article(articles[0]) == engine.summarize_article(articles[0]) == "Reply 1"
+        assert len(requests) == 1
+        assert run_metrics.get("enrichment.summary_hits") == 1
+        assert run_metrics.get("enrichment.summary_memo_hits") == 1
+        assert run_metrics.get("openai.summary_calls_saved") == 0
+        engine.store.close()
+        print("✅ Summaries persist across runs in the enrichment store")
+
+    return True
+
+
+def main():
+    """Main test function"""
+    print("🧪 Testing Summary Memo")
+    print("=" * 50)
+
+    try:
+        success = test_summary_memo()
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        success = False
+
+    print(f"\n{'🎉 Summary memo tests passed!' if success else '❌ Summary memo tests failed'}")
+    return success
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
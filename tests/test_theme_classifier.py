@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Test script for the local TF-IDF theme classifier and the categorization cascade
+"""
+
+import sys
+import random
+import tempfile
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from fakes import FakeOpenAIHandler, serve, make_engine as make_fake_engine
+
+VOCABULARY = {
+    "Cybersecurity Warfare": ["ransomware", "malware", "breach", "hackers", "zero-day", "phishing", "botnet"],
+    "Military Modernization": ["fighter", "hypersonic", "navy", "frigate", "missile", "procurement", "doctrine"],
+    "Emerging Tech": ["quantum", "semiconductor", "chip", "artificial intelligence", "satellite", "robotics"],
+    None: ["football", "celebrity", "recipe", "league", "concert", "fashion", "goal"],
+}
+FILLER = ["report", "officials", "week", "new", "plans", "country", "according", "analysts", "latest"]
+prompts = []
+
+
+def _corpus(count, seed):
+    rng = random.Random(seed)
+    rows = []
+    for n in range(count):
+        theme = list(VOCABULARY)[n % len(VOCABULARY)]
+        words = rng.sample(VOCABULARY[theme], 3) + rng.sample(FILLER, 5)
+        rng.shuffle(words)
+        rows.append((f"item-{seed}-{n}", " ".join(words), theme))
+    return rows
+
+
+class ForesightHandler(FakeOpenAIHandler):
+    """Categorize everything as Strategic Foresight and record the prompts"""
+
+    usage = (20, 2)
+
+    def reply(self, messages):
+        prompts.append(messages[-1]["content"])
+        return "Strategic Foresight"
+
+
+def test_classifier():
+    """The classifier should learn LLM labels, report holdout accuracy and round-trip to disk"""
+    from inoreader_intelligence.summarizer.classifier import NUMPY_AVAILABLE
+    if not NUMPY_AVAILABLE:
+        print("⚠️  NumPy not installed, skipping")
+        return True
+
+    from inoreader_intelligence.summarizer.classifier import ThemeClassifier, train_from_examples
+
+    classifier, report = train_from_examples(_corpus(400, 1), holdout=0.25, threshold=0.8)
+    assert report["examples"] == 400 and report["train"] + report["holdout"] == 400
+    assert 60 < report["holdout"] < 140
+    assert report["accuracy"] > 0.95
+    assert report["labels"]["IRRELEVANT"] == 100
+    print(f"✅ Holdout accuracy {report['accuracy']:.1%}, {report['confident_share']:.1%} confident")
+
+    test_rows = _corpus(100, 2)
+    predictions = classifier.predict([text for _, text, _ in test_rows])
+    assert sum(theme == label for (theme, _), (_, _, label) in zip(predictions, test_rows)) >= 95
+    assert classifier.predict(["zzz qqq"]) == [(None, 0.0)]
+    assert classifier.predict([]) == []
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = str(Path(tmp) / "model.npz")
+        classifier.save(path)
+        assert ThemeClassifier.load(path).predict([text for _, text, _ in test_rows]) == predictions
+    print("✅ Predictions match after saving and loading the model")
+
+    try:
+        train_from_examples([("item-1", "football league", None)] * 3)
+        raise AssertionError("a single theme should not train")
+    except ValueError:
+        pass
+
+    return True
+
+
+def test_cascade():
+    """Confident local predictions should skip OpenAI, the rest should be sent and recorded"""
+    from inoreader_intelligence.summarizer.classifier import NUMPY_AVAILABLE
+    if not NUMPY_AVAILABLE:
+        print("⚠️  NumPy not installed, skipping")
+        return True
+
+    from inoreader_intelligence.api import Article
+    from inoreader_intelligence.metrics import run_metrics
+    from inoreader_intelligence.summarizer import EnrichmentStore
+    from inoreader_intelligence.summarizer.classifier import ThemeClassifier, MODEL_FILENAME
+
+    with serve(ForesightHandler) as base_url, tempfile.TemporaryDirectory() as cache_dir:
+        rows = _corpus(400, 3)
+        ThemeClassifier.train([text for _, text, _ in rows], [label or "IRRELEVANT" for _, _, label in rows]) \
+            .save(str(Path(cache_dir) / MODEL_FILENAME))
+
+        def make_engine(**overrides):
+            settings = {"openai_api_key": None, "cache_dir": cache_dir, "local_classifier": True}
+            settings.update(overrides)
+            return make_fake_engine(base_url, **settings)
+
+        articles = [Article.from_api_response({"id": f"article-{n}", "title": title}) for n, title in enumerate([
+            "ransomware breach hits hospital network",
+            "navy commissions new frigate and missile systems",
+            "league final ends with late goal",
+            "officials discuss plans for the region",
+        ])]
+
+        prompts.clear()
+        run_metrics.reset()
+        categories = make_engine(openai_api_key="sk-test").categorize_articles(articles)
+        assert categories == {
+            "Cybersecurity Warfare": [articles[0]],
+            "Military Modernization": [articles[1]],
+            "Strategic Foresight": [articles[3]],
+        }
+        assert prompts == [articles[3].title + " "]
+        assert run_metrics.get("classifier.accepted") == 3
+        assert run_metrics.get("classifier.deferred") == 1
+        print("✅ Confident articles categorized locally, one ambiguous article sent to OpenAI")
+
+        store = EnrichmentStore(str(Path(cache_dir) / "enrichment.sqlite3"))
+        assert store.category_examples() == [("article-3", articles[3].title + " ", "Strategic Foresight")]
+        store.close()
+        print("✅ OpenAI categorizations are recorded as training examples")
+
+        prompts.clear()
+        categories = make_engine().categorize_articles(articles)
+        assert prompts == []
+        assert set(categories) <= {"Cybersecurity Warfare", "Military Modernization", "Emerging Tech"}
+        assert categories["Cybersecurity Warfare"] == [articles[0]]
+        print("✅ Without an API key every article is categorized locally")
+
+        # Articles with no terms the classifier knows fall back to keywords instead of being dropped
+        unknown = Article.from_api_response({"id": "article-4", "title": "Sanctions on Russia widen"})
+        categories = make_engine().categorize_articles([unknown])
+        assert categories == {"Geopolitical Tensions": [unknown]}
+        print("✅ Articles the classifier knows nothing about are themed by keywords")
+
+    return True
+
+
+def main():
+    """Main test function"""
+    print("🧪 Testing Theme Classifier")
+    print("=" * 50)
+
+    try:
+        success = test_classifier() and test_cascade()
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        success = False
+
+    print(f"\n{'🎉 Theme classifier tests passed!' if success else '❌ Theme classifier tests failed'}")
+    return success
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
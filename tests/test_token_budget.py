@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Test script for token counting, prompt packing and per-run token budgets
+"""
+
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from fakes import FakeOpenAIHandler, serve, make_engine as make_fake_engine
+
+requests = []
+
+
+class FixedSummaryHandler(FakeOpenAIHandler):
+    """Answer every chat completion with a fixed summary and usage"""
+
+    def reply(self, messages):
+        requests.append(messages)
+        return "A short summary."
+
+
+def test_counting_and_packing():
+    """Text should be cut by tokens, and packed prompts should cover as many articles as fit"""
+    from inoreader_intelligence.summarizer import tokens
+
+    original = tokens.TIKTOKEN_AVAILABLE
+    tokens.TIKTOKEN_AVAILABLE = False
+    tokens._encoding.cache_clear()
+    try:
+        counter = tokens.TokenCounter("gpt-4o-mini")
+        assert counter.count("a" * 10) == 3
+        assert counter.truncate("short", 2) == "short"
+        assert counter.truncate("x" * 100, 10) == "x" * 37 + "..."
+        assert counter.truncate("x" * 100, 10, suffix="") == "x" * 40
+        print("✅ Tokens are estimated from characters without tiktoken")
+
+        texts = ["a" * 40, "b" * 400, "c" * 40, "d" * 4000]
+        packed = tokens.pack(texts, 200, counter, min_tokens=20)
+        assert packed[0] == texts[0] and packed[2] == texts[2]
+        assert counter.count(packed[1]) == counter.count(packed[3]) == (200 - 4 - 20) // 2
+        assert len(tokens.pack(texts, 60, counter, min_tokens=20)) == 2
+        assert tokens.pack(texts, 10000, counter) == texts
+        print("✅ Short texts are kept whole, long ones trimmed evenly, and the last dropped when needed")
+    finally:
+        tokens.TIKTOKEN_AVAILABLE = original
+        tokens._encoding.cache_clear()
+
+    budget = tokens.TokenBudget("gpt-4o-mini-2024-07-18", max_cost=0.001)
+    assert budget.prices == tokens.MODEL_PRICES["gpt-4o-mini"]
+    assert budget.reserve(2000, 1000)
+    budget.settle((2000, 1000), (1000, 100))
+    assert abs(budget.cost - 0.00021) < 1e-9
+    assert budget.reserve(1000, 1000)
+    assert not budget.reserve(2000, 1000)
+    assert tokens.TokenBudget("local-model", max_cost=0.001).reserve(10 ** 9, 0)
+    print("✅ Cost ceilings use the model's prices and actual usage")
+
+    return True
+
+
+def test_run_budget():
+    """Requests past the run budget should fall back without calling the API"""
+    from inoreader_intelligence.api import Article
+    from inoreader_intelligence.metrics import run_metrics
+    from inoreader_intelligence.summarizer.engine import SUMMARY_COMPLETION_TOKENS
+
+    with serve(FixedSummaryHandler) as base_url:
+        def make_engine(**overrides):
+            return make_fake_engine(base_url, enrichment_store=False, **overrides)
+
+        articles = [Article.from_api_response({"id": f"item-{n}", "title": f"Article {n}",
+                                               "content": {"content": "Naval drills resumed. " * 400}})
+                    for n in range(5)]
+
+        engine = make_engine()
+        projection = engine.project_spend(articles)
+        assert requests == []
+        assert projection["categorize"]["requests"] == 5
+        assert projection["summarize"]["requests"] == 5
+        assert projection["summarize"]["completion_tokens"] == 5 * SUMMARY_COMPLETION_TOKENS
+        assert projection["theme summaries"]["requests"] == 5
+        print(f"✅ Dry run projects {sum(t['requests'] for t in projection.values())} requests "
+              f"costing at most ${sum(t['cost'] for t in projection.values()):.4f} without calling the API")
+
+        content = engine.tokens.truncate(articles[0].content, engine.config.article_max_tokens)
+        reserved = engine.tokens.count_messages(engine._summary_messages(articles[0], content)) \
+            + SUMMARY_COMPLETION_TOKENS
+        assert engine.tokens.count(content) <= engine.config.article_max_tokens
+
+        # Room for the first reservation plus the actual usage of two more requests
+        engine = make_engine(run_max_tokens=reserved + 2 * 150)
+        run_metrics.reset()
+        summaries = [engine.summarize_article(article) for article in articles]
+        assert summaries[:3] == ["A short summary."] * 3
+        assert summaries[3] != "A short summary." and summaries[3].startswith("Naval drills resumed.")
+        assert len(requests) == 3
+        assert run_metrics.get("budget.refused") == 2
+        print(f"✅ {len(requests)} requests fit the run budget; the rest fell back to truncated text")
+
+        # Categorization past the budget falls back to keywords instead of dropping articles
+        requests.clear()
+        themed = [Article.from_api_response({"id": f"theme-{n}", "title": title})
+                  for n, title in enumerate(["Navy tests hypersonic missile", "Ransomware gang hits port",
+                                             "Sanctions on Russia widen", "Quantum chip breakthrough"] * 2)]
+        for batch_size in (1, 4):
+            engine = make_engine(run_max_tokens=1, categorize_batch_size=batch_size)
+            categories = engine.categorize_articles(themed)
+            assert sorted(article.id for articles in categories.values() for article in articles) == \
+                sorted(article.id for article in themed)
+        assert requests == []
+        print("✅ Budget-refused articles are still categorized locally")
+
+        engine = make_engine(theme_prompt_max_tokens=300)
+        engine.generate_theme_summary("Military Modernization", articles)
+        theme_prompt = requests[-1][1]["content"]
+        assert engine.tokens.count(theme_prompt) <= 300
+        assert theme_prompt.count("• Article") == 5
+        print("✅ Theme prompts are packed into their token budget")
+
+    return True
+
+
+def main():
+    """Main test function"""
+    print("🧪 Testing Token Budgets")
+    print("=" * 50)
+
+    try:
+        success = test_counting_and_packing() and test_run_budget()
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        success = False
+
+    print(f"\n{'🎉 Token budget tests passed!' if success else '❌ Token budget tests failed'}")
+    return success
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)